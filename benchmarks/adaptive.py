@@ -0,0 +1,146 @@
+"""
+Adaptive sampling of 2-D landscapes on a quadtree.
+
+``adaptive_sample`` starts from a coarse grid of cells and, one level at a time,
+splits the cells whose corner and centre values vary the most, or whose centre
+is below every corner (a suspected local minimum), into four children. All new
+points of a level are evaluated in one batched call. Points live on an integer
+lattice fine enough for the deepest level, so corners shared by neighbouring
+cells are evaluated once.
+"""
+
+from typing import NamedTuple
+import numpy as np
+
+# Offsets of the four corners and the centre of a cell, in half cell sizes.
+_CORNERS = np.array([[0, 0], [2, 0], [0, 2], [2, 2], [1, 1]])
+
+
+class AdaptiveSamples(NamedTuple):
+    """
+    Result of ``adaptive_sample``.
+
+    ``points`` and ``values`` can be rendered with
+    ``plt.tricontourf(points[:, 0], points[:, 1], values)``; ``cells`` holds
+    the (x_low, y_low, x_high, y_high) box of every leaf and ``depth`` its
+    refinement level.
+    """
+
+    points: np.ndarray
+    values: np.ndarray
+    cells: np.ndarray
+    depth: np.ndarray
+
+
+def adaptive_sample(
+    func,
+    bounds=None,
+    initial: int = 16,
+    max_depth: int = 6,
+    max_points: int = 10_000,
+    tol: float = 0.01,
+    low_fraction: float = 0.02,
+) -> AdaptiveSamples:
+    """
+    Sample a 2-D function densely where it varies and sparsely where it is flat.
+
+    Cells are refined while their variation (spread of the five samples) is
+    above ``tol`` times the spread of every value seen so far, or while they
+    look like they hold a minimum: their centre is below all their corners, or
+    their lowest sample is among the lowest ``low_fraction`` of all cells. When
+    the budget does not cover every candidate, suspected minima go first, then
+    the cells with the largest variation.
+
+    Parameters:
+        func (callable): A BenchmarkFunction or any function accepting a batch of
+            shape (m, 2) and returning m values.
+        bounds (np.ndarray, optional): Array of shape (2, 2) with [lower, upper]
+            per axis (default: ``func.bounds``).
+        initial (int): Cells per axis of the starting grid.
+        max_depth (int): Maximum number of refinements of a starting cell.
+        max_points (int): Evaluation budget; the starting grid is always
+            evaluated.
+        tol (float): Relative variation above which a cell is refined.
+        low_fraction (float): Fraction, between 0 and 1, of the cells with the
+            lowest samples that are refined as suspected minima; 0 flags only
+            the cell holding the lowest sample, 1 flags every cell with some
+            variation.
+
+    Returns:
+        AdaptiveSamples: Sampled points and values and the leaf cells.
+
+    Raises:
+        ValueError: If ``bounds`` is not (2, 2), ``initial`` or ``max_depth``
+            is out of range or ``low_fraction`` is not in [0, 1].
+    """
+    bounds = np.asarray(func.bounds if bounds is None else bounds, dtype=float)
+    if bounds.shape != (2, 2):
+        raise ValueError(f"Expected bounds of shape (2, 2), got {bounds.shape}.")
+    if initial < 1 or max_depth < 0:
+        raise ValueError("initial must be positive and max_depth non-negative.")
+    if not 0 <= low_fraction <= 1:
+        raise ValueError(f"low_fraction must be in [0, 1], got {low_fraction}.")
+    evaluate = getattr(func, "evaluate_batch", func)
+    lower, span = bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+
+    # Lattice of (side + 1)^2 points; a cell of depth d spans 2^(max_depth - d + 1).
+    side = initial * 2 ** (max_depth + 1)
+    size = side // initial
+    ij = np.stack(np.meshgrid(np.arange(initial), np.arange(initial)), -1)
+    origins = ij.reshape(-1, 2) * size
+    depth = np.zeros(len(origins), dtype=int)
+    keys = np.empty(0, dtype=np.int64)
+    values = np.empty(0)
+
+    while True:
+        half = (size >> depth)[:, None, None] // 2
+        lattice = origins[:, None, :] + _CORNERS * half  # (cells, 5, 2)
+        cell_keys = lattice[..., 0] * (side + 1) + lattice[..., 1]
+        new = np.setdiff1d(cell_keys, keys)
+        if len(new):
+            points = lower + np.stack(divmod(new, side + 1), -1) / side * span
+            new_values = np.asarray(evaluate(points), dtype=float).reshape(len(new))
+            keys = np.concatenate([keys, new])
+            values = np.concatenate([values, new_values])
+            order = np.argsort(keys)
+            keys, values = keys[order], values[order]
+
+        samples = values[np.searchsorted(keys, cell_keys)]
+        finite = values[np.isfinite(values)]
+        spread = np.ptp(finite) if len(finite) else 0.0
+        with np.errstate(invalid="ignore"):
+            variation = np.ptp(samples, axis=1)
+            variation = np.where(np.isnan(variation), np.inf, variation)
+            lowest = samples.min(axis=1)
+            minimum = (samples[:, 4] < samples[:, :4].min(axis=1)) | (
+                lowest <= np.nanquantile(lowest, low_fraction)
+            )
+        candidates = np.flatnonzero(
+            (depth < max_depth)
+            & ((variation > tol * spread) | (minimum & (variation > 0)))
+        )
+
+        # A refined cell adds at most 5 corners and 4 centres.
+        budget = (max_points - len(keys)) // 9
+        if not len(candidates) or budget < 1:
+            break
+        # Suspected minima first, then by decreasing variation.
+        priority = np.lexsort((-variation[candidates], ~minimum[candidates]))
+        refined = candidates[priority]
+        refined = refined[:budget]
+
+        child_size = (size >> (depth[refined] + 1))[:, None]
+        children = (
+            origins[refined][:, None, :]
+            + _CORNERS[None, :4] // 2 * child_size[..., None]
+        ).reshape(-1, 2)
+        keep = np.ones(len(origins), dtype=bool)
+        keep[refined] = False
+        origins = np.concatenate([origins[keep], children])
+        depth = np.concatenate([depth[keep], np.repeat(depth[refined] + 1, 4)])
+
+    points = lower + np.stack(divmod(keys, side + 1), -1) / side * span
+    cell_size = (size >> depth)[:, None]
+    corners = np.hstack([origins, origins + cell_size]) / side
+    cells = np.tile(lower, 2) + corners * np.tile(span, 2)
+    return AdaptiveSamples(points, values, cells, depth)
@@ -0,0 +1,111 @@
+import numpy as np
+
+
+class StopEvaluation(Exception):
+    """Raised by BudgetedFunction to abort the optimizer that is calling it."""
+
+
+class BudgetExhausted(StopEvaluation):
+    """The evaluation budget has been spent."""
+
+
+class TargetReached(StopEvaluation):
+    """An evaluated point reached the target value within tolerance."""
+
+
+class BudgetedFunction:
+    """
+    Objective wrapper enforcing an evaluation budget and stop-on-target.
+
+    Every evaluated point counts towards ``max_evals``; a batch counts one
+    evaluation per row and is cut at the remaining budget. The best point seen is
+    tracked so an aborted run still has a result, and the evaluation count at
+    which the target was first reached is recorded in ``evals_to_target``.
+
+    Parameters:
+        func (callable): Objective, typically a BenchmarkFunction. Its
+            ``evaluate_batch`` is used for batches when available.
+        max_evals (int, optional): Evaluation budget; unlimited if None.
+        target (float, optional): Known optimum value.
+        tol (float): Absolute and relative tolerance for reaching ``target``,
+            as in ``np.isclose``.
+        stop_on_target (bool): Raise TargetReached as soon as the target is hit.
+    """
+
+    def __init__(
+        self,
+        func,
+        max_evals: int = None,
+        target: float = None,
+        tol: float = 1e-6,
+        stop_on_target: bool = False,
+    ):
+        self.func = func
+        self.max_evals = max_evals
+        self.target = target
+        self.tol = tol
+        self.stop_on_target = stop_on_target
+        self.nfev = 0
+        self.best_value = np.inf
+        self.best_x = None
+        self.evals_to_target = None
+
+    @property
+    def remaining(self) -> float:
+        """Evaluations left in the budget (inf if unlimited)."""
+        return np.inf if self.max_evals is None else self.max_evals - self.nfev
+
+    def _threshold(self):
+        return self.target + self.tol + self.tol * abs(self.target)
+
+    def _observe(self, X, values):
+        values = np.asarray(values, dtype=float).reshape(-1)
+        best = int(np.argmin(values))
+        if values[best] < self.best_value:
+            self.best_value = float(values[best])
+            self.best_x = np.array(X[best], dtype=float)
+        if self.target is not None and self.evals_to_target is None:
+            hits = np.flatnonzero(values <= self._threshold())
+            if hits.size:
+                self.evals_to_target = self.nfev + int(hits[0]) + 1
+        self.nfev += len(values)
+
+    def _check_target(self):
+        if self.stop_on_target and self.evals_to_target is not None:
+            raise TargetReached(f"Target reached after {self.evals_to_target} evals.")
+
+    def __call__(self, x, *args):
+        if self.remaining <= 0:
+            raise BudgetExhausted(f"Budget of {self.max_evals} evaluations spent.")
+        value = self.func(x, *args)
+        self._observe([x], [value])
+        self._check_target()
+        return value
+
+    def evaluate_batch(self, X):
+        """
+        Evaluate a batch of points within the remaining budget.
+
+        Parameters:
+            X (np.ndarray): Array of shape (m, n), one point per row.
+
+        Returns:
+            np.ndarray: Function values of shape (m,).
+
+        Raises:
+            BudgetExhausted: If the budget does not cover the whole batch; the
+                rows that fit are evaluated and accounted for first.
+            TargetReached: If stopping on target and a row reached it.
+        """
+        X = np.asarray(X, dtype=float)
+        if self.remaining <= 0:
+            raise BudgetExhausted(f"Budget of {self.max_evals} evaluations spent.")
+        truncated = len(X) > self.remaining
+        if truncated:
+            X = X[: int(self.remaining)]
+        values = np.asarray(getattr(self.func, "evaluate_batch", self.func)(X))
+        self._observe(X, values)
+        self._check_target()
+        if truncated:
+            raise BudgetExhausted(f"Budget of {self.max_evals} evaluations spent.")
+        return values
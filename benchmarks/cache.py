@@ -0,0 +1,75 @@
+from collections import OrderedDict, namedtuple
+import numpy as np
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize", "nbytes"])
+
+
+class EvaluationCache:
+    """
+    Bounded LRU memo of function values keyed on the shape and bytes of the input.
+
+    Parameters:
+        maxsize (int): Maximum number of stored points; the least recently used
+            entry is evicted beyond it.
+        decimals (int, optional): If given, points are rounded to this many
+            decimals before hashing so near-identical points share an entry.
+    """
+
+    def __init__(self, maxsize: int = 1024, decimals: int = None):
+        if maxsize < 1:
+            raise ValueError(f"Cache size must be positive, got {maxsize}.")
+        self.maxsize = maxsize
+        self.decimals = decimals
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+
+    def key(self, x) -> tuple:
+        """
+        Cache key of a point: its shape and the bytes of its (optionally rounded)
+        float64 values, so a point and a one-row batch of it are kept apart.
+        """
+        x = np.asarray(x, dtype=float)
+        if self.decimals is not None:
+            # Adding 0.0 folds -0.0 into 0.0 so both round to the same key.
+            x = np.round(x, self.decimals) + 0.0
+        return x.shape, x.tobytes()
+
+    def get(self, key: tuple, default=None):
+        """Return the value stored for ``key`` and mark it as recently used."""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: tuple, value):
+        """Store ``value`` under ``key``, evicting the least recently used entry."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self._entries[key] = value
+            return
+        self._entries[key] = value
+        self.nbytes += _entry_nbytes(key, value)
+        if len(self._entries) > self.maxsize:
+            old_key, old_value = self._entries.popitem(last=False)
+            self.nbytes -= _entry_nbytes(old_key, old_value)
+
+    def info(self) -> CacheInfo:
+        """Hit/miss counters, capacity, current size and bytes of stored data."""
+        return CacheInfo(
+            self.hits, self.misses, self.maxsize, len(self._entries), self.nbytes
+        )
+
+    def clear(self):
+        """Drop every entry and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = self.nbytes = 0
+
+
+def _entry_nbytes(key: tuple, value) -> int:
+    return len(key[1]) + np.asarray(value).nbytes
@@ -1,76 +1,118 @@
 import numpy as np
+from benchmarks.registry import Scaling, register, register_inplace
 
 
+@register(bounds=[[-5.12, 5.12]] * 2, optimum=0.0, modality="unimodal")
 def beale(x: np.ndarray) -> float:
     """
     Beale function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     t1 = (1.5 - x1 + x1 * x2) ** 2
     t2 = (2.25 - x1 + x1 * x2**2) ** 2
     t3 = (2.625 - x1 + x1 * x2**3) ** 2
     return t1 + t2 + t3
 
 
+@register(bounds=[[-5.12, 5.12]] * 2, optimum=0.0, modality="unimodal")
 def booth(x: np.ndarray) -> float:
     """
     Booth function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     return (x1 + 2 * x2 - 7) ** 2 + (2 * x1 + x2 - 5) ** 2
 
 
+@register(bounds=[[-10, 10]] * 2, optimum=0.0, modality="unimodal")
 def matyas(x: np.ndarray) -> float:
     """
     Matyas function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     return 0.26 * (x1**2 + x2**2) - 0.48 * x1 * x2
 
 
+@register(
+    bounds=[[-2.12, 2.12], [-3, -1]],
+    optimum=0.0,
+    modality="unimodal",
+    scaling=Scaling((-2.048, 2.048), x_opt=1.0, f_opt=0.0, min_dim=2),
+)
 def rosenbrock(x: np.ndarray) -> float:
     """
     Rosenbrock function for optimization.
 
     Args:
-        x (array-like): Input vector.
+        x (array-like): Input vector of shape (n,) or batch of shape (..., n).
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    n = len(x)
-    result = 0
-    for i in range(n - 1):
-        result += 100 * (x[i + 1] - x[i] ** 2) ** 2 + (1 - x[i]) ** 2
-    return result
-
-
+    x = np.asarray(x)
+    head, tail = x[..., :-1], x[..., 1:]
+    return np.sum(100 * (tail - head**2) ** 2 + (1 - head) ** 2, axis=-1)
+
+
+@register_inplace(rosenbrock)
+def rosenbrock_into(X, out, work):
+    """In-place batch Rosenbrock (see ``register_inplace``)."""
+    head, tail = X[:, :-1], X[:, 1:]
+    t = work.array("t", head.shape, head.dtype)
+    u = work.array("u", head.shape, head.dtype)
+    np.square(head, out=t)
+    np.subtract(tail, t, out=t)
+    np.square(t, out=t)
+    t *= 100
+    np.subtract(1, head, out=u)
+    np.square(u, out=u)
+    t += u
+    return np.sum(t, axis=-1, out=out)
+
+
+@register(
+    bounds=[[-5.12, 5.12]] * 2,
+    optimum=0.0,
+    modality="unimodal",
+    scaling=Scaling((-5.12, 5.12), x_opt=0.0, f_opt=0.0),
+)
 def sphere(x: np.ndarray) -> float:
     """
     Sphere function for optimization.
 
     Args:
-        x (array-like): Input vector.
+        x (array-like): Input vector of shape (n,) or batch of shape (..., n).
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    return sum(xi**2 for xi in x)
+    x = np.asarray(x)
+    return np.sum(x**2, axis=-1)
+
+
+@register_inplace(sphere)
+def sphere_into(X, out, work):
+    """In-place batch Sphere (see ``register_inplace``)."""
+    t = work.array("t", X.shape, X.dtype)
+    np.square(X, out=t)
+    return np.sum(t, axis=-1, out=out)
@@ -1,103 +1,281 @@
+import time
+from functools import lru_cache
 import numpy as np
-from benchmarks import classical as cla
-from benchmarks import geometric as geo
-from benchmarks import multimodal as mlt
-from benchmarks import nonlinear as nln
-
-_FUNCTIONS = {
-    "beale": cla.beale,
-    "booth": cla.booth,
-    "matyas": cla.matyas,
-    "rosenbrock": cla.rosenbrock,
-    "sphere": cla.sphere,
-    "ackley": mlt.ackley,
-    "easom": mlt.easom,
-    "eggholder": mlt.eggholder,
-    "rastrigin": mlt.rastrigin,
-    "schaffer_n2": mlt.schaffer_n2,
-    "schaffer_n4": mlt.schaffer_n4,
-    "styblinski_tang": mlt.styblinski_tang,
-    "three_hump_camel": mlt.three_hump_camel,
-    "mishra_bird_constrained": nln.mishra_bird_constrained,
-    "rosenbrock_constrained": nln.rosenbrock_constrained,
-    "rosenbrock_constrained_disk": nln.rosenbrock_constrained_disk,
-    "simionescu": nln.simionescu,
-    "townsend_modified": nln.townsend_modified,
-    "bukin": geo.bukin,
-    "cross_in_tray": geo.cross_in_tray,
-    "goldstein_price": geo.goldstein_price,
-    "holder_table": geo.holder_table,
-    "levi": geo.levi,
-}
-
-_BOUNDS = {
-    "beale": np.array([[-5.12, 5.12]] * 2),
-    "booth": np.array([[-5.12, 5.12]] * 2),
-    "matyas": np.array([[-10, 10]] * 2),
-    "rosenbrock": np.array([[-2.12, 2.12], [-3, -1]]),
-    "sphere": np.array([[-5.12, 5.12]] * 2),
-    "ackley": np.array([[-32.768, 32.768]] * 2),
-    "easom": np.array([[-10, 10]] * 2),
-    "eggholder": np.array([[-512, 512]] * 2),
-    "rastrigin": np.array([[-5.12, 5.12]] * 2),
-    "schaffer_n2": np.array([[-100, 100]] * 2),
-    "schaffer_n4": np.array([[-100, 100]] * 2),
-    "styblinski_tang": np.array([[-5, 5]] * 2),
-    "three_hump_camel": np.array([[-5, 5]] * 2),
-    "mishra_bird_constrained": np.array([[-10, 0], [-6.5, 0]]),
-    "rosenbrock_constrained": np.array([[-1.5, 1.5], [-0.5, 2.5]]),
-    "rosenbrock_constrained_disk": np.array([[-2, 2], [-2, 2]]),
-    "simionescu": np.array([[-2, 2], [-2, 2]]),
-    "townsend_modified": np.array([[-10, 10], [-10, 10]]),
-    "bukin": np.array([[-15, -5], [-3, 3]]),
-    "cross_in_tray": np.array([[-10, 10]] * 2),
-    "goldstein_price": np.array([[-5.12, 5.12]] * 2),
-    "holder_table": np.array([[-10, 10]] * 2),
-    "levi": np.array([[-10, 10]] * 2),
-}
-
-_RESULTS = {
-    "beale": 0.0,
-    "booth": 0.0,
-    "matyas": 0.0,
-    "rosenbrock": 0.0,  # Para 2D é 0
-    "sphere": 0.0,
-    "ackley": 0.0,
-    "easom": -1.0,
-    "eggholder": -959.6407,
-    "rastrigin": 0.0,
-    "schaffer_n2": 0.0,
-    "schaffer_n4": 0.292579,
-    "styblinski_tang": -78.332,  # para 2D
-    "three_hump_camel": 0.0,
-    "mishra_bird_constrained": -106.7645367,
-    "rosenbrock_constrained": 0.0,
-    "rosenbrock_constrained_disk": 0.0,
-    "simionescu": 0.0,
-    "townsend_modified": 2.0052938,
-    "bukin": 0.0,
-    "cross_in_tray": -2.06261,
-    "goldstein_price": 3.0,
-    "holder_table": -19.2085,
-    "levi": 0.0,
-}
+from benchmarks import registry
+from benchmarks.cache import EvaluationCache
+from benchmarks.instrumentation import EvaluationStats
+from benchmarks.workspace import Workspace
+
+
+@lru_cache(maxsize=None)
+def _derivatives(name: str):
+    from benchmarks import gradients
+
+    return gradients.derivatives(name)
+
+
+def _dimension_entry(record: registry.FunctionRecord, dim: int):
+    """
+    Build the bounds, optimum value and optimum location of a function.
+
+    Parameters:
+        record (FunctionRecord): Registered function.
+        dim (int): Number of dimensions.
+
+    Returns:
+        tuple: (bounds of shape (dim, 2), optimum value, optimum location of
+        shape (dim,) or None when it is not tabulated or lies outside the
+        bounds).
+
+    Raises:
+        ValueError: If the function is not defined for ``dim`` dimensions.
+    """
+    if isinstance(dim, bool) or not isinstance(dim, (int, np.integer)):
+        raise ValueError(f"Dimension must be an integer, got {dim!r}.")
+
+    name, spec = record.name, record.scaling
+    if spec is None and dim != record.dim:
+        raise ValueError(
+            f"Function '{name}' is only defined for {record.dim} dimensions, "
+            f"got dim={dim}."
+        )
+    if spec is not None and dim < spec.min_dim:
+        raise ValueError(
+            f"Function '{name}' requires at least {spec.min_dim} dimensions, "
+            f"got dim={dim}."
+        )
+
+    x_opt = None if spec is None else np.full(dim, spec.x_opt)
+    if dim == record.dim:
+        # The registered box may exclude the scaled optimum (as for rosenbrock).
+        bounds = record.bounds
+        if x_opt is not None and not np.all(
+            (bounds[:, 0] <= x_opt) & (x_opt <= bounds[:, 1])
+        ):
+            x_opt = None
+        return bounds, record.optimum, x_opt
+    return np.array([spec.interval] * dim), spec.f_opt * dim, x_opt
 
 
 class BenchmarkFunction:
-    def __init__(self, name: str):
-        if name not in _FUNCTIONS or name not in _BOUNDS:
-            raise ValueError(f"Function '{name}' not found in registry.")
+    """
+    Registered benchmark function with its bounds and known optimum.
+
+    Parameters:
+        name (str): Registered function name.
+        dim (int, optional): Number of dimensions; defaults to the registered one.
+        cache_size (int, optional): If given, single-point calls are memoized in
+            an LRU cache of this many points (see ``cache_info``).
+        cache_decimals (int, optional): Round points to this many decimals
+            before looking them up in the cache.
+        record_stats (bool): If True, every evaluation is counted and timed in
+            ``stats`` (an EvaluationStats).
+        dtype (data-type): Floating-point type of batch evaluations (float64 or
+            float32). float32 halves the memory traffic of large batches; see
+            ``benchmarks.precision`` for the functions where it is unsafe.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dim: int = None,
+        cache_size: int = None,
+        cache_decimals: int = None,
+        record_stats: bool = False,
+        dtype=np.float64,
+    ):
+        try:
+            self.record = registry.get(name)
+        except KeyError:
+            raise ValueError(f"Function '{name}' not found in registry.") from None
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError(f"dtype must be float32 or float64, got {self.dtype}.")
         self.name = name
-        self.func = _FUNCTIONS[name]
-        self.bounds = _BOUNDS[name]
+        self.func = self.record.func
+        self.dim = self.record.dim if dim is None else dim
+        self.bounds, self.optimum, self.x_opt = _dimension_entry(self.record, self.dim)
+        self.cache = (
+            None
+            if cache_size is None
+            else EvaluationCache(cache_size, decimals=cache_decimals)
+        )
+        self.stats = EvaluationStats() if record_stats else None
+        self.workspace = Workspace()
+
+    def _check_dim(self, x):
+        if np.shape(x)[-1:] != (self.dim,):
+            raise ValueError(
+                f"Function '{self.name}' expects a point of dimension {self.dim}, "
+                f"got shape {np.shape(x)}."
+            )
 
     def __call__(self, x):
-        return self.func(x)
+        self._check_dim(x)
+        if self.stats is None:
+            return self._evaluate(x)
+
+        start = time.perf_counter_ns()
+        value = self._evaluate(x)
+        self.stats.record(1, time.perf_counter_ns() - start)
+        return value
+
+    def _evaluate(self, x):
+        if self.cache is None:
+            return self.func(x)
+
+        key = self.cache.key(x)
+        value = self.cache.get(key)
+        if value is None:
+            value = self.func(x)
+            self.cache.put(key, value)
+        return value
+
+    def cache_info(self):
+        """
+        Statistics of the evaluation cache.
+
+        Returns:
+            CacheInfo or None: (hits, misses, maxsize, currsize, nbytes), or None
+            when caching is disabled.
+        """
+        return None if self.cache is None else self.cache.info()
+
+    def grad(self, x):
+        """
+        Analytic gradient, usable as ``scipy.optimize.minimize(f, x0, jac=f.grad)``.
+
+        Parameters:
+            x (np.ndarray): Point of shape (n,) or batch of shape (m, n).
+
+        Returns:
+            np.ndarray: Gradient(s) with the shape of ``x``.
+        """
+        self._check_dim(x)
+        return _derivatives(self.name)[0](x)
+
+    def hvp(self, x, v):
+        """
+        Hessian-vector product, usable as ``minimize(..., hessp=f.hvp)``.
+
+        Parameters:
+            x (np.ndarray): Point of shape (n,) or batch of shape (m, n).
+            v (np.ndarray): Vector(s) broadcastable to the shape of ``x``.
+
+        Returns:
+            np.ndarray: H(x) @ v with the shape of ``x``.
+        """
+        self._check_dim(x)
+        return _derivatives(self.name)[1](x, v)
+
+    @property
+    def constrained(self) -> bool:
+        return self.record.constrained
+
+    def _as_batch(self, X):
+        X = np.asarray(X, dtype=self.dtype)
+        if X.ndim != 2 or X.shape[1] != self.dim:
+            raise ValueError(
+                f"Expected a batch of shape (m, {self.dim}), got array of shape "
+                f"{X.shape}."
+            )
+        return X
+
+    def _check_out(self, out, m: int):
+        if (
+            not isinstance(out, np.ndarray)
+            or out.shape != (m,)
+            or out.dtype != self.dtype
+        ):
+            raise ValueError(
+                f"Expected out of shape ({m},) and dtype {self.dtype}, got "
+                f"{getattr(out, 'shape', None)} {getattr(out, 'dtype', type(out))}."
+            )
+
+    def evaluate_batch(self, X, out=None):
+        """
+        Evaluate the function on a batch of points in a single vectorized call.
+
+        For constrained functions the objective is only computed on feasible
+        rows; infeasible rows get the penalty value. Functions with an in-place
+        kernel keep their temporaries in ``workspace``, so with ``out`` given,
+        repeated batches of the same size allocate no new arrays; the others
+        compute the values and copy them into ``out``.
+
+        Parameters:
+            X (np.ndarray): Array of shape (m, n), one point per row.
+            out (np.ndarray, optional): Array of shape (m,) and type ``dtype``
+                to write the values to.
+
+        Returns:
+            np.ndarray: Function values of shape (m,) and type ``dtype``
+            (``out`` if given).
+        """
+        X = self._as_batch(X)
+        if out is not None:
+            self._check_out(out, len(X))
+        if self.stats is None:
+            return self._evaluate_batch(X, out)
+
+        start = time.perf_counter_ns()
+        values = self._evaluate_batch(X, out)
+        self.stats.record(len(X), time.perf_counter_ns() - start)
+        return values
+
+    def _evaluate_batch(self, X, out=None):
+        if not self.constrained:
+            if self.record.inplace is not None:
+                out = np.empty(len(X), dtype=self.dtype) if out is None else out
+                return self.record.inplace(X, out, self.workspace)
+            values = self.func(X)
+        else:
+            objective = self.record.objective
+            feasible = self.is_feasible(X)
+            if feasible.all():
+                values = objective(X)
+            else:
+                values = np.full(len(X), registry.PENALTY, dtype=self.dtype)
+                values[feasible] = objective(X[feasible])
+
+        if out is None:
+            return np.asarray(values, dtype=self.dtype)
+        out[...] = values
+        return out
+
+    def constraint_violation(self, X):
+        """
+        Constraint violations of a batch of points.
+
+        Parameters:
+            X (np.ndarray): Array of shape (m, n), one point per row.
+
+        Returns:
+            np.ndarray: Array of shape (m, k) with max(g_i(x), 0) for each of the
+            k inequality constraints g_i(x) <= 0 (k = 0 if unconstrained).
+        """
+        X = self._as_batch(X)
+        if not self.constrained:
+            return np.zeros((len(X), 0))
+        return np.maximum(self.record.constraints(X), 0)
+
+    def is_feasible(self, X):
+        """
+        Feasibility mask of a batch of points.
+
+        Parameters:
+            X (np.ndarray): Array of shape (m, n), one point per row.
+
+        Returns:
+            np.ndarray: Boolean array of shape (m,), True where every constraint
+            is satisfied.
+        """
+        return ~np.any(self.constraint_violation(X) > 0, axis=1)
 
     def __repr__(self):
-        return f"<BenchmarkFunction name={self.name}>"
+        return f"<BenchmarkFunction name={self.name} dim={self.dim} dtype={self.dtype}>"
 
 
-FUNCTIONS = _FUNCTIONS
-BOUNDS = _BOUNDS
-RESULTS = _RESULTS
+# Lazy {name: value} views of the registry.
+FUNCTIONS = registry.RegistryView("func")
+BOUNDS = registry.RegistryView("bounds")
+RESULTS = registry.RegistryView("optimum")
@@ -1,31 +1,36 @@
 import numpy as np
+from benchmarks.registry import register, register_inplace
 
 
+@register(bounds=[[-15, -5], [-3, 3]], optimum=0.0, modality="multimodal")
 def bukin(x: np.ndarray) -> float:
     """
     Bukin N.6 function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value at (x, y).
+        float or np.ndarray: Function value(s) at (x, y).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     return 100 * np.sqrt(np.abs(x2 - 0.01 * x1**2)) + 0.01 * np.abs(x1 + 10)
 
 
+@register(bounds=[[-10, 10]] * 2, optimum=-2.06261, modality="multimodal")
 def cross_in_tray(x: np.ndarray) -> float:
     """
     Cross-in-Tray function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value at (x, y).
+        float or np.ndarray: Function value(s) at (x, y).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     scaled_x = x1 / 100.0
     scaled_y = x2 / 100.0
 
@@ -38,17 +43,19 @@ def cross_in_tray(x: np.ndarray) -> float:
     )
 
 
+@register(bounds=[[-5.12, 5.12]] * 2, optimum=3.0, modality="multimodal")
 def goldstein_price(x: np.ndarray) -> float:
     """
     Goldstein-Price function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value at (x, y).
+        float or np.ndarray: Function value(s) at (x, y).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     term1 = 1 + (x1 + x2 + 1) ** 2 * (
         19 - 14 * x1 + 3 * x1**2 - 14 * x2 + 6 * x1 * x2 + 3 * x2**2
     )
@@ -58,37 +65,122 @@ def goldstein_price(x: np.ndarray) -> float:
     return term1 * term2
 
 
+@register_inplace(goldstein_price)
+def goldstein_price_into(X, out, work):
+    """In-place batch Goldstein-Price (see ``register_inplace``)."""
+    x1, x2 = X[:, 0], X[:, 1]
+    p = work.array("p", out.shape, out.dtype)
+    t = work.array("t", out.shape, out.dtype)
+    q = work.array("q", out.shape, out.dtype)
+
+    # term1 = 1 + (x1 + x2 + 1)^2 * (19 - 14 x1 + 3 x1^2 - 14 x2 + 6 x1 x2 + 3 x2^2)
+    np.multiply(x1, 14, out=p)
+    np.subtract(19, p, out=p)
+    np.square(x1, out=t)
+    t *= 3
+    p += t
+    np.multiply(x2, 14, out=t)
+    p -= t
+    np.multiply(x1, 6, out=t)
+    t *= x2
+    p += t
+    np.square(x2, out=t)
+    t *= 3
+    p += t
+    np.add(x1, x2, out=t)
+    t += 1
+    np.square(t, out=t)
+    t *= p
+    t += 1
+
+    # term2 = 30 + (2 x1 - 3 x2)^2 * (18 - 32 x1 + 12 x1^2 + 48 x2 - 36 x1 x2 + 27 x2^2)
+    np.multiply(x1, 32, out=p)
+    np.subtract(18, p, out=p)
+    np.square(x1, out=q)
+    q *= 12
+    p += q
+    np.multiply(x2, 48, out=q)
+    p += q
+    np.multiply(x1, 36, out=q)
+    q *= x2
+    p -= q
+    np.square(x2, out=q)
+    q *= 27
+    p += q
+    np.multiply(x1, 2, out=out)
+    np.multiply(x2, 3, out=q)
+    out -= q
+    np.square(out, out=out)
+    out *= p
+    out += 30
+
+    out *= t
+    return out
+
+
+@register(bounds=[[-10, 10]] * 2, optimum=-19.2085, modality="multimodal")
 def holder_table(x: np.ndarray) -> float:
     """
     Hölder Table function for optimization.
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value at (x, y).
+        float or np.ndarray: Function value(s) at (x, y).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     term = np.abs(
         np.sin(x1) * np.cos(x2) * np.exp(np.abs(1 - np.sqrt(x1**2 + x2**2) / np.pi))
     )
     return -term
 
 
+@register(bounds=[[-10, 10]] * 2, optimum=0.0, modality="multimodal")
 def levi(x: np.ndarray) -> float:
     """
     Lévi N.13 function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value at (x, y).
+        float or np.ndarray: Function value(s) at (x, y).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     return (
         np.sin(3 * np.pi * x1) ** 2
         + (x1 - 1) ** 2 * (1 + np.sin(3 * np.pi * x2) ** 2)
         + (x2 - 1) ** 2 * (1 + np.sin(2 * np.pi * x2) ** 2)
     )
+
+
+@register_inplace(levi)
+def levi_into(X, out, work):
+    """In-place batch Lévi N.13 (see ``register_inplace``)."""
+    x1, x2 = X[:, 0], X[:, 1]
+    a = work.array("a", out.shape, out.dtype)
+    b = work.array("b", out.shape, out.dtype)
+    np.multiply(x1, 3 * np.pi, out=a)
+    np.sin(a, out=a)
+    np.square(a, out=a)
+    np.multiply(x2, 3 * np.pi, out=b)
+    np.sin(b, out=b)
+    np.square(b, out=b)
+    b += 1
+    np.subtract(x1, 1, out=out)
+    np.square(out, out=out)
+    out *= b
+    a += out
+    np.multiply(x2, 2 * np.pi, out=b)
+    np.sin(b, out=b)
+    np.square(b, out=b)
+    b += 1
+    np.subtract(x2, 1, out=out)
+    np.square(out, out=out)
+    out *= b
+    np.add(a, out, out=out)
+    return out
@@ -0,0 +1,555 @@
+"""
+Closed-form gradients and Hessian-vector products of the benchmark functions.
+
+Functions defined for any number of dimensions have ``<name>_grad(x)`` and
+``<name>_hvp(x, v)``. Two-dimensional functions have ``<name>_derivatives(x)``,
+returning the gradient and the 2x2 Hessian, which ``planar_grad`` and
+``planar_hvp`` turn into the same interface. Every function accepts a point of
+shape (n,) or a batch of shape (..., n).
+
+Non-smooth points (kinks of ``abs``, cusps of ``sqrt(abs)``, piece boundaries and
+the constant penalty region of constrained functions) get the derivative of the
+adjacent smooth branch, or zero where that is unbounded.
+"""
+
+from functools import partial
+import numpy as np
+from benchmarks import nonlinear as nln
+
+
+def _coords(x):
+    x = np.asarray(x, dtype=float)
+    return x[..., 0], x[..., 1]
+
+
+def _pack(grad, hess):
+    """Stack (ga, gb) and (haa, hab, hbb) into (..., 2) and (..., 2, 2) arrays."""
+    ga, gb, haa, hab, hbb = np.broadcast_arrays(*grad, *hess)
+    gradient = np.stack([ga, gb], axis=-1)
+    hessian = np.stack([np.stack([haa, hab], -1), np.stack([hab, hbb], -1)], -2)
+    return gradient, hessian
+
+
+def _safe_divide(num, den):
+    """num / den, with zero wherever den is zero."""
+    num, den = np.broadcast_arrays(np.asarray(num, float), np.asarray(den, float))
+    return np.divide(num, den, out=np.zeros(num.shape), where=den != 0)
+
+
+def planar_grad(derivatives, x):
+    """
+    Gradient of a 2-D function from its ``<name>_derivatives`` function.
+
+    Parameters:
+        derivatives (callable): One of the ``<name>_derivatives`` functions.
+        x (np.ndarray): Array of shape (..., 2).
+
+    Returns:
+        np.ndarray: Gradient of shape (..., 2).
+    """
+    return derivatives(x)[0]
+
+
+def planar_hvp(derivatives, x, v):
+    """
+    Hessian-vector product of a 2-D function from its derivatives function.
+
+    Parameters:
+        derivatives (callable): One of the ``<name>_derivatives`` functions.
+        x (np.ndarray): Array of shape (..., 2).
+        v (np.ndarray): Vector(s) of shape (..., 2).
+
+    Returns:
+        np.ndarray: H(x) @ v of shape (..., 2).
+    """
+    hessian = derivatives(x)[1]
+    return np.einsum("...ij,...j->...i", hessian, np.asarray(v, dtype=float))
+
+
+# --- Functions of any dimension -------------------------------------------------
+
+
+def sphere_grad(x):
+    """Gradient of the sphere function."""
+    return 2 * np.asarray(x, dtype=float)
+
+
+def sphere_hvp(x, v):
+    """Hessian-vector product of the sphere function."""
+    return 2 * np.broadcast_to(np.asarray(v, dtype=float), np.shape(x)).copy()
+
+
+def rosenbrock_grad(x):
+    """Gradient of the Rosenbrock function."""
+    x = np.asarray(x, dtype=float)
+    head, tail = x[..., :-1], x[..., 1:]
+    grad = np.zeros_like(x)
+    grad[..., :-1] = -400 * head * (tail - head**2) - 2 * (1 - head)
+    grad[..., 1:] += 200 * (tail - head**2)
+    return grad
+
+
+def rosenbrock_hvp(x, v):
+    """Hessian-vector product of the (tridiagonal) Rosenbrock Hessian."""
+    x = np.asarray(x, dtype=float)
+    v = np.broadcast_to(np.asarray(v, dtype=float), x.shape)
+    head, tail = x[..., :-1], x[..., 1:]
+    diagonal = np.zeros_like(x)
+    diagonal[..., :-1] = 1200 * head**2 - 400 * tail + 2
+    diagonal[..., 1:] += 200
+    off_diagonal = -400 * head
+    product = diagonal * v
+    product[..., :-1] += off_diagonal * v[..., 1:]
+    product[..., 1:] += off_diagonal * v[..., :-1]
+    return product
+
+
+def _ackley_terms(x):
+    dim = x.shape[-1]
+    e1 = np.exp(np.sum(x**2, axis=-1, keepdims=True) / dim * -0.2)
+    e2 = np.exp(np.sum(np.cos(2 * np.pi * x), axis=-1, keepdims=True) / dim)
+    return dim, e1, e2
+
+
+def ackley_grad(x):
+    """Gradient of the Ackley function."""
+    x = np.asarray(x, dtype=float)
+    dim, e1, e2 = _ackley_terms(x)
+    return 8 / dim * x * e1 + 2 * np.pi / dim * np.sin(2 * np.pi * x) * e2
+
+
+def ackley_hvp(x, v):
+    """Hessian-vector product of the Ackley function."""
+    x = np.asarray(x, dtype=float)
+    v = np.broadcast_to(np.asarray(v, dtype=float), x.shape)
+    dim, e1, e2 = _ackley_terms(x)
+    sin, cos = np.sin(2 * np.pi * x), np.cos(2 * np.pi * x)
+    x_dot_v = np.sum(x * v, axis=-1, keepdims=True)
+    sin_dot_v = np.sum(sin * v, axis=-1, keepdims=True)
+    return (
+        8 / dim * e1 * v
+        - 3.2 / dim**2 * e1 * x * x_dot_v
+        + 4 * np.pi**2 / dim * e2 * cos * v
+        - 4 * np.pi**2 / dim**2 * e2 * sin * sin_dot_v
+    )
+
+
+def rastrigin_grad(x):
+    """Gradient of the Rastrigin function."""
+    x = np.asarray(x, dtype=float)
+    return 2 * x + 20 * np.pi * np.sin(2 * np.pi * x)
+
+
+def rastrigin_hvp(x, v):
+    """Hessian-vector product of the (diagonal) Rastrigin Hessian."""
+    x = np.asarray(x, dtype=float)
+    return (2 + 40 * np.pi**2 * np.cos(2 * np.pi * x)) * np.asarray(v, dtype=float)
+
+
+def styblinski_tang_grad(x):
+    """Gradient of the Styblinski-Tang function."""
+    x = np.asarray(x, dtype=float)
+    return 2 * x**3 - 16 * x + 2.5
+
+
+def styblinski_tang_hvp(x, v):
+    """Hessian-vector product of the (diagonal) Styblinski-Tang Hessian."""
+    x = np.asarray(x, dtype=float)
+    return (6 * x**2 - 16) * np.asarray(v, dtype=float)
+
+
+# --- Shared building blocks of the 2-D functions --------------------------------
+
+
+def _radius(x1, x2):
+    """r = sqrt(x1^2 + x2^2) with its gradient and Hessian (zero at the origin)."""
+    r = np.sqrt(x1**2 + x2**2)
+    r3 = r**3
+    grad = (_safe_divide(x1, r), _safe_divide(x2, r))
+    hess = (
+        _safe_divide(x2**2, r3),
+        _safe_divide(-x1 * x2, r3),
+        _safe_divide(x1**2, r3),
+    )
+    return r, grad, hess
+
+
+def _exp_abs_product(s, s_grad, s_hess, m, m_grad, m_hess):
+    """G = s * exp(|m|) with its gradient and Hessian."""
+    sign = np.sign(m)
+    a_grad = tuple(sign * g for g in m_grad)
+    a_hess = tuple(sign * h for h in m_hess)
+    e = np.exp(np.abs(m))
+    (sa, sb), (aa, ab) = s_grad, a_grad
+    grad = (e * (sa + s * aa), e * (sb + s * ab))
+    hess = (
+        e * (s_hess[0] + 2 * sa * aa + s * aa * aa + s * a_hess[0]),
+        e * (s_hess[1] + sa * ab + sb * aa + s * aa * ab + s * a_hess[1]),
+        e * (s_hess[2] + 2 * sb * ab + s * ab * ab + s * a_hess[2]),
+    )
+    return s * e, grad, hess
+
+
+def _square_times(lin, lin_grad, quad, quad_grad, quad_hess):
+    """T = lin^2 * quad for linear ``lin`` and quadratic ``quad``."""
+    (la, lb), (qa, qb) = lin_grad, quad_grad
+    grad = (2 * lin * la * quad + lin**2 * qa, 2 * lin * lb * quad + lin**2 * qb)
+    hess = (
+        2 * la * la * quad + 4 * lin * la * qa + lin**2 * quad_hess[0],
+        2 * la * lb * quad + 2 * lin * (la * qb + lb * qa) + lin**2 * quad_hess[1],
+        2 * lb * lb * quad + 4 * lin * lb * qb + lin**2 * quad_hess[2],
+    )
+    return lin**2 * quad, grad, hess
+
+
+def _quotient(n, n_grad, n_hess, d, d_grad, d_hess):
+    """Gradient and Hessian of n / d."""
+    (na, nb), (da, db) = n_grad, d_grad
+    grad = (na / d - n * da / d**2, nb / d - n * db / d**2)
+
+    def second(nij, ni, nj, di, dj, dij):
+        return (
+            nij / d
+            - (ni * dj + nj * di) / d**2
+            - n * dij / d**2
+            + 2 * n * di * dj / d**3
+        )
+
+    hess = (
+        second(n_hess[0], na, na, da, da, d_hess[0]),
+        second(n_hess[1], na, nb, da, db, d_hess[1]),
+        second(n_hess[2], nb, nb, db, db, d_hess[2]),
+    )
+    return grad, hess
+
+
+def _schaffer_denominator(x1, x2):
+    """(1 + 0.001 r^2)^2 with r^2 = x1^2 + x2^2, its gradient and Hessian."""
+    base = 1 + 0.001 * (x1**2 + x2**2)
+    d1, d2 = 0.002 * base, 2e-6
+    grad = (2 * x1 * d1, 2 * x2 * d1)
+    hess = (4 * x1**2 * d2 + 2 * d1, 4 * x1 * x2 * d2, 4 * x2**2 * d2 + 2 * d1)
+    return base**2, grad, hess
+
+
+def _sqrt_abs(u):
+    """First and second derivatives of sqrt(|u|) (zero at u = 0)."""
+    root = np.sqrt(np.abs(u))
+    return _safe_divide(np.sign(u), 2 * root), _safe_divide(-1.0, 4 * root**3)
+
+
+def _sin_sqrt_abs(u):
+    """sin(sqrt(|u|)) with its first and second derivatives (zero at u = 0)."""
+    root = np.sqrt(np.abs(u))
+    d1, d2 = _sqrt_abs(u)
+    return np.sin(root), np.cos(root) * d1, -np.sin(root) * d1**2 + np.cos(root) * d2
+
+
+# --- 2-D functions ---------------------------------------------------------------
+
+
+def beale_derivatives(x):
+    """Gradient and Hessian of the Beale function."""
+    x1, x2 = _coords(x)
+    terms = [
+        (1.5 - x1 + x1 * x2, x2 - 1, x1, 1, 0),
+        (2.25 - x1 + x1 * x2**2, x2**2 - 1, 2 * x1 * x2, 2 * x2, 2 * x1),
+        (2.625 - x1 + x1 * x2**3, x2**3 - 1, 3 * x1 * x2**2, 3 * x2**2, 6 * x1 * x2),
+    ]
+    grad = (
+        sum(2 * t * ta for t, ta, _, _, _ in terms),
+        sum(2 * t * tb for t, _, tb, _, _ in terms),
+    )
+    hess = (
+        sum(2 * ta**2 for _, ta, _, _, _ in terms),
+        sum(2 * (ta * tb + t * tab) for t, ta, tb, tab, _ in terms),
+        sum(2 * (tb**2 + t * tbb) for t, _, tb, _, tbb in terms),
+    )
+    return _pack(grad, hess)
+
+
+def booth_derivatives(x):
+    """Gradient and Hessian of the Booth function."""
+    x1, x2 = _coords(x)
+    u, w = x1 + 2 * x2 - 7, 2 * x1 + x2 - 5
+    return _pack((2 * u + 4 * w, 4 * u + 2 * w), (10.0, 8.0, 10.0))
+
+
+def matyas_derivatives(x):
+    """Gradient and Hessian of the Matyas function."""
+    x1, x2 = _coords(x)
+    return _pack((0.52 * x1 - 0.48 * x2, 0.52 * x2 - 0.48 * x1), (0.52, -0.48, 0.52))
+
+
+def easom_derivatives(x):
+    """Gradient and Hessian of the Easom function."""
+    x1, x2 = _coords(x)
+    p = -np.cos(x1) * np.cos(x2)
+    pa, pb = np.sin(x1) * np.cos(x2), np.cos(x1) * np.sin(x2)
+    paa = pbb = np.cos(x1) * np.cos(x2)
+    pab = -np.sin(x1) * np.sin(x2)
+    qa, qb = -2 * (x1 - np.pi), -2 * (x2 - np.pi)
+    e = np.exp(-((x1 - np.pi) ** 2) - (x2 - np.pi) ** 2)
+    grad = (e * (pa + p * qa), e * (pb + p * qb))
+    hess = (
+        e * (paa + 2 * pa * qa + p * qa**2 - 2 * p),
+        e * (pab + pa * qb + pb * qa + p * qa * qb),
+        e * (pbb + 2 * pb * qb + p * qb**2 - 2 * p),
+    )
+    return _pack(grad, hess)
+
+
+def eggholder_derivatives(x):
+    """Gradient and Hessian of the Eggholder function."""
+    x1, x2 = _coords(x)
+    # u = (x2 + x1 / 2 + 47) / 2 has du/dx1 = 1/4 and du/dx2 = 1/2.
+    su, su1, su2 = _sin_sqrt_abs((x2 + x1 / 2 + 47) / 2)
+    sw, sw1, sw2 = _sin_sqrt_abs(x1 - (x2 + 47))
+    k = x2 + 47
+    grad = (-k * su1 / 4 - sw - x1 * sw1, -su - k * su1 / 2 + x1 * sw1)
+    hess = (
+        -k * su2 / 16 - 2 * sw1 - x1 * sw2,
+        -su1 / 4 - k * su2 / 8 + sw1 + x1 * sw2,
+        -su1 - k * su2 / 4 - x1 * sw2,
+    )
+    return _pack(grad, hess)
+
+
+def schaffer_n2_derivatives(x):
+    """Gradient and Hessian of the Schaffer N.2 function."""
+    x1, x2 = _coords(x)
+    s = np.sqrt(x1**2 + x2**2)
+    small = s < 1e-3
+    s_safe = np.where(small, 1.0, s)
+    # Derivatives of sin^2(sqrt(r)) - 0.5 with respect to r = s^2.
+    n1 = np.sinc(2 * s / np.pi)
+    n2 = np.where(
+        small,
+        -2 / 3 + 4 / 15 * s**2,
+        (2 * s_safe * np.cos(2 * s_safe) - np.sin(2 * s_safe)) / (4 * s_safe**3),
+    )
+    n = np.sin(s) ** 2 - 0.5
+    n_grad = (2 * x1 * n1, 2 * x2 * n1)
+    n_hess = (4 * x1**2 * n2 + 2 * n1, 4 * x1 * x2 * n2, 4 * x2**2 * n2 + 2 * n1)
+    return _pack(*_quotient(n, n_grad, n_hess, *_schaffer_denominator(x1, x2)))
+
+
+def schaffer_n4_derivatives(x):
+    """Gradient and Hessian of the Schaffer N.4 function."""
+    x1, x2 = _coords(x)
+    t = x1**2 - x2**2
+    y = np.abs(t)
+    # Derivatives of cos^2(sin|t|) - 0.5 with respect to t.
+    n1 = -np.sin(2 * np.sin(y)) * np.cos(y) * np.sign(t)
+    n2 = -2 * np.cos(y) ** 2 * np.cos(2 * np.sin(y)) + np.sin(y) * np.sin(2 * np.sin(y))
+    n = np.cos(np.sin(y)) ** 2 - 0.5
+    n_grad = (2 * x1 * n1, -2 * x2 * n1)
+    n_hess = (4 * x1**2 * n2 + 2 * n1, -4 * x1 * x2 * n2, 4 * x2**2 * n2 - 2 * n1)
+    return _pack(*_quotient(n, n_grad, n_hess, *_schaffer_denominator(x1, x2)))
+
+
+def three_hump_camel_derivatives(x):
+    """Gradient and Hessian of the Three-Hump Camel function."""
+    x1, x2 = _coords(x)
+    grad = (4 * x1 - 4.2 * x1**3 + x1**5 + x2, x1 + 2 * x2)
+    return _pack(grad, (4 - 12.6 * x1**2 + 5 * x1**4, 1.0, 2.0))
+
+
+def mishra_bird_constrained_derivatives(x):
+    """Gradient and Hessian of Mishra's Bird function."""
+    x1, x2 = _coords(x)
+    p = (1 - np.cos(x1)) ** 2
+    pa = 2 * (1 - np.cos(x1)) * np.sin(x1)
+    paa = 2 * np.sin(x1) ** 2 + 2 * (1 - np.cos(x1)) * np.cos(x1)
+    q = (1 - np.sin(x2)) ** 2
+    qb = -2 * (1 - np.sin(x2)) * np.cos(x2)
+    qbb = 2 * np.cos(x2) ** 2 + 2 * (1 - np.sin(x2)) * np.sin(x2)
+    ep, eq = np.exp(p), np.exp(q)
+    diff = x1 - x2
+    grad = (
+        np.sin(x2) * ep * pa - np.sin(x1) * eq + 2 * diff,
+        np.cos(x2) * ep + np.cos(x1) * eq * qb - 2 * diff,
+    )
+    hess = (
+        np.sin(x2) * ep * (pa**2 + paa) - np.cos(x1) * eq + 2,
+        np.cos(x2) * ep * pa - np.sin(x1) * eq * qb - 2,
+        -np.sin(x2) * ep + np.cos(x1) * eq * (qb**2 + qbb) + 2,
+    )
+    return _pack(grad, hess)
+
+
+def _rosenbrock_2d_derivatives(x1, x2):
+    grad = (-400 * x1 * (x2 - x1**2) - 2 * (1 - x1), 200 * (x2 - x1**2))
+    hess = (1200 * x1**2 - 400 * x2 + 2, -400 * x1, 200.0)
+    return grad, hess
+
+
+def _masked(feasible, grad, hess):
+    return (
+        tuple(np.where(feasible, g, 0.0) for g in grad),
+        tuple(np.where(feasible, h, 0.0) for h in hess),
+    )
+
+
+def rosenbrock_constrained_derivatives(x):
+    """Gradient and Hessian of the cube-and-line constrained Rosenbrock function."""
+    x1, x2 = _coords(x)
+    feasible = np.all(nln.cube_line_constraints(x) <= 0, axis=-1)
+    return _pack(*_masked(feasible, *_rosenbrock_2d_derivatives(x1, x2)))
+
+
+def rosenbrock_constrained_disk_derivatives(x):
+    """Gradient and Hessian of the disk-constrained Rosenbrock function."""
+    x1, x2 = _coords(x)
+    feasible = nln.disk_constraints(x)[..., 0] <= 0
+    return _pack(*_masked(feasible, *_rosenbrock_2d_derivatives(x1, x2)))
+
+
+def simionescu_derivatives(x):
+    """Gradient and Hessian of the piecewise Simionescu function."""
+    x1, x2 = _coords(x)
+    a, c1, b, c2 = nln.simionescu_coefficients(x)
+    return _pack((2 * a * (x1 - c1), 2 * b * (x2 - c2)), (2 * a, 0.0, 2 * b))
+
+
+def townsend_modified_derivatives(x):
+    """Gradient and Hessian of the modified Townsend function."""
+    x1, x2 = _coords(x)
+    a, b, c, d = 1.8, 1.8, 10, 10
+    u, w = x1 - a, x2 - b
+    cos_cos = np.cos(c * u) * np.cos(d * w)
+    grad = (
+        u + c * np.sin(c * u) * np.cos(d * w),
+        w + d * np.cos(c * u) * np.sin(d * w),
+    )
+    hess = (
+        1 + c**2 * cos_cos,
+        -c * d * np.sin(c * u) * np.sin(d * w),
+        1 + d**2 * cos_cos,
+    )
+    return _pack(grad, hess)
+
+
+def bukin_derivatives(x):
+    """Gradient and Hessian of the Bukin N.6 function."""
+    x1, x2 = _coords(x)
+    r1, r2 = _sqrt_abs(x2 - 0.01 * x1**2)
+    ua = -0.02 * x1
+    grad = (100 * r1 * ua + 0.01 * np.sign(x1 + 10), 100 * r1)
+    hess = (100 * (r2 * ua**2 - 0.02 * r1), 100 * r2 * ua, 100 * r2)
+    return _pack(grad, hess)
+
+
+def cross_in_tray_derivatives(x):
+    """Gradient and Hessian of the Cross-in-Tray function."""
+    x1, x2 = _coords(x)
+    sx, sy = x1 / 100.0, x2 / 100.0
+    s = np.sin(sx) * np.sin(sy)
+    s_grad = (np.cos(sx) * np.sin(sy) / 100, np.sin(sx) * np.cos(sy) / 100)
+    s_hess = (-s / 100**2, np.cos(sx) * np.cos(sy) / 100**2, -s / 100**2)
+    r, r_grad, r_hess = _radius(x1, x2)
+    m = 100 - r / 100 / np.pi
+    # np.clip caps |m| at 100, where the exponent no longer depends on x.
+    unclipped = np.abs(m) <= 100
+    m_grad = tuple(np.where(unclipped, -g / 100 / np.pi, 0.0) for g in r_grad)
+    m_hess = tuple(np.where(unclipped, -h / 100 / np.pi, 0.0) for h in r_hess)
+    g, g_grad, g_hess = _exp_abs_product(
+        s, s_grad, s_hess, np.clip(m, -100, 100), m_grad, m_hess
+    )
+    base = np.abs(g) + 1
+    c1 = -0.0001 * 0.11 * base**-0.89 * np.sign(g)
+    c2 = 0.0001 * 0.11 * 0.89 * base**-1.89
+    ga, gb = g_grad
+    grad = (c1 * ga, c1 * gb)
+    hess = (
+        c2 * ga * ga + c1 * g_hess[0],
+        c2 * ga * gb + c1 * g_hess[1],
+        c2 * gb * gb + c1 * g_hess[2],
+    )
+    return _pack(grad, hess)
+
+
+def goldstein_price_derivatives(x):
+    """Gradient and Hessian of the Goldstein-Price function."""
+    x1, x2 = _coords(x)
+    t1, t1_grad, t1_hess = _square_times(
+        x1 + x2 + 1,
+        (1.0, 1.0),
+        19 - 14 * x1 + 3 * x1**2 - 14 * x2 + 6 * x1 * x2 + 3 * x2**2,
+        (-14 + 6 * x1 + 6 * x2, -14 + 6 * x1 + 6 * x2),
+        (6.0, 6.0, 6.0),
+    )
+    t2, t2_grad, t2_hess = _square_times(
+        2 * x1 - 3 * x2,
+        (2.0, -3.0),
+        18 - 32 * x1 + 12 * x1**2 + 48 * x2 - 36 * x1 * x2 + 27 * x2**2,
+        (-32 + 24 * x1 - 36 * x2, 48 - 36 * x1 + 54 * x2),
+        (24.0, -36.0, 54.0),
+    )
+    t1, t2 = 1 + t1, 30 + t2
+    (a1, b1), (a2, b2) = t1_grad, t2_grad
+    grad = (a1 * t2 + t1 * a2, b1 * t2 + t1 * b2)
+    hess = (
+        t1_hess[0] * t2 + 2 * a1 * a2 + t1 * t2_hess[0],
+        t1_hess[1] * t2 + a1 * b2 + b1 * a2 + t1 * t2_hess[1],
+        t1_hess[2] * t2 + 2 * b1 * b2 + t1 * t2_hess[2],
+    )
+    return _pack(grad, hess)
+
+
+def holder_table_derivatives(x):
+    """Gradient and Hessian of the Hölder Table function."""
+    x1, x2 = _coords(x)
+    s = np.sin(x1) * np.cos(x2)
+    s_grad = (np.cos(x1) * np.cos(x2), -np.sin(x1) * np.sin(x2))
+    s_hess = (-s, -np.cos(x1) * np.sin(x2), -s)
+    r, r_grad, r_hess = _radius(x1, x2)
+    m_grad = tuple(-g / np.pi for g in r_grad)
+    m_hess = tuple(-h / np.pi for h in r_hess)
+    g, g_grad, g_hess = _exp_abs_product(
+        s, s_grad, s_hess, 1 - r / np.pi, m_grad, m_hess
+    )
+    sign = -np.sign(g)
+    return _pack(tuple(sign * c for c in g_grad), tuple(sign * c for c in g_hess))
+
+
+def levi_derivatives(x):
+    """Gradient and Hessian of the Lévi N.13 function."""
+    x1, x2 = _coords(x)
+    pi = np.pi
+    grad = (
+        3 * pi * np.sin(6 * pi * x1) + 2 * (x1 - 1) * (1 + np.sin(3 * pi * x2) ** 2),
+        (x1 - 1) ** 2 * 3 * pi * np.sin(6 * pi * x2)
+        + 2 * (x2 - 1) * (1 + np.sin(2 * pi * x2) ** 2)
+        + (x2 - 1) ** 2 * 2 * pi * np.sin(4 * pi * x2),
+    )
+    hess = (
+        18 * pi**2 * np.cos(6 * pi * x1) + 2 * (1 + np.sin(3 * pi * x2) ** 2),
+        6 * pi * (x1 - 1) * np.sin(6 * pi * x2),
+        18 * pi**2 * (x1 - 1) ** 2 * np.cos(6 * pi * x2)
+        + 2 * (1 + np.sin(2 * pi * x2) ** 2)
+        + 8 * pi * (x2 - 1) * np.sin(4 * pi * x2)
+        + 8 * pi**2 * (x2 - 1) ** 2 * np.cos(4 * pi * x2),
+    )
+    return _pack(grad, hess)
+
+
+def derivatives(name: str):
+    """
+    Gradient and Hessian-vector product of a registered function.
+
+    Parameters:
+        name (str): Registered function name.
+
+    Returns:
+        tuple: (grad(x), hvp(x, v)) callables, found by the naming convention
+        described in the module docstring.
+
+    Raises:
+        KeyError: If the module has no derivatives for ``name``.
+    """
+    namespace = globals()
+    if f"{name}_grad" in namespace:
+        return namespace[f"{name}_grad"], namespace[f"{name}_hvp"]
+    planar = namespace[f"{name}_derivatives"]
+    return partial(planar_grad, planar), partial(planar_hvp, planar)
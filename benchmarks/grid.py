@@ -0,0 +1,57 @@
+import numpy as np
+
+# Estimated transient bytes per grid point during one pass: the (x1, x2)
+# coordinates plus the float64 temporaries created by a typical kernel.
+_BYTES_PER_POINT = 128
+
+DEFAULT_MAX_CHUNK_BYTES = 64 * 2**20
+
+
+def evaluate_grid(
+    func,
+    bounds: np.ndarray,
+    resolution=500,
+    max_chunk_bytes: int = DEFAULT_MAX_CHUNK_BYTES,
+):
+    """
+    Evaluate a 2-D function over a regular meshgrid in chunked vectorized passes.
+
+    The grid is processed in blocks of whole rows, each block evaluated with a
+    single batched call, so the transient memory of a pass stays below
+    ``max_chunk_bytes`` regardless of the resolution. Points and values use the
+    ``dtype`` of ``func`` when it has one (e.g. a float32 BenchmarkFunction).
+
+    Parameters:
+        func (callable): A BenchmarkFunction or any function accepting a batch of
+            shape (m, 2) and returning m values.
+        bounds (np.ndarray): Array of shape (2, 2) with [lower, upper] per axis.
+        resolution (int or tuple): Number of points per axis, either a single
+            int or (nx, ny).
+        max_chunk_bytes (int): Approximate cap on the memory used per pass.
+
+    Returns:
+        tuple: (X, Y, Z) arrays of shape (ny, nx), as built by np.meshgrid. X and
+        Y are read-only broadcast views; Z holds the function values.
+    """
+    bounds = np.asarray(bounds, dtype=float)
+    if bounds.shape != (2, 2):
+        raise ValueError(f"Expected bounds of shape (2, 2), got {bounds.shape}.")
+    nx, ny = (resolution, resolution) if np.isscalar(resolution) else resolution
+    evaluate = getattr(func, "evaluate_batch", func)
+    dtype = getattr(func, "dtype", np.float64)
+
+    x_vals = np.linspace(bounds[0, 0], bounds[0, 1], nx)
+    y_vals = np.linspace(bounds[1, 0], bounds[1, 1], ny)
+    X, Y = np.meshgrid(x_vals, y_vals, copy=False)
+    Z = np.empty((ny, nx), dtype=dtype)
+
+    rows_per_chunk = max(1, max_chunk_bytes // (_BYTES_PER_POINT * nx))
+    points = np.empty((min(rows_per_chunk, ny), nx, 2), dtype=dtype)
+    points[..., 0] = x_vals
+    for start in range(0, ny, rows_per_chunk):
+        stop = min(start + rows_per_chunk, ny)
+        block = points[: stop - start]
+        block[..., 1] = y_vals[start:stop, None]
+        Z[start:stop] = np.reshape(evaluate(block.reshape(-1, 2)), (stop - start, nx))
+
+    return X, Y, Z
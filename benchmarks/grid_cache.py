@@ -0,0 +1,192 @@
+"""
+On-disk cache of evaluated surface grids.
+
+Each grid is stored as one ``.npy`` file named after the SHA-256 of the
+function name, a hash of its implementation, the bounds, the resolution and
+the dtype, and loaded back as a read-only memmap. Editing the source of a
+function changes its implementation hash, so stale grids are never read
+again; they age out through the size-based eviction, which removes the least
+recently used files first.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
+import benchmarks.workspace  # noqa: F401 (hashed by code_version)
+from benchmarks import registry
+from benchmarks.grid import evaluate_grid
+
+GridCacheInfo = namedtuple(
+    "GridCacheInfo", ["hits", "misses", "entries", "nbytes", "max_bytes"]
+)
+
+DEFAULT_DIRECTORY = os.path.join(
+    os.path.expanduser("~"), ".cache", "objective_functions", "grids"
+)
+DEFAULT_MAX_BYTES = 2**30
+
+# Modules whose code affects every grid.
+_COMMON_MODULES = (
+    "benchmarks.functions_registry",
+    "benchmarks.grid",
+    "benchmarks.registry",
+    "benchmarks.workspace",
+)
+
+
+@lru_cache(maxsize=None)
+def code_version(name: str) -> str:
+    """
+    Hash of the source files that define a registered function.
+
+    Covers the modules of its kernel, in-place variant, objective and
+    constraints (so helpers defined next to them are included) plus the
+    evaluation code shared by all functions.
+
+    Parameters:
+        name (str): Registered function name.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    record = registry.get(name)
+    callables = (record.func, record.inplace, record.objective, record.constraints)
+    modules = {c.__module__ for c in callables if c is not None}
+    digest = hashlib.sha256()
+    for module in sorted(modules.union(_COMMON_MODULES)):
+        with open(inspect.getsourcefile(sys.modules[module]), "rb") as file:
+            digest.update(module.encode())
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+def _resolution(resolution) -> tuple:
+    nx, ny = (resolution, resolution) if np.isscalar(resolution) else resolution
+    return int(nx), int(ny)
+
+
+class GridCache:
+    """
+    Content-addressed directory of evaluated grids with LRU eviction by size.
+
+    Parameters:
+        directory (str, optional): Where the grids are stored (default:
+            ``~/.cache/objective_functions/grids``).
+        max_bytes (int): Total size of the stored grids; the least recently
+            used ones are removed beyond it.
+    """
+
+    def __init__(self, directory: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError(f"Cache size must be non-negative, got {max_bytes}.")
+        self.directory = directory or DEFAULT_DIRECTORY
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, func, bounds, resolution=500) -> str:
+        """
+        Cache key of the grid of a BenchmarkFunction.
+
+        Returns:
+            str: Hex SHA-256 of the name, code version, bounds, resolution and
+            dtype.
+        """
+        payload = json.dumps(
+            [
+                func.name,
+                code_version(func.name),
+                np.asarray(bounds, dtype=float).tolist(),
+                _resolution(resolution),
+                np.dtype(func.dtype).name,
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npy")
+
+    def evaluate_grid(self, func, bounds, resolution=500, **options):
+        """
+        ``evaluate_grid`` that stores its values and reuses them on later calls.
+
+        Parameters:
+            func (BenchmarkFunction): Registered 2-D function.
+            bounds (np.ndarray): Array of shape (2, 2) with [lower, upper] per axis.
+            resolution (int or tuple): Number of points per axis.
+            **options: Passed to ``evaluate_grid`` on a miss.
+
+        Returns:
+            tuple: (X, Y, Z) as returned by ``evaluate_grid``, with Z a
+            read-only memmap of the stored grid.
+        """
+        path = self.path(self.key(func, bounds, resolution))
+        nx, ny = _resolution(resolution)
+        bounds = np.asarray(bounds, dtype=float)
+        try:
+            Z = np.load(path, mmap_mode="r")
+            os.utime(path)  # mark as recently used
+            self.hits += 1
+        except FileNotFoundError:
+            _, _, Z = evaluate_grid(func, bounds, (nx, ny), **options)
+            self.misses += 1
+            self._store(path, Z)
+            Z = np.load(path, mmap_mode="r") if os.path.exists(path) else Z
+
+        x_vals = np.linspace(bounds[0, 0], bounds[0, 1], nx)
+        y_vals = np.linspace(bounds[1, 0], bounds[1, 1], ny)
+        X, Y = np.meshgrid(x_vals, y_vals, copy=False)
+        return X, Y, Z
+
+    def _store(self, path: str, Z: np.ndarray):
+        # Write under a temporary name then rename, so that concurrent readers
+        # never see a partial file.
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as file:
+            np.save(file, Z)
+        os.replace(temporary, path)
+        self.evict()
+
+    def _entries(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npy"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+        return sorted(entries)
+
+    def evict(self):
+        """Remove the least recently used grids until they fit in ``max_bytes``."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def info(self) -> GridCacheInfo:
+        """Hits and misses of this instance, number and total size of the grids."""
+        entries = self._entries()
+        return GridCacheInfo(
+            self.hits,
+            self.misses,
+            len(entries),
+            sum(size for _, size, _ in entries),
+            self.max_bytes,
+        )
+
+    def clear(self):
+        """Remove every stored grid."""
+        for _, _, path in self._entries():
+            os.remove(path)
@@ -0,0 +1,96 @@
+import time
+import numpy as np
+
+
+class EvaluationStats:
+    """
+    Counters and latency histogram of the evaluations of an objective function.
+
+    Latencies are measured with ``time.perf_counter_ns``. Histogram bin k counts
+    calls that took between 2**(k - 1) and 2**k nanoseconds; the last bin also
+    holds every slower call.
+
+    Parameters:
+        n_bins (int): Number of histogram bins (40 bins reach about 9 minutes).
+    """
+
+    def __init__(self, n_bins: int = 40):
+        self.n_bins = n_bins
+        self.reset()
+
+    def reset(self):
+        """Clear every counter."""
+        self.calls = 0
+        self.points = 0
+        self.total_ns = 0
+        self.counts = np.zeros(self.n_bins, dtype=np.int64)
+
+    def record(self, n_points: int, elapsed_ns: int):
+        """Account for one call that evaluated ``n_points`` points."""
+        self.calls += 1
+        self.points += n_points
+        self.total_ns += elapsed_ns
+        self.counts[min(elapsed_ns.bit_length(), self.n_bins - 1)] += 1
+
+    @property
+    def total_time(self) -> float:
+        """Cumulative time spent inside the objective, in seconds."""
+        return self.total_ns * 1e-9
+
+    @property
+    def points_per_second(self) -> float:
+        """Evaluation throughput, or 0.0 before any call."""
+        return self.points / self.total_time if self.total_ns else 0.0
+
+    def histogram(self):
+        """
+        Latency histogram.
+
+        Returns:
+            tuple: (edges, counts) where ``edges`` has n_bins + 1 bin edges in
+            seconds and ``counts`` the number of calls per bin.
+        """
+        edges = np.concatenate([[0.0], 2.0 ** np.arange(self.n_bins) * 1e-9])
+        edges[-1] = np.inf
+        return edges, self.counts.copy()
+
+    def summary(self) -> dict:
+        """Plain-dict snapshot of the counters."""
+        return {
+            "calls": self.calls,
+            "points": self.points,
+            "time": self.total_time,
+            "points_per_second": self.points_per_second,
+        }
+
+    def __repr__(self):
+        return (
+            f"<EvaluationStats calls={self.calls} points={self.points} "
+            f"time={self.total_time:.6f}s>"
+        )
+
+
+def timed(func, stats: EvaluationStats):
+    """
+    Wrap an objective so every call is recorded in ``stats``.
+
+    A call with an (m, n) batch is recorded as m points.
+
+    Parameters:
+        func (callable): Objective taking one point or a batch of points.
+        stats (EvaluationStats): Statistics to update.
+
+    Returns:
+        callable: Function with the same signature as ``func``.
+    """
+
+    def wrapper(x, *args):
+        start = time.perf_counter_ns()
+        value = func(x, *args)
+        n_points = len(x) if np.ndim(x) > 1 else 1
+        stats.record(n_points, time.perf_counter_ns() - start)
+        return value
+
+    # Lets callers reach the untimed objective with ``inspect.unwrap``.
+    wrapper.__wrapped__ = func
+    return wrapper
@@ -1,135 +1,210 @@
 import numpy as np
+from benchmarks.registry import Scaling, register, register_inplace
 
 
+@register(
+    bounds=[[-32.768, 32.768]] * 2,
+    optimum=0.0,
+    modality="multimodal",
+    scaling=Scaling((-32.768, 32.768), x_opt=0.0, f_opt=0.0),
+)
 def ackley(x: np.ndarray) -> float:
     """
     Ackley function for optimization.
 
     Args:
-        x (array-like): Input vector.
+        x (array-like): Input vector of shape (n,) or batch of shape (..., n).
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    dim = len(x)
-    t1 = 0
-    t2 = 0
-
-    for i in range(dim):
-        t1 += x[i] ** 2
-        t2 += np.cos(2 * np.pi * x[i])
+    x = np.asarray(x)
+    dim = x.shape[-1]
+    t1 = np.sum(x**2, axis=-1)
+    t2 = np.sum(np.cos(2 * np.pi * x), axis=-1)
 
     of = 20 + np.e - 20 * np.exp((t1 / dim) * -0.2) - np.exp(t2 / dim)
 
     return of
 
 
+@register_inplace(ackley)
+def ackley_into(X, out, work):
+    """In-place batch Ackley (see ``register_inplace``)."""
+    dim = X.shape[-1]
+    t = work.array("t", X.shape, X.dtype)
+    s = work.array("s", out.shape, out.dtype)
+    np.square(X, out=t)
+    np.sum(t, axis=-1, out=out)
+    out /= dim
+    out *= -0.2
+    np.exp(out, out=out)
+    out *= 20
+    np.subtract(20 + np.e, out, out=out)
+    np.multiply(X, 2 * np.pi, out=t)
+    np.cos(t, out=t)
+    np.sum(t, axis=-1, out=s)
+    s /= dim
+    np.exp(s, out=s)
+    out -= s
+    return out
+
+
+@register(bounds=[[-10, 10]] * 2, optimum=-1.0, modality="multimodal")
 def easom(x: np.ndarray) -> float:
     """
     Easom function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     return -np.cos(x1) * np.cos(x2) * np.exp(-((x1 - np.pi) ** 2) - (x2 - np.pi) ** 2)
 
 
+@register(bounds=[[-512, 512]] * 2, optimum=-959.6407, modality="multimodal")
 def eggholder(x: np.ndarray) -> float:
     """
     Eggholder function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     return -(x2 + 47) * np.sin(np.sqrt(np.abs(x2 + x1 / 2 + 47) / 2)) - x1 * np.sin(
         np.sqrt(np.abs(x1 - (x2 + 47)))
     )
 
 
+@register(
+    bounds=[[-5.12, 5.12]] * 2,
+    optimum=0.0,
+    modality="multimodal",
+    scaling=Scaling((-5.12, 5.12), x_opt=0.0, f_opt=0.0),
+)
 def rastrigin(x: np.ndarray) -> float:
     """
     Rastrigin function for optimization.
 
     Args:
-        x (array-like): Input vector.
+        x (array-like): Input vector of shape (n,) or batch of shape (..., n).
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    dim = len(x)
-    of = 0
+    x = np.asarray(x)
+    dim = x.shape[-1]
+    return 10 * dim + np.sum(x**2 - 10 * np.cos(2 * np.pi * x), axis=-1)
 
-    for i in range(dim):
-        of += 10 + (x[i] ** 2) - 10 * np.cos(2 * np.pi * x[i])
 
-    return of
+@register_inplace(rastrigin)
+def rastrigin_into(X, out, work):
+    """In-place batch Rastrigin (see ``register_inplace``)."""
+    t = work.array("t", X.shape, X.dtype)
+    u = work.array("u", X.shape, X.dtype)
+    np.multiply(X, 2 * np.pi, out=u)
+    np.cos(u, out=u)
+    u *= 10
+    np.square(X, out=t)
+    t -= u
+    np.sum(t, axis=-1, out=out)
+    out += 10 * X.shape[-1]
+    return out
 
 
+@register(bounds=[[-100, 100]] * 2, optimum=0.0, modality="multimodal")
 def schaffer_n2(x: np.ndarray) -> float:
     """
     Schaffer N.2 function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     r = x1**2 + x2**2
     num = np.sin(np.sqrt(r)) ** 2 - 0.5
     den = (1 + 0.001 * r) ** 2
     return 0.5 + num / den
 
 
+@register(bounds=[[-100, 100]] * 2, optimum=0.292579, modality="multimodal")
 def schaffer_n4(x: np.ndarray) -> float:
     """
     Schaffer N.4 function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     r = x1**2 + x2**2
     num = np.cos(np.sin(np.abs(x1**2 - x2**2))) ** 2 - 0.5
     den = (1 + 0.001 * r) ** 2
     return 0.5 + num / den
 
 
+@register(
+    bounds=[[-5, 5]] * 2,
+    optimum=-78.332,
+    modality="multimodal",
+    scaling=Scaling((-5, 5), x_opt=-2.903534027771178, f_opt=-39.16616570377142),
+)
 def styblinski_tang(x: np.ndarray) -> float:
     """
     Styblinski-Tang function for optimization.
 
-    Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+    Args:
+        x (array-like): Input vector of shape (n,) or batch of shape (..., n).
 
     Returns:
-        float: Function value.
+        float or np.ndarray: Function value(s).
     """
-    x1, x2 = x[0], x[1]
-    return 0.5 * (x1**4 - 16 * x1**2 + 5 * x1 + x2**4 - 16 * x2**2 + 5 * x2)
+    x = np.asarray(x)
+    return 0.5 * np.sum(x**4 - 16 * x**2 + 5 * x, axis=-1)
+
+
+@register_inplace(styblinski_tang)
+def styblinski_tang_into(X, out, work):
+    """In-place batch Styblinski-Tang (see ``register_inplace``)."""
+    t = work.array("t", X.shape, X.dtype)
+    u = work.array("u", X.shape, X.dtype)
+    np.power(X, 4, out=t)
+    np.square(X, out=u)
+    u *= 16
+    t -= u
+    np.multiply(X, 5, out=u)
+    t += u
+    np.sum(t, axis=-1, out=out)
+    out *= 0.5
+    return out
 
 
+@register(bounds=[[-5, 5]] * 2, optimum=0.0, modality="multimodal")
 def three_hump_camel(x: np.ndarray) -> float:
     """
     Three-Hump Camel function for optimization.
 
     Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
         float: Function value (inf if constraints are violated)
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     return 2 * x1**2 - 1.05 * x1**4 + (x1**6) / 6 + x1 * x2 + x2**2
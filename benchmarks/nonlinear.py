@@ -1,150 +1,216 @@
 import numpy as np
+from benchmarks.classical import rosenbrock as _rosenbrock
+from benchmarks.registry import PENALTY, register
 
 
+def _squeeze(values):
+    """Return 0-d results as scalars, as NumPy ufuncs do."""
+    return values[()]
+
+
+def _rosenbrock_2d(x1, x2):
+    """2-D Rosenbrock objective shared by the constrained variants."""
+    return (1 - x1) ** 2 + 100 * (x2 - x1**2) ** 2
+
+
+def cube_line_constraints(x: np.ndarray) -> np.ndarray:
+    """
+    Constraints of the Rosenbrock function with cube and line constraints.
+
+    Parameters:
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
+
+    Returns:
+        np.ndarray: Array of shape (..., 5) with the values g(x) of the cube
+        bounds -1 <= x1, x2 <= 1 and the line x1 + x2 >= 1, feasible where g(x) <= 0.
+    """
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
+    return np.stack([-1 - x1, x1 - 1, -1 - x2, x2 - 1, 1 - x1 - x2], axis=-1)
+
+
+def disk_constraints(x: np.ndarray) -> np.ndarray:
+    """
+    Constraint of the Rosenbrock function constrained to a disk of radius 1.5.
+
+    Parameters:
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
+
+    Returns:
+        np.ndarray: Array of shape (..., 1) with g(x) = x1^2 + x2^2 - 1.5^2,
+        feasible where g(x) <= 0.
+    """
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
+    radius = 1.5
+    return (x1**2 + x2**2 - radius**2)[..., None]
+
+
+@register(bounds=[[-10, 0], [-6.5, 0]], optimum=-106.7645367, modality="multimodal")
 def mishra_bird_constrained(x: np.ndarray) -> float:
     """
     Mishra's Bird function with constraints.
 
       Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
         numpy array or float: Function value(s)
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     term1 = np.sin(x2) * np.exp((1 - np.cos(x1)) ** 2)
     term2 = np.cos(x1) * np.exp((1 - np.sin(x2)) ** 2)
     term3 = (x1 - x2) ** 2
     return term1 + term2 + term3
 
 
+@register(
+    bounds=[[-1.5, 1.5], [-0.5, 2.5]],
+    optimum=0.0,
+    modality="unimodal",
+    constraints=cube_line_constraints,
+    objective=_rosenbrock,
+)
 def rosenbrock_constrained(x: np.ndarray) -> float:
     """
     Rosenbrock function with cube and line constraints.
 
      Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        numpy array: Function value (inf if constraints violated)
+        numpy array: Function value (PENALTY if constraints violated)
     """
-    x1, x2 = x[0], x[1]
-    outside_cube = (x1 < -1 or x1 > 1) or (x2 < -1 or x2 > 1)
-    outside_line = x2 < -x1 + 1
-    if outside_cube or outside_line:
-        return 1e6
-    return (1 - x1) ** 2 + 100 * (x2 - x1**2) ** 2
-
-
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
+    feasible = np.all(cube_line_constraints(x) <= 0, axis=-1)
+    return _squeeze(np.where(feasible, _rosenbrock_2d(x1, x2), PENALTY))
+
+
+@register(
+    bounds=[[-2, 2]] * 2,
+    optimum=0.0,
+    modality="unimodal",
+    constraints=disk_constraints,
+    objective=_rosenbrock,
+)
 def rosenbrock_constrained_disk(x: np.ndarray) -> float:
     """
     Rosenbrock function constrained to a disk.
 
       Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
-        numpy array: Function value (inf if outside disk)
+        numpy array: Function value (PENALTY if outside disk)
     """
-    x1, x2 = x[0], x[1]
-    radius = 1.5
-    inside_disk = x1**2 + x2**2 <= radius**2
-    Z = np.where(inside_disk, (1 - x1) ** 2 + 100 * (x2 - x1**2) ** 2, 1e6)
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
+    inside_disk = disk_constraints(x)[..., 0] <= 0
+    Z = np.where(inside_disk, _rosenbrock_2d(x1, x2), PENALTY)
+
+    return _squeeze(Z)
+
+
+# Simionescu pieces as (x1 cells, x2 cells, a, c1, b, c2). Cell k is the unit
+# interval [k - 2, k - 1] of [-2, 2] and each piece evaluates
+# a * (x1 - c1) ** 2 + b * (x2 - c2) ** 2. On shared edges the later piece wins.
+_SIMIONESCU_PIECES = [
+    ((1,), (1,), 5, -1, 5, -1),
+    ((2,), (1,), 3, 1, 5, -1),
+    ((1,), (2,), 5, -1, 3, 1),
+    ((2,), (2,), 3, 1, 3, 1),
+    ((0,), (0,), 1, -2, 5, -2),
+    ((0,), (3,), 1, -2, 5, 2),
+    ((3,), (0,), 1, 2, 5, -2),
+    ((3,), (3,), 1, 2, 5, 2),
+    ((0,), (1, 2), 1, -2, 3, 0),
+    ((3,), (1, 2), 1, 2, 3, 0),
+    ((1, 2), (0,), 3, 0, 1, -2),
+    ((1, 2), (3,), 3, 0, 1, 2),
+]
+
+
+def _piece_lookup(pieces):
+    """Build the (4, 4) cell -> piece index table and the (k, 4) coefficients."""
+    cells = np.empty((4, 4), dtype=np.intp)
+    for index, (rows, cols, *_) in enumerate(pieces):
+        cells[np.ix_(rows, cols)] = index
+    return cells, np.array([piece[2:] for piece in pieces], dtype=float)
+
+
+_SIMIONESCU_CELLS, _SIMIONESCU_COEFFS = _piece_lookup(_SIMIONESCU_PIECES)
+
+
+def _unit_cells(t):
+    """Indices of the closed unit cells of [0, 4] on either side of each t."""
+    return (
+        np.maximum(np.ceil(t) - 1, 0).astype(np.intp),
+        np.minimum(np.floor(t), 3).astype(np.intp),
+    )
 
-    return Z
+
+def simionescu_coefficients(x: np.ndarray):
+    """
+    Coefficients of the Simionescu piece that applies at each point.
+
+    Each point is mapped to its piece with a table lookup on the unit cells that
+    contain it, so the cost per point does not depend on the number of pieces.
+
+    Parameters:
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
+
+    Returns:
+        tuple: Arrays (a, c1, b, c2) of shape (...) such that the function is
+        a * (x1 - c1) ** 2 + b * (x2 - c2) ** 2; all zero outside [-2, 2]^2.
+    """
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
+    inside = (np.abs(x1) <= 2) & (np.abs(x2) <= 2)
+    i_lo, i_hi = _unit_cells(np.where(inside, x1 + 2, 0))
+    j_lo, j_hi = _unit_cells(np.where(inside, x2 + 2, 0))
+    cells = _SIMIONESCU_CELLS
+    piece = np.maximum(
+        np.maximum(cells[i_lo, j_lo], cells[i_lo, j_hi]),
+        np.maximum(cells[i_hi, j_lo], cells[i_hi, j_hi]),
+    )
+    coefficients = np.where(inside[..., None], _SIMIONESCU_COEFFS[piece], 0.0)
+    return tuple(np.moveaxis(coefficients, -1, 0))
 
 
+@register(bounds=[[-2, 2]] * 2, optimum=0.0, modality="multimodal")
 def simionescu(x: np.ndarray) -> float:
     """
     Simionescu's piecewise constrained function.
 
        Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
         numpy array or float: Function value(s)
     """
-    x1, x2 = x[0], x[1]
-    result = np.zeros_like(x1)
-    masks = [
-        (
-            (-1 <= x1) & (x1 <= 0) & (-1 <= x2) & (x2 <= 0),
-            lambda x1, x2: 5 * (x1 + 1) ** 2 + 5 * (x2 + 1) ** 2,
-        ),
-        (
-            (0 <= x1) & (x1 <= 1) & (-1 <= x2) & (x2 <= 0),
-            lambda x1, x2: 3 * (x1 - 1) ** 2 + 5 * (x2 + 1) ** 2,
-        ),
-        (
-            (-1 <= x1) & (x1 <= 0) & (0 <= x2) & (x2 <= 1),
-            lambda x1, x2: 5 * (x1 + 1) ** 2 + 3 * (x2 - 1) ** 2,
-        ),
-        (
-            (0 <= x1) & (x1 <= 1) & (0 <= x2) & (x2 <= 1),
-            lambda x1, x2: 3 * (x1 - 1) ** 2 + 3 * (x2 - 1) ** 2,
-        ),
-        (
-            (-2 <= x1) & (x1 <= -1) & (-2 <= x2) & (x2 <= -1),
-            lambda x1, x2: (x1 + 2) ** 2 + 5 * (x2 + 2) ** 2,
-        ),
-        (
-            (-2 <= x1) & (x1 <= -1) & (1 <= x2) & (x2 <= 2),
-            lambda x1, x2: (x1 + 2) ** 2 + 5 * (x2 - 2) ** 2,
-        ),
-        (
-            (1 <= x1) & (x1 <= 2) & (-2 <= x2) & (x2 <= -1),
-            lambda x1, x2: (x1 - 2) ** 2 + 5 * (x2 + 2) ** 2,
-        ),
-        (
-            (1 <= x1) & (x1 <= 2) & (1 <= x2) & (x2 <= 2),
-            lambda x1, x2: (x1 - 2) ** 2 + 5 * (x2 - 2) ** 2,
-        ),
-        (
-            (-2 <= x1) & (x1 <= -1) & (-1 <= x2) & (x2 <= 1),
-            lambda x1, x2: (x1 + 2) ** 2 + 3 * x2**2,
-        ),
-        (
-            (1 <= x1) & (x1 <= 2) & (-1 <= x2) & (x2 <= 1),
-            lambda x1, x2: (x1 - 2) ** 2 + 3 * x2**2,
-        ),
-        (
-            (-1 <= x1) & (x1 <= 1) & (-2 <= x2) & (x2 <= -1),
-            lambda x1, x2: 3 * x1**2 + (x2 + 2) ** 2,
-        ),
-        (
-            (-1 <= x1) & (x1 <= 1) & (1 <= x2) & (x2 <= 2),
-            lambda x1, x2: 3 * x1**2 + (x2 - 2) ** 2,
-        ),
-    ]
-
-    for mask, func in masks:
-        result[mask] = func(x1[mask], x2[mask])
-
-    return result
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
+    a, c1, b, c2 = simionescu_coefficients(x)
+    # a is zero only outside the domain, where the function is zero.
+    return _squeeze(np.where(a > 0, a * (x1 - c1) ** 2 + b * (x2 - c2) ** 2, 0.0))
 
 
+@register(bounds=[[-10, 10]] * 2, optimum=2.0052938, modality="multimodal")
 def townsend_modified(x: np.ndarray) -> float:
     """
     Modified Townsend function for optimization.
 
        Parameters:
-        x (np.ndarray): Vector of shape (2,), where x[0] is x1 and x[1] is x2.
+        x (np.ndarray): Array of shape (..., 2), where x[..., 0] is x1 and x[..., 1] is x2.
 
     Returns:
         float or numpy array: Function value(s)
     """
-    x1, x2 = x[0], x[1]
+    x = np.asarray(x)
+    x1, x2 = x[..., 0], x[..., 1]
     a, b, c, d = 1.8, 1.8, 10, 10
-    if isinstance(x1, np.ndarray) and isinstance(x2, np.ndarray):
-        result = np.empty_like(x1)
-        for i in range(x1.shape[0]):
-            for j in range(x1.shape[1]):
-                result[i, j] = (
-                    0.5 * ((x1[i, j] - a) ** 2 + (x2[i, j] - b) ** 2)
-                    - np.cos(c * (x1[i, j] - a)) * np.cos(d * (x2[i, j] - b))
-                    + 1
-                )
-        return result
     return (
         0.5 * ((x1 - a) ** 2 + (x2 - b) ** 2)
         - np.cos(c * (x1 - a)) * np.cos(d * (x2 - b))
@@ -0,0 +1,220 @@
+"""
+Multi-core evaluation of large batches.
+
+``ParallelEvaluator`` splits an (m, n) batch into row chunks and evaluates them
+concurrently. The thread backend relies on NumPy ufuncs releasing the GIL;
+each thread keeps its own BenchmarkFunction because a Workspace is not
+thread-safe. The process backend copies the batch once into shared memory;
+workers rebuild the function by name and write their chunk of the values into
+a second shared block, so neither points nor values are pickled.
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from benchmarks.functions_registry import BenchmarkFunction
+
+BACKENDS = ("auto", "serial", "thread", "process")
+
+# Batch sizes (in points) from which "auto" switches to threads, then processes.
+THREAD_THRESHOLD = 2**15
+PROCESS_THRESHOLD = 2**22
+
+DEFAULT_CHUNK_SIZE = 2**16
+
+# Function of the current process-pool worker.
+_worker = {}
+
+
+def _init_worker(name, dim, dtype):
+    _worker["function"] = BenchmarkFunction(name, dim=dim, dtype=dtype)
+
+
+def _evaluate_shared(points, values, shape, start, stop):
+    f = _worker["function"]
+    # Pool workers share the parent's resource tracker, so attaching does not
+    # make them owners of the blocks.
+    points = shared_memory.SharedMemory(name=points)
+    values = shared_memory.SharedMemory(name=values)
+    try:
+        X = np.ndarray(shape, dtype=f.dtype, buffer=points.buf)
+        out = np.ndarray(shape[:1], dtype=f.dtype, buffer=values.buf)
+        f.evaluate_batch(X[start:stop], out=out[start:stop])
+        del X, out
+    finally:
+        points.close()
+        values.close()
+    return stop - start
+
+
+class ParallelEvaluator:
+    """
+    Evaluate batches of a registered function on several cores.
+
+    Parameters:
+        func (str or BenchmarkFunction): Registered function name, or a
+            BenchmarkFunction whose name, dimension and dtype are reused.
+        dim (int, optional): Number of dimensions when ``func`` is a name.
+        workers (int, optional): Threads or processes (default: every CPU).
+        backend (str): One of BACKENDS. "auto" evaluates batches below
+            ``thread_threshold`` points serially, batches below
+            ``process_threshold`` on threads and larger ones on processes.
+        chunk_size (int): Points per chunk.
+        thread_threshold, process_threshold (int): Limits of "auto".
+        dtype (data-type): Evaluation dtype when ``func`` is a name.
+
+    Pools and shared memory are created on first use and kept for later
+    batches; call ``close`` (or use the evaluator as a context manager) to
+    release them.
+    """
+
+    def __init__(
+        self,
+        func,
+        dim: int = None,
+        workers: int = None,
+        backend: str = "auto",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        thread_threshold: int = THREAD_THRESHOLD,
+        process_threshold: int = PROCESS_THRESHOLD,
+        dtype=np.float64,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend must be one of {BACKENDS}, got {backend!r}.")
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}.")
+        if isinstance(func, BenchmarkFunction):
+            dim, dtype, func = func.dim, func.dtype, func.name
+        self.function = BenchmarkFunction(func, dim=dim, dtype=dtype)
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.thread_threshold = thread_threshold
+        self.process_threshold = process_threshold
+        self._local = threading.local()
+        self._threads = None
+        self._processes = None
+        self._blocks = {}
+
+    @property
+    def dtype(self):
+        return self.function.dtype
+
+    def choose_backend(self, m: int) -> str:
+        """Backend used for a batch of ``m`` points."""
+        if self.backend != "auto":
+            return self.backend
+        if self.workers == 1 or m < self.thread_threshold:
+            return "serial"
+        return "thread" if m < self.process_threshold else "process"
+
+    def _chunks(self, m: int):
+        # At least one chunk per worker, so small batches still spread out.
+        size = max(1, min(self.chunk_size, -(-m // self.workers)))
+        return [(start, min(start + size, m)) for start in range(0, m, size)]
+
+    def evaluate(self, X, out=None):
+        """
+        Evaluate a batch of points.
+
+        Parameters:
+            X (np.ndarray): Array of shape (m, n), one point per row.
+            out (np.ndarray, optional): Array of shape (m,) and the function's
+                dtype to write the values to.
+
+        Returns:
+            np.ndarray: Function values of shape (m,) (``out`` if given).
+        """
+        f = self.function
+        X = f._as_batch(X)
+        if out is None:
+            out = np.empty(len(X), dtype=f.dtype)
+        f._check_out(out, len(X))
+        backend = self.choose_backend(len(X))
+        if backend == "serial" or len(X) == 0:
+            return f.evaluate_batch(X, out=out)
+        if backend == "thread":
+            return self._evaluate_threads(X, out)
+        return self._evaluate_processes(X, out)
+
+    __call__ = evaluate
+
+    def _thread_function(self):
+        if not hasattr(self._local, "function"):
+            f = self.function
+            self._local.function = BenchmarkFunction(f.name, dim=f.dim, dtype=f.dtype)
+        return self._local.function
+
+    def _evaluate_threads(self, X, out):
+        def run(start, stop):
+            self._thread_function().evaluate_batch(X[start:stop], out=out[start:stop])
+
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.workers)
+        futures = [self._threads.submit(run, *chunk) for chunk in self._chunks(len(X))]
+        for future in futures:
+            future.result()
+        return out
+
+    def _shared(self, role: str, nbytes: int):
+        # Reuse the block of the previous batch when it is large enough.
+        block = self._blocks.get(role)
+        if block is None or block.size < nbytes:
+            if block is not None:
+                block.close()
+                block.unlink()
+            block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+            self._blocks[role] = block
+        return block
+
+    def _evaluate_processes(self, X, out):
+        f = self.function
+        if self._processes is None:
+            self._processes = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(f.name, f.dim, f.dtype.name),
+            )
+
+        points = self._shared("points", X.nbytes)
+        values = self._shared("values", out.nbytes)
+        shared_X = np.ndarray(X.shape, dtype=f.dtype, buffer=points.buf)
+        shared_X[...] = X
+        futures = [
+            self._processes.submit(
+                _evaluate_shared, points.name, values.name, X.shape, start, stop
+            )
+            for start, stop in self._chunks(len(X))
+        ]
+        for future in futures:
+            future.result()
+        out[...] = np.ndarray(out.shape, dtype=f.dtype, buffer=values.buf)
+        return out
+
+    def close(self):
+        """Shut the pools down and release the shared memory."""
+        if self._threads is not None:
+            self._threads.shutdown()
+            self._threads = None
+        if self._processes is not None:
+            self._processes.shutdown()
+            self._processes = None
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __repr__(self):
+        f = self.function
+        return (
+            f"<ParallelEvaluator name={f.name} dim={f.dim} "
+            f"backend={self.backend} workers={self.workers}>"
+        )
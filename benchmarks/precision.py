@@ -0,0 +1,126 @@
+"""
+Accuracy of reduced-precision batch evaluation.
+
+``validate`` evaluates every function in float32 (or another dtype) and in
+float64 on the same points and reports the largest error. Points are drawn
+uniformly over the function's bounds, plus a cloud of points at shrinking
+distances around the best sample, where cancellation is usually worst.
+"""
+
+from typing import NamedTuple
+import numpy as np
+from benchmarks import registry
+from benchmarks.functions_registry import BenchmarkFunction
+
+# Largest error, relative to max(|f|, 1), accepted before a function is flagged.
+DEFAULT_RTOL = 1e-4
+
+
+class PrecisionReport(NamedTuple):
+    """
+    Reduced-precision error of one function.
+
+    ``max_rel_error`` is the largest |f_low - f_64| / max(|f_64|, 1), i.e. the
+    relative error for values above 1 and the absolute error below it, so
+    functions with a zero optimum are not flagged for rounding noise; it is
+    inf when the low-precision evaluation overflows. ``worst_x`` is the point
+    where it occurs.
+    """
+
+    name: str
+    dtype: str
+    max_rel_error: float
+    worst_x: np.ndarray
+    non_finite: int
+    safe: bool
+
+
+def sample_points(f: BenchmarkFunction, n_samples: int, seed=None) -> np.ndarray:
+    """
+    Uniform points over the bounds of ``f`` plus points near its best sample.
+
+    A fifth of the points surround the best uniform sample at distances from
+    1e-7 to 1e-2 of each range, clipped to the bounds.
+
+    Parameters:
+        f (BenchmarkFunction): Function to sample.
+        n_samples (int): Total number of points.
+        seed (int, optional): Seed of the random generator.
+
+    Returns:
+        np.ndarray: float64 array of shape (n_samples, dim).
+    """
+    rng = np.random.default_rng(seed)
+    lower, upper = f.bounds[:, 0], f.bounds[:, 1]
+    n_near = n_samples // 5
+    X = rng.uniform(lower, upper, size=(n_samples - n_near, f.dim))
+    reference = BenchmarkFunction(f.name, dim=f.dim)
+    best = X[np.argmin(reference.evaluate_batch(X))]
+
+    scales = np.logspace(-7, -2, n_near)[:, None] * (upper - lower)
+    near = best + rng.standard_normal((n_near, f.dim)) * scales
+    return np.clip(np.vstack([X, near]), lower, upper)
+
+
+def validate(
+    names=None,
+    dtype=np.float32,
+    n_samples: int = 100_000,
+    rtol: float = DEFAULT_RTOL,
+    dim: int = None,
+    seed=0,
+) -> list:
+    """
+    Error of ``dtype`` batch evaluation against float64 for each function.
+
+    Both evaluations use the same points, rounded to ``dtype`` first, so the
+    error measures the arithmetic of the kernel rather than the rounding of
+    its input.
+
+    Parameters:
+        names (list, optional): Functions to check (default: all registered).
+        dtype (data-type): Reduced precision to validate.
+        n_samples (int): Points per function (see ``sample_points``).
+        rtol (float): Largest ``max_rel_error`` considered safe.
+        dim (int, optional): Dimension of the scalable functions (default:
+            their registered one); fixed-dimension functions ignore it.
+        seed (int): Seed of the sample points.
+
+    Returns:
+        list: One PrecisionReport per function, in registry order.
+    """
+    reports = []
+    for name in names or registry.names():
+        record = registry.get(name)
+        n = dim if dim is not None and record.scalable else None
+        low = BenchmarkFunction(name, dim=n, dtype=dtype)
+        high = BenchmarkFunction(name, dim=n)
+        X = sample_points(high, n_samples, seed=seed).astype(low.dtype)
+
+        with np.errstate(over="ignore", invalid="ignore"):
+            values = low.evaluate_batch(X).astype(np.float64)
+        expected = high.evaluate_batch(X)
+        finite = np.isfinite(values)
+        with np.errstate(invalid="ignore"):
+            errors = np.where(
+                finite,
+                np.abs(values - expected) / np.maximum(np.abs(expected), 1.0),
+                np.inf,
+            )
+        worst = int(np.argmax(errors))
+        reports.append(
+            PrecisionReport(
+                name,
+                low.dtype.name,
+                float(errors[worst]),
+                X[worst].astype(np.float64),
+                int(np.count_nonzero(~finite)),
+                bool(errors[worst] <= rtol),
+            )
+        )
+    return reports
+
+
+def unsafe(dtype=np.float32, **options) -> list:
+    """Names of the functions whose ``dtype`` evaluation fails ``validate``."""
+    return [r.name for r in validate(dtype=dtype, **options) if not r.safe]
@@ -0,0 +1,241 @@
+"""
+Single source of truth for the benchmark functions.
+
+Each kernel registers itself with the ``register`` decorator, which stores one
+FunctionRecord (bounds, optimum, modality, scaling and constraints). Kernel
+modules are only imported on first lookup: ``get`` imports the modules of
+MODULES in order until the name is found, while iterating and ``query`` load
+them all once.
+"""
+
+import importlib
+from collections.abc import Mapping
+from typing import Callable, NamedTuple
+import numpy as np
+
+# Kernel modules, in registry order.
+MODULES = (
+    "benchmarks.classical",
+    "benchmarks.multimodal",
+    "benchmarks.nonlinear",
+    "benchmarks.geometric",
+)
+
+MODALITIES = ("unimodal", "multimodal")
+
+# Value returned by the constrained functions at infeasible points.
+PENALTY = 1e6
+
+
+class Scaling(NamedTuple):
+    """
+    How a function extends to any number of dimensions.
+
+    ``interval`` and ``x_opt`` apply to every coordinate and each coordinate
+    adds ``f_opt`` to the optimum value.
+    """
+
+    interval: tuple
+    x_opt: float
+    f_opt: float
+    min_dim: int = 1
+
+
+class FunctionRecord(NamedTuple):
+    """
+    Metadata of a registered function.
+
+    ``constraints`` returns the inequality constraints g(x) <= 0 of a batch and
+    ``objective`` the objective at feasible points; both are None for
+    unconstrained functions. ``inplace`` is the optional in-place batch kernel
+    registered with ``register_inplace``.
+    """
+
+    name: str
+    func: Callable
+    bounds: np.ndarray
+    optimum: float
+    modality: str
+    scaling: Scaling = None
+    constraints: Callable = None
+    objective: Callable = None
+    inplace: Callable = None
+
+    @property
+    def dim(self) -> int:
+        return len(self.bounds)
+
+    @property
+    def scalable(self) -> bool:
+        return self.scaling is not None
+
+    @property
+    def constrained(self) -> bool:
+        return self.constraints is not None
+
+
+_RECORDS = {}
+_LOADED = set()
+_INDEX = {}
+
+# Record attributes that ``query`` can filter on.
+_INDEXED = ("modality", "dim", "scalable", "constrained")
+
+
+def register(
+    bounds,
+    optimum: float,
+    modality: str,
+    scaling: Scaling = None,
+    constraints: Callable = None,
+    objective: Callable = None,
+):
+    """
+    Decorator registering a kernel under its function name.
+
+    Parameters:
+        bounds (array-like): (lower, upper) pair of every coordinate at the
+            registered dimension.
+        optimum (float): Known global minimum at the registered dimension.
+        modality (str): "unimodal" or "multimodal".
+        scaling (Scaling, optional): Extension to other dimensions.
+        constraints (callable, optional): Inequality constraints g(x) <= 0,
+            returning shape (..., k).
+        objective (callable, optional): Objective evaluated at feasible points
+            of a constrained function.
+
+    Returns:
+        callable: Decorator returning the kernel unchanged.
+    """
+    if modality not in MODALITIES:
+        raise ValueError(f"Modality must be one of {MODALITIES}, got {modality!r}.")
+    if (constraints is None) != (objective is None):
+        raise ValueError("Constraints and objective must be given together.")
+
+    bounds = np.array(bounds, dtype=float)
+    bounds.flags.writeable = False
+
+    def decorator(func):
+        _RECORDS[func.__name__] = FunctionRecord(
+            func.__name__,
+            func,
+            bounds,
+            float(optimum),
+            modality,
+            scaling,
+            constraints,
+            objective,
+        )
+        _INDEX.clear()
+        return func
+
+    return decorator
+
+
+def register_inplace(kernel: Callable):
+    """
+    Decorator registering an in-place batch variant of a registered kernel.
+
+    The variant is called as ``func(X, out, work)`` with an (m, n) float batch
+    ``X``, the (m,) float array ``out`` to fill and a Workspace for its
+    temporaries, and returns ``out``. It must give the same values as
+    ``kernel(X)``.
+
+    Parameters:
+        kernel (callable): Kernel already decorated with ``register``.
+
+    Returns:
+        callable: Decorator returning the variant unchanged.
+    """
+
+    def decorator(func):
+        name = kernel.__name__
+        _RECORDS[name] = _RECORDS[name]._replace(inplace=func)
+        return func
+
+    return decorator
+
+
+def _load(module: str):
+    if module not in _LOADED:
+        importlib.import_module(module)
+        _LOADED.add(module)
+
+
+def get(name: str) -> FunctionRecord:
+    """
+    Record of a registered function, importing kernel modules as needed.
+
+    Raises:
+        KeyError: If no function of that name is registered.
+    """
+    for module in MODULES:
+        if name in _RECORDS:
+            break
+        _load(module)
+    return _RECORDS[name]
+
+
+def names() -> list:
+    """Every registered name, in registry order."""
+    for module in MODULES:
+        _load(module)
+    rank = {module: i for i, module in enumerate(MODULES)}
+    return sorted(
+        _RECORDS,
+        key=lambda name: rank.get(_RECORDS[name].func.__module__, len(MODULES)),
+    )
+
+
+def query(**criteria) -> list:
+    """
+    Names of the functions matching every criterion, in registry order.
+
+    Example: ``query(modality="multimodal", scalable=True)``.
+
+    Parameters:
+        **criteria: Values of ``modality``, ``dim``, ``scalable`` or
+            ``constrained``.
+
+    Returns:
+        list: Matching names.
+    """
+    unknown = set(criteria) - set(_INDEXED)
+    if unknown:
+        raise ValueError(f"Cannot query on {sorted(unknown)}; use one of {_INDEXED}.")
+
+    ordered = names()
+    if not _INDEX:
+        for field in _INDEXED:
+            _INDEX[field] = {}
+            for name in ordered:
+                value = getattr(_RECORDS[name], field)
+                _INDEX[field].setdefault(value, set()).add(name)
+
+    matches = set(ordered)
+    for field, value in criteria.items():
+        matches &= _INDEX[field].get(value, set())
+    return [name for name in ordered if name in matches]
+
+
+class RegistryView(Mapping):
+    """
+    Read-only ``{name: value}`` view of one attribute of the records.
+
+    Looking a name up only imports the modules needed to find it.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+
+    def __getitem__(self, name):
+        return getattr(get(name), self.field)
+
+    def __iter__(self):
+        return iter(names())
+
+    def __len__(self):
+        return len(names())
+
+    def __repr__(self):
+        return f"<RegistryView {self.field} of {len(self)} functions>"
@@ -0,0 +1,153 @@
+"""
+Out-of-core evaluation of sample designs stored on disk.
+
+``evaluate_file`` reads an (m, n) ``.npy`` file (or any array, such as an
+``np.memmap``) in blocks of ``block_size`` rows and writes the values to an
+(m,) ``.npy`` file opened as a memmap, so memory use depends on the block size
+and not on m. After each block the output is flushed and the index of the next
+block is saved next to it, in ``<output>.progress``, together with what
+identifies the run (function, dimension, dtype, source and block size); an
+interrupted run picks up from there when called again with the same inputs.
+"""
+
+import json
+import os
+import numpy as np
+from benchmarks.functions_registry import BenchmarkFunction
+
+DEFAULT_BLOCK_SIZE = 2**16
+
+
+def progress_path(output: str) -> str:
+    """Path of the progress file of ``output``."""
+    return f"{output}.progress"
+
+
+def read_progress(output: str):
+    """
+    Saved progress of an evaluation.
+
+    Returns:
+        dict or None: ``{"function", "dim", "dtype", "source", "shape", "rows",
+        "block_size", "next_block"}``, or None when ``output`` has no progress
+        file. ``source`` is the absolute path of the input file, or None when
+        an array was given.
+    """
+    try:
+        with open(progress_path(output), encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def _write_progress(output: str, progress: dict):
+    # Write then rename, so the file is never left half written.
+    path = progress_path(output)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+        json.dump(progress, file)
+    os.replace(f"{path}.tmp", path)
+
+
+def _evaluator(func, dim: int, dtype):
+    if isinstance(func, str):
+        func = BenchmarkFunction(func, dim=dim, dtype=dtype)
+    return getattr(func, "evaluate_batch", func), getattr(func, "dtype", dtype)
+
+
+def _function_name(func) -> str:
+    # Name of a registered function, BenchmarkFunction, ParallelEvaluator or
+    # plain callable.
+    if isinstance(func, str):
+        return func
+    func = getattr(func, "function", func)
+    return getattr(func, "name", None) or getattr(
+        func, "__qualname__", type(func).__qualname__
+    )
+
+
+def evaluate_file(
+    func,
+    source,
+    output: str,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    start_block: int = None,
+    dtype=np.float64,
+):
+    """
+    Evaluate every row of an on-disk batch, one block at a time.
+
+    Parameters:
+        func (str or callable): Registered function name, BenchmarkFunction,
+            ParallelEvaluator or any ``func(X, out=...)`` batch callable.
+        source (str or np.ndarray): Path of an (m, n) ``.npy`` file, opened as
+            a read-only memmap, or an (m, n) array.
+        output (str): Path of the (m,) ``.npy`` file of values.
+        block_size (int): Rows per block.
+        start_block (int, optional): Block to start from. By default a run
+            resumes after the last block saved in the progress file, or starts
+            from scratch when there is none; 0 always restarts.
+        dtype (data-type): Evaluation dtype when ``func`` is a name.
+
+    Returns:
+        np.memmap: The values, memory-mapped from ``output``.
+
+    Raises:
+        ValueError: If the input is not 2-D, or the saved progress belongs to
+            another run (function, dimension, dtype, source, number of rows
+            or block size) and ``start_block`` is not 0.
+    """
+    if block_size < 1:
+        raise ValueError(f"Block size must be positive, got {block_size}.")
+    X = np.load(source, mmap_mode="r") if isinstance(source, str) else source
+    if X.ndim != 2:
+        raise ValueError(f"Expected samples of shape (m, n), got {X.shape}.")
+    evaluate, dtype = _evaluator(func, X.shape[1], dtype)
+    rows = len(X)
+    n_blocks = -(-rows // block_size)
+    run = {
+        "function": _function_name(func),
+        "dim": X.shape[1],
+        "dtype": np.dtype(dtype).name,
+        "source": os.path.abspath(source) if isinstance(source, str) else None,
+        "shape": list(X.shape),
+        "rows": rows,
+        "block_size": block_size,
+    }
+
+    saved = read_progress(output)
+    if start_block != 0 and saved is not None:
+        different = sorted(k for k in run if saved.get(k) != run[k])
+        if different:
+            raise ValueError(
+                f"Cannot resume {output}: its progress was saved by another run "
+                f"(different {', '.join(different)}); pass start_block=0 to "
+                f"restart."
+            )
+    if start_block is None:
+        start_block = 0 if saved is None else saved["next_block"]
+    resume = start_block > 0
+    if resume and saved is None:
+        raise ValueError(f"Cannot resume {output}: it has no saved progress.")
+
+    if resume:
+        values = np.load(output, mmap_mode="r+")
+        if values.shape != (rows,) or values.dtype != dtype:
+            raise ValueError(
+                f"Cannot resume {output}: expected values of shape ({rows},) and "
+                f"dtype {np.dtype(dtype)}, got {values.shape} {values.dtype}."
+            )
+    else:
+        values = np.lib.format.open_memmap(
+            output, mode="w+", dtype=dtype, shape=(rows,)
+        )
+
+    progress = dict(run, next_block=start_block)
+    for block in range(start_block, n_blocks):
+        lo, hi = block * block_size, min((block + 1) * block_size, rows)
+        evaluate(X[lo:hi], out=values[lo:hi])
+        values.flush()
+        progress["next_block"] = block + 1
+        _write_progress(output, progress)
+    if not n_blocks:
+        _write_progress(output, progress)
+    return values
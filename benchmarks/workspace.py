@@ -0,0 +1,42 @@
+import numpy as np
+
+
+class Workspace:
+    """
+    Scratch arrays of the in-place batch kernels.
+
+    Each array is identified by a key and kept between calls; it is only
+    reallocated when a call needs a different shape or dtype, so evaluating
+    successive batches of the same size allocates nothing new. A workspace is
+    not thread-safe: concurrent evaluations need one workspace each.
+    """
+
+    def __init__(self):
+        self._arrays = {}
+
+    def array(self, key: str, shape: tuple, dtype=float) -> np.ndarray:
+        """
+        Uninitialized scratch array for ``key``.
+
+        Parameters:
+            key (str): Name of the array within the kernel.
+            shape (tuple): Required shape.
+            dtype (data-type): Required dtype.
+
+        Returns:
+            np.ndarray: Array of that shape and dtype, reused when possible.
+        """
+        array = self._arrays.get(key)
+        if array is None or array.shape != shape or array.dtype != dtype:
+            array = np.empty(shape, dtype=dtype)
+            self._arrays[key] = array
+        return array
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the scratch arrays."""
+        return sum(array.nbytes for array in self._arrays.values())
+
+    def clear(self):
+        """Release every scratch array."""
+        self._arrays.clear()
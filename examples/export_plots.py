@@ -0,0 +1,193 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+import numpy as np  # noqa: E402
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks import registry  # noqa: E402
+from benchmarks.functions_registry import FUNCTIONS, BenchmarkFunction  # noqa: E402
+from benchmarks.grid import evaluate_grid  # noqa: E402
+from benchmarks.grid_cache import GridCache  # noqa: E402
+
+FORMATS = ("png", "svg", "pdf")
+
+
+def downsample(X, Y, Z, max_points: int):
+    """
+    Every k-th row and column of a grid, keeping at most ``max_points`` per axis.
+
+    The last row and column are always kept so the surface spans the bounds.
+    """
+    rows = np.unique(
+        np.linspace(0, Z.shape[0] - 1, min(max_points, Z.shape[0]), dtype=int)
+    )
+    cols = np.unique(
+        np.linspace(0, Z.shape[1] - 1, min(max_points, Z.shape[1]), dtype=int)
+    )
+    index = np.ix_(rows, cols)
+    return X[index], Y[index], Z[index]
+
+
+def plot_values(f, X, Y, Z):
+    """
+    Grid values to draw: non-finite values and, for constrained functions, the
+    infeasible points are replaced by NaN so they are left blank.
+    """
+    keep = np.isfinite(Z)
+    if f.constrained:
+        points = np.column_stack([X.ravel(), Y.ravel()])
+        keep &= f.is_feasible(points).reshape(Z.shape)
+    return np.where(keep, Z, np.nan)
+
+
+def render(
+    name: str,
+    output_dir: str,
+    resolution: int = 500,
+    surface_resolution: int = 100,
+    fmt: str = "png",
+    dpi: int = 100,
+    cache_dir: str = None,
+) -> str:
+    """
+    Save the 3-D surface and contour figure of one 2-D function.
+
+    Parameters:
+        name (str): Registered function name.
+        output_dir (str): Directory of the image.
+        resolution (int): Grid points per axis of the contour plot.
+        surface_resolution (int): Maximum grid points per axis of the surface.
+        fmt (str): Image format, one of FORMATS.
+        dpi (int): Resolution of raster formats.
+        cache_dir (str, optional): Load and store grids in a GridCache there.
+
+    Returns:
+        str: Path of the image.
+    """
+    f = BenchmarkFunction(name)
+    if cache_dir is None:
+        X, Y, Z = evaluate_grid(f, f.bounds, resolution=resolution)
+    else:
+        X, Y, Z = GridCache(cache_dir).evaluate_grid(f, f.bounds, resolution=resolution)
+    Z = plot_values(f, X, Y, Z)
+    SX, SY, SZ = downsample(X, Y, Z, surface_resolution)
+
+    fig = plt.figure(figsize=(12, 6))
+    ax3d = fig.add_subplot(121, projection="3d")
+    ax3d.plot_surface(
+        SX, SY, SZ, cmap="viridis", alpha=0.8, rcount=SZ.shape[0], ccount=SZ.shape[1]
+    )
+    ax3d.set_title("3D Surface Plot")
+    ax3d.set_xlabel("X")
+    ax3d.set_ylabel("Y")
+    ax3d.set_zlabel("Z")
+
+    ax2d = fig.add_subplot(122)
+    contour = ax2d.contourf(X, Y, Z, levels=50, cmap="viridis")
+    fig.colorbar(contour, ax=ax2d)
+    ax2d.contour(X, Y, Z, colors="lightgrey", levels=10)
+    ax2d.set_title("2D Contour Plot")
+    ax2d.set_xlabel("X")
+    ax2d.set_ylabel("Y")
+
+    fig.suptitle(name)
+    fig.tight_layout()
+    path = os.path.join(output_dir, f"{name}.{fmt}")
+    fig.savefig(path, dpi=dpi)
+    plt.close(fig)
+    return path
+
+
+def plottable(names=None) -> list:
+    """Names of the 2-D functions among ``names`` (default: all of FUNCTIONS)."""
+    return [name for name in names or FUNCTIONS if registry.get(name).dim == 2]
+
+
+def export(names=None, output_dir: str = "figures", workers: int = None, **options):
+    """
+    Render every function on a process pool, one figure per task.
+
+    Parameters:
+        names (list, optional): Functions to render (default: every 2-D one).
+        output_dir (str): Directory of the images, created if missing.
+        workers (int, optional): Processes (default: every CPU); 1 renders
+            serially in this process.
+        **options: Passed to ``render``.
+
+    Returns:
+        dict: ``{name: path}`` of the saved images, in the order of ``names``.
+
+    Raises:
+        ValueError: If a function is not registered or not 2-D.
+    """
+    names = list(names) if names else plottable()
+    unknown = [name for name in names if name not in FUNCTIONS]
+    if unknown:
+        raise ValueError(f"Functions {unknown} not found in registry.")
+    flat = [name for name in names if name not in plottable(names)]
+    if flat:
+        raise ValueError(f"Only 2-D functions can be plotted, got {flat}.")
+    os.makedirs(output_dir, exist_ok=True)
+
+    if workers == 1:
+        return {name: render(name, output_dir, **options) for name in names}
+    paths = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(render, name, output_dir, **options): name for name in names
+        }
+        for future in as_completed(futures):
+            paths[futures[future]] = future.result()
+    return {name: paths[name] for name in names}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Exporta as figuras de superfície e contorno das funções."
+    )
+    parser.add_argument(
+        "--functions", nargs="+", help="Funções a exportar (padrão: todas as 2-D)."
+    )
+    parser.add_argument("--output", default="figures", help="Pasta das imagens.")
+    parser.add_argument("--format", choices=FORMATS, default="png")
+    parser.add_argument("--resolution", type=int, default=500)
+    parser.add_argument(
+        "--surface-resolution",
+        type=int,
+        default=100,
+        help="Pontos por eixo da malha da superfície 3D.",
+    )
+    parser.add_argument("--dpi", type=int, default=100)
+    parser.add_argument(
+        "--workers", type=int, help="Processos (padrão: todas as CPUs)."
+    )
+    parser.add_argument("--cache", help="Pasta do cache de grades avaliadas.")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    paths = export(
+        args.functions,
+        args.output,
+        workers=args.workers,
+        resolution=args.resolution,
+        surface_resolution=args.surface_resolution,
+        fmt=args.format,
+        dpi=args.dpi,
+        cache_dir=args.cache,
+    )
+    for path in paths.values():
+        print(f" - {path}")
+    print(
+        f"\n🖼️  {len(paths)} figuras exportadas em {time.perf_counter() - start:.1f} s."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import numpy as np
+from tabulate import tabulate
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks import functions_registry as reg
+from benchmarks.functions_registry import BenchmarkFunction
+
+DEFAULT_SIZES = (1, 100, 10_000)
+DEFAULT_DIMS = (None, 10, 100)
+DEFAULT_THRESHOLD = 0.25
+
+
+def time_per_call(call, min_time: float = 0.01, repeat: int = 5) -> float:
+    """
+    Best time of one call, in seconds.
+
+    The number of calls per measurement grows until a measurement lasts at
+    least ``min_time``; the best of ``repeat`` measurements is kept, which is
+    the estimate least affected by other load on the machine.
+    """
+    call()  # warm-up: first-call allocations and caches
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            call()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+
+def measure(names=None, dims=DEFAULT_DIMS, sizes=DEFAULT_SIZES, seed=0, **timing):
+    """
+    Single-point latency and batch throughput of registered functions.
+
+    Every function is measured at its registered dimension (``None`` in
+    ``dims``) and at each other dimension of ``dims`` it supports.
+
+    Parameters:
+        names (list, optional): Functions to measure (default: all of FUNCTIONS).
+        dims (tuple): Dimensions to measure.
+        sizes (tuple): Batch sizes for ``evaluate_batch``.
+        seed (int): Seed of the random evaluation points.
+        **timing: ``min_time`` and ``repeat`` passed to ``time_per_call``.
+
+    Returns:
+        dict: ``{"name/dN": {"latency_s": ..., "throughput": {size: points/s}}}``.
+    """
+    rng = np.random.default_rng(seed)
+    results = {}
+    for name in names or reg.FUNCTIONS:
+        for dim in dims:
+            try:
+                f = BenchmarkFunction(name, dim=dim)
+            except ValueError:
+                continue
+            key = f"{name}/d{f.dim}"
+            if key in results:
+                continue
+            lower, upper = f.bounds[:, 0], f.bounds[:, 1]
+            X = rng.uniform(lower, upper, size=(max(sizes), f.dim))
+            x = X[0]
+            results[key] = {
+                "latency_s": time_per_call(lambda: f(x), **timing),
+                "throughput": {
+                    str(size): size
+                    / time_per_call(lambda: f.evaluate_batch(X[:size]), **timing)
+                    for size in sizes
+                },
+            }
+    return results
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD):
+    """
+    Measurements slower than the baseline by more than ``threshold``.
+
+    Parameters:
+        baseline (dict): Results of ``measure`` taken as reference.
+        current (dict): Results of ``measure`` to check.
+        threshold (float): Allowed relative slowdown (0.25 = 25 %).
+
+    Returns:
+        list: ``(key, metric, baseline, current, slowdown)`` tuples, where
+        ``slowdown`` is the relative increase of time per point.
+    """
+    regressions = []
+    for key in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[key], current[key]
+        slowdown = new["latency_s"] / old["latency_s"] - 1
+        if slowdown > threshold:
+            regressions.append(
+                (key, "latency_s", old["latency_s"], new["latency_s"], slowdown)
+            )
+        for size in sorted(
+            old["throughput"].keys() & new["throughput"].keys(), key=int
+        ):
+            before, after = old["throughput"][size], new["throughput"][size]
+            slowdown = before / after - 1
+            if slowdown > threshold:
+                regressions.append(
+                    (key, f"throughput[{size}]", before, after, slowdown)
+                )
+    return regressions
+
+
+def environment() -> dict:
+    """Versions and machine the measurements were taken on."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+    }
+
+
+def print_results(results: dict):
+    sizes = sorted(
+        {size for r in results.values() for size in r["throughput"]}, key=int
+    )
+    table = [
+        [key, f"{r['latency_s'] * 1e6:.2f}"]
+        + [f"{r['throughput'][size]:.3g}" for size in sizes]
+        for key, r in results.items()
+    ]
+    headers = ["Function", "Latency (µs)"] + [f"Points/s @ {size}" for size in sizes]
+    print("\n⏱️  Microbenchmark das Funções\n")
+    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+
+
+def print_regressions(regressions: list, threshold: float):
+    if not regressions:
+        print(f"\n✅ Nenhuma regressão acima de {threshold:.0%}.")
+        return
+    table = [
+        [key, metric, f"{before:.3g}", f"{after:.3g}", f"{slowdown:+.0%}"]
+        for key, metric, before, after, slowdown in regressions
+    ]
+    print(f"\n❌ Regressões acima de {threshold:.0%}\n")
+    print(
+        tabulate(
+            table,
+            headers=["Function", "Metric", "Baseline", "Current", "Slowdown"],
+            tablefmt="fancy_grid",
+        )
+    )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Latência e vazão das funções objetivo registradas."
+    )
+    parser.add_argument(
+        "--functions", nargs="+", help="Funções a medir (padrão: todas)."
+    )
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--dims", nargs="*", type=int, default=[10, 100])
+    parser.add_argument("--output", help="Arquivo JSON onde salvar as medições.")
+    parser.add_argument("--baseline", help="Arquivo JSON de referência para comparar.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--min-time", type=float, default=0.01)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    results = measure(
+        args.functions,
+        dims=[None, *args.dims],
+        sizes=args.sizes,
+        min_time=args.min_time,
+        repeat=args.repeat,
+    )
+    print_results(results)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(
+                {"environment": environment(), "results": results}, file, indent=2
+            )
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)["results"]
+        regressions = compare(baseline, results, args.threshold)
+        print_regressions(regressions, args.threshold)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+import inspect
+from abc import ABC, abstractmethod
+import numpy as np
+from scipy.optimize import differential_evolution, minimize
+from .nelder_mead import multistart_nelder_mead
+from .population import cma_es, particle_swarm, vectorized_differential_evolution
+
+DE_MODES = ("serial", "vectorized", "workers", "auto")
+
+OPTIMIZERS = {}
+
+
+class OptimizerAdapter(ABC):
+    """
+    Uniform interface between an optimization method and the benchmark runners.
+
+    Subclasses set ``name`` and the default ``options`` passed to the method,
+    and are made available to every runner with ``register_optimizer``.
+    """
+
+    name = None
+    options = {}
+
+    @abstractmethod
+    def minimize(self, func, bounds, seed, settings):
+        """
+        Minimize ``func`` over ``bounds``.
+
+        Parameters:
+            func (callable): Objective; batch-capable adapters use its
+                ``evaluate_batch`` method.
+            bounds (list): (lower, upper) pair of every coordinate.
+            seed (int): Seed of all the randomness of the run.
+            settings (dict): Runner settings (``de_mode``, ...).
+
+        Returns:
+            OptimizeResult: At least ``fun``.
+        """
+
+
+def register_optimizer(cls):
+    """Class decorator adding an adapter instance to OPTIMIZERS under its name."""
+    OPTIMIZERS[cls.name] = cls()
+    return cls
+
+
+def get_optimizer(name: str) -> OptimizerAdapter:
+    """Registered adapter called ``name``."""
+    try:
+        return OPTIMIZERS[name]
+    except KeyError:
+        raise ValueError(f"Otimizador {name} não suportado.") from None
+
+
+def supports_batch(func, bounds) -> bool:
+    """Whether ``func`` maps an (m, n) batch of points to m values."""
+    if hasattr(func, "evaluate_batch"):
+        return True
+    probe = np.tile(np.mean(bounds, axis=1), (2, 1))
+    try:
+        return np.shape(func(probe)) == (2,)
+    except Exception:
+        return False
+
+
+def resolve_de_mode(func, bounds, mode="auto", constrained=None) -> str:
+    """
+    DE mode to run: ``mode`` itself, or for ``"auto"`` either ``"vectorized"``
+    or ``"serial"``.
+
+    ``"auto"`` stays serial for constrained functions: with deferred updating,
+    a first population that is entirely infeasible has the same penalty value
+    everywhere, and SciPy then reports convergence at once.
+
+    Parameters:
+        func (callable): Untimed objective, probed with ``supports_batch``.
+        bounds (list): (lower, upper) pair of every coordinate.
+        mode (str): One of DE_MODES.
+        constrained (bool, optional): Whether the function has constraints
+            (default: its ``constrained`` attribute, if any).
+
+    Returns:
+        str: One of DE_MODES other than ``"auto"``.
+    """
+    if mode != "auto":
+        return mode
+    if constrained is None:
+        constrained = getattr(func, "constrained", False)
+    if constrained or not supports_batch(func, bounds):
+        return "serial"
+    return "vectorized"
+
+
+def _population_objective(func):
+    # vectorized=True passes the population as (n, S): one point per column.
+    def objective(X):
+        return func.evaluate_batch(np.asarray(X).T)
+
+    return objective
+
+
+def _population_map(func):
+    # Map-like ``workers`` callable: the whole population in one batched call.
+    def map_population(_, points):
+        return func.evaluate_batch(np.asarray(list(points)))
+
+    return map_population
+
+
+def de_arguments(func, bounds, mode="serial"):
+    """
+    Objective and extra options of differential_evolution for a DE mode.
+
+    ``"serial"`` calls ``func`` once per point with immediate updating (SciPy's
+    default). ``"vectorized"`` uses SciPy's ``vectorized=True`` and
+    ``"workers"`` a map-like ``workers`` callable; both evaluate each
+    generation in a single ``func.evaluate_batch`` call with deferred
+    updating. ``"auto"`` is resolved by ``resolve_de_mode`` on the objective
+    wrapped by ``func``, so the probe is neither timed nor counted.
+
+    Parameters:
+        func (callable): Objective with an ``evaluate_batch`` method, such as
+            BudgetedFunction.
+        bounds (list): (lower, upper) pair of every coordinate.
+        mode (str): One of DE_MODES.
+
+    Returns:
+        tuple: (objective, options) to pass to differential_evolution.
+    """
+    if mode == "auto":
+        mode = resolve_de_mode(inspect.unwrap(getattr(func, "func", func)), bounds)
+    if mode == "serial":
+        return func, {}
+    if mode == "vectorized":
+        return _population_objective(func), {"vectorized": True, "updating": "deferred"}
+    if mode == "workers":
+        return func, {"workers": _population_map(func), "updating": "deferred"}
+    raise ValueError(f"Modo {mode} do differential_evolution não suportado.")
+
+
+def _starts(bounds, seed, n_starts=None):
+    lower, upper = zip(*bounds)
+    size = None if n_starts is None else (n_starts, len(bounds))
+    return np.random.default_rng(seed).uniform(low=lower, high=upper, size=size)
+
+
+@register_optimizer
+class DifferentialEvolution(OptimizerAdapter):
+    """SciPy's differential_evolution, evaluated as selected by ``de_mode``."""
+
+    name = "differential_evolution"
+    options = {"strategy": "best1bin", "tol": 1e-6, "maxiter": 1000}
+
+    def minimize(self, func, bounds, seed, settings):
+        objective, mode_options = de_arguments(
+            func, bounds, settings.get("de_mode", "serial")
+        )
+        return differential_evolution(
+            objective, bounds=bounds, seed=seed, **self.options, **mode_options
+        )
+
+
+@register_optimizer
+class NelderMead(OptimizerAdapter):
+    """SciPy's Nelder-Mead from a random starting point."""
+
+    name = "nelder_mead"
+    options = {"maxiter": 1000, "fatol": 1e-6}
+
+    def minimize(self, func, bounds, seed, settings):
+        return minimize(
+            func, _starts(bounds, seed), method="Nelder-Mead", options=self.options
+        )
+
+
+@register_optimizer
+class MultiStartNelderMead(OptimizerAdapter):
+    """Lockstep batched Nelder-Mead from ``n_starts`` random starting points."""
+
+    name = "multistart_nelder_mead"
+    options = {"n_starts": 100, "maxiter": 1000, "fatol": 1e-6}
+
+    def minimize(self, func, bounds, seed, settings):
+        options = dict(self.options)
+        x0 = _starts(bounds, seed, options.pop("n_starts"))
+        return multistart_nelder_mead(func, x0, bounds, **options)
+
+
+@register_optimizer
+class ParticleSwarm(OptimizerAdapter):
+    """Pure-NumPy global-best particle swarm."""
+
+    name = "particle_swarm"
+    options = {"n_particles": 40, "maxiter": 1000, "tol": 1e-6}
+
+    def minimize(self, func, bounds, seed, settings):
+        return particle_swarm(func, bounds, seed, **self.options)
+
+
+@register_optimizer
+class CMAES(OptimizerAdapter):
+    """Pure-NumPy CMA-ES."""
+
+    name = "cma_es"
+    options = {"sigma0": 0.3, "maxiter": 1000}
+
+    def minimize(self, func, bounds, seed, settings):
+        return cma_es(func, bounds, seed, **self.options)
+
+
+@register_optimizer
+class VectorizedDifferentialEvolution(OptimizerAdapter):
+    """Pure-NumPy DE/best/1/bin evaluating each generation in one call."""
+
+    name = "vectorized_de"
+    options = {"popsize": 15, "tol": 1e-6, "maxiter": 1000}
+
+    def minimize(self, func, bounds, seed, settings):
+        return vectorized_differential_evolution(func, bounds, seed, **self.options)
@@ -0,0 +1,187 @@
+import math
+
+
+class RunningStats:
+    """Count, mean, standard deviation, minimum and maximum in O(1) memory (Welford)."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (0.0 for fewer than two values)."""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class P2Quantile:
+    """
+    Streaming estimate of the p-quantile with the P² algorithm (Jain & Chlamtac).
+
+    Keeps five markers whatever the number of observations; the estimate is exact
+    for up to five values.
+
+    Parameters:
+        p (float): Quantile to track, in (0, 1).
+    """
+
+    def __init__(self, p: float = 0.5):
+        self.p = p
+        self.count = 0
+        self._heights = []
+        self._positions = [1, 2, 3, 4, 5]
+        self._desired = [1, 1 + 2 * p, 1 + 4 * p, 3 + 2 * p, 5]
+        self._increments = [0, p / 2, p, (1 + p) / 2, 1]
+
+    def add(self, value: float):
+        self.count += 1
+        q, n = self._heights, self._positions
+        if self.count <= 5:
+            q.append(value)
+            q.sort()
+            return
+
+        if value < q[0]:
+            q[0] = value
+            k = 0
+        elif value >= q[4]:
+            q[4] = value
+            k = 3
+        else:
+            k = next(i for i in range(4) if q[i] <= value < q[i + 1])
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                d = 1 if d > 0 else -1
+                height = self._parabolic(i, d)
+                if not q[i - 1] < height < q[i + 1]:
+                    height = q[i] + d * (q[i + d] - q[i]) / (n[i + d] - n[i])
+                q[i] = height
+                n[i] += d
+
+    def _parabolic(self, i, d):
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    @property
+    def value(self) -> float:
+        """Current estimate (nan before any observation)."""
+        if self.count == 0:
+            return math.nan
+        if self.count <= 5:
+            position = self.p * (self.count - 1)
+            low = math.floor(position)
+            high = min(low + 1, self.count - 1)
+            q = self._heights
+            return q[low] + (position - low) * (q[high] - q[low])
+        return self._heights[2]
+
+
+class PairSummary:
+    """Streaming statistics of every run of one (function, optimizer) pair."""
+
+    def __init__(self):
+        self.fun = RunningStats()
+        self.median = P2Quantile(0.5)
+        self.nfev = RunningStats()
+        self.time = RunningStats()
+        self.objective_time = RunningStats()
+        self.evals_to_target = RunningStats()
+        self.successes = 0
+
+    def add(self, result: dict):
+        self.fun.add(float(result["fun"]))
+        self.median.add(float(result["fun"]))
+        if result.get("nfev") is not None:
+            self.nfev.add(float(result["nfev"]))
+        self.time.add(float(result["time"]))
+        if result.get("objective_time") is not None:
+            self.objective_time.add(float(result["objective_time"]))
+        if result.get("evals_to_target") is not None:
+            self.evals_to_target.add(float(result["evals_to_target"]))
+        self.successes += bool(result["success"])
+
+    @property
+    def runs(self) -> int:
+        return self.fun.count
+
+    @property
+    def success_rate(self) -> float:
+        return self.successes / self.runs if self.runs else 0.0
+
+
+class ResultAggregator:
+    """
+    Per-(function, optimizer) statistics updated as results arrive.
+
+    Memory is constant per pair regardless of the number of runs, and the tables
+    can be read at any point of a sweep.
+    """
+
+    HEADERS = [
+        "Function",
+        "Optimizer",
+        "Runs",
+        "Best",
+        "Mean",
+        "Median",
+        "Std",
+        "Success (%)",
+        "Mean nfev",
+        "Mean time (s)",
+        "Objective (s)",
+        "Evals to target",
+    ]
+
+    def __init__(self):
+        self.pairs = {}
+
+    def add(self, result: dict):
+        """Account for one result record."""
+        key = (result["function"], result["optimizer"])
+        if key not in self.pairs:
+            self.pairs[key] = PairSummary()
+        self.pairs[key].add(result)
+
+    def rows(self):
+        """One row per pair, in order of first appearance, matching HEADERS."""
+        return [
+            [
+                func_name,
+                optimizer_name,
+                summary.runs,
+                summary.fun.min,
+                summary.fun.mean,
+                summary.median.value,
+                summary.fun.std,
+                100 * summary.success_rate,
+                summary.nfev.mean if summary.nfev.count else None,
+                summary.time.mean,
+                summary.objective_time.mean if summary.objective_time.count else None,
+                (
+                    summary.evals_to_target.mean
+                    if summary.evals_to_target.count
+                    else None
+                ),
+            ]
+            for (func_name, optimizer_name), summary in self.pairs.items()
+        ]
@@ -1,22 +1,28 @@
 import os
 import sys
+from .adapters import OPTIMIZERS
+from .aggregator import ResultAggregator
 from .optimizers import SciPyOptimizer
-from .printer import print_results
+from .printer import print_summary
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 from benchmarks import functions_registry as reg
 
 
 def main():
+    aggregator = ResultAggregator()
     runner = SciPyOptimizer(
         functions=reg.FUNCTIONS,
         bounds=reg.BOUNDS,
         known_results=reg.RESULTS,
-        optimizers=["differential_evolution", "nelder_mead"],
+        optimizers=list(OPTIMIZERS),
         n_runs=5,
+        aggregator=aggregator,
+        keep_results=False,
+        de_mode="auto",
     )
     runner.run()
-    print_results(runner.results)
+    print_summary(aggregator)
 
 
 if __name__ == "__main__":
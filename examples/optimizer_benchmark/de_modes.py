@@ -0,0 +1,50 @@
+import os
+import sys
+from .optimizers import SciPyOptimizer
+from .printer import print_mode_comparison
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from benchmarks import functions_registry as reg
+
+MODES = ["serial", "vectorized", "workers"]
+
+
+def compare_modes(functions, n_runs=3, modes=MODES):
+    """
+    Run differential_evolution on ``functions`` once per DE mode.
+
+    Returns:
+        list: One row per mode: mode, runs, total time, objective time, mean
+        nfev and success rate (%).
+    """
+    rows = []
+    for mode in modes:
+        runner = SciPyOptimizer(
+            functions=functions,
+            bounds=reg.BOUNDS,
+            known_results=reg.RESULTS,
+            optimizers=["differential_evolution"],
+            n_runs=n_runs,
+            de_mode=mode,
+        )
+        runner.run()
+        results = runner.results
+        rows.append(
+            [
+                mode,
+                len(results),
+                sum(r["time"] for r in results),
+                sum(r["objective_time"] for r in results),
+                sum(r["nfev"] for r in results) / len(results),
+                100 * sum(bool(r["success"]) for r in results) / len(results),
+            ]
+        )
+    return rows
+
+
+def main():
+    print_mode_comparison(compare_modes(reg.FUNCTIONS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+
+def _initial_simplexes(x0, nonzdelt=0.05, zdelt=0.00025):
+    # Same initial simplex as SciPy's Nelder-Mead, built for every start at once.
+    n_starts, n = x0.shape
+    sim = np.repeat(x0[:, None, :], n + 1, axis=1)
+    axes = np.arange(n)
+    vertex = sim[:, axes + 1, axes]
+    sim[:, axes + 1, axes] = np.where(vertex != 0, (1 + nonzdelt) * vertex, zdelt)
+    return sim
+
+
+def multistart_nelder_mead(
+    func,
+    x0,
+    bounds=None,
+    xatol: float = 1e-4,
+    fatol: float = 1e-4,
+    maxiter: int = None,
+    maxfev: int = None,
+    rho: float = 1.0,
+    chi: float = 2.0,
+    psi: float = 0.5,
+    sigma: float = 0.5,
+):
+    """
+    Nelder-Mead from K starting points, advancing all simplexes in lockstep.
+
+    Every simplex follows the same rules as SciPy's Nelder-Mead (reflection,
+    expansion, outside/inside contraction and shrink, with the same
+    convergence test, clipping to ``bounds`` when given), but each phase of
+    an iteration evaluates the trial points of all active simplexes in a
+    single batched call. A simplex leaves the active mask once it converges
+    or reaches ``maxiter``/``maxfev``.
+
+    Parameters:
+        func (callable): Objective; its ``evaluate_batch`` is used when
+            available, otherwise it is called with (m, n) arrays.
+        x0 (np.ndarray): Starting points of shape (K, n).
+        bounds (list, optional): (lower, upper) pair of every coordinate.
+        xatol (float): Absolute tolerance on the simplex vertices.
+        fatol (float): Absolute tolerance on the simplex values.
+        maxiter (int, optional): Iterations per simplex.
+        maxfev (int, optional): Evaluations per simplex. As in SciPy, both
+            default to 200 * n when neither is given and are otherwise
+            unlimited.
+        rho, chi, psi, sigma (float): Reflection, expansion, contraction and
+            shrink coefficients.
+
+    Returns:
+        OptimizeResult: ``x`` and ``fun`` of the best start, total ``nfev``,
+        ``nit`` of the longest start, and per-start ``xs`` (K, n), ``funs``
+        (K,), ``nits`` (K,) and ``converged`` (K,).
+    """
+    evaluate = getattr(func, "evaluate_batch", func)
+    x0 = np.atleast_2d(np.asarray(x0, dtype=float))
+    n_starts, n = x0.shape
+    if maxiter is None and maxfev is None:
+        maxiter = maxfev = 200 * n
+    maxiter = np.inf if maxiter is None else maxiter
+    maxfev = np.inf if maxfev is None else maxfev
+
+    if bounds is None:
+        lower, upper = -np.inf, np.inf
+    else:
+        lower, upper = np.asarray(bounds, dtype=float).T
+        x0 = np.clip(x0, lower, upper)
+
+    sim = _initial_simplexes(x0)
+    if bounds is not None:
+        # Reflect vertices past the upper bound inside rather than collapsing them.
+        sim = np.clip(np.where(sim > upper, 2 * upper - sim, sim), lower, upper)
+    fsim = np.asarray(evaluate(sim.reshape(-1, n)), dtype=float).reshape(n_starts, -1)
+    fev = np.full(n_starts, n + 1)
+    nit = np.zeros(n_starts, dtype=int)
+    converged = np.zeros(n_starts, dtype=bool)
+    active = np.ones(n_starts, dtype=bool)
+
+    while True:
+        order = np.argsort(fsim, axis=1)
+        sim = np.take_along_axis(sim, order[:, :, None], axis=1)
+        fsim = np.take_along_axis(fsim, order, axis=1)
+        converged = (np.max(np.abs(sim[:, 1:] - sim[:, :1]), axis=(1, 2)) <= xatol) & (
+            np.max(np.abs(fsim[:, 1:] - fsim[:, :1]), axis=1) <= fatol
+        )
+        active &= ~converged & (nit < maxiter) & (fev < maxfev)
+        if not active.any():
+            break
+
+        idx = np.flatnonzero(active)
+        S, F = sim[idx], fsim[idx]
+        xbar = np.add.reduce(S[:, :-1], axis=1) / n
+        worst = S[:, -1]
+
+        # Phase 1: reflection of every active simplex.
+        xr = np.clip((1 + rho) * xbar - rho * worst, lower, upper)
+        fr = np.asarray(evaluate(xr), dtype=float)
+        fev[idx] += 1
+        new_x, new_f = xr, fr
+
+        # Phase 2: expansion or contraction where the reflection alone does not do.
+        expand = fr < F[:, 0]
+        outside = ~expand & (fr >= F[:, -2]) & (fr < F[:, -1])
+        inside = ~expand & (fr >= F[:, -1])
+        shrink = np.zeros(len(idx), dtype=bool)
+        second = np.flatnonzero(expand | outside | inside)
+        if second.size:
+            e, o = expand[second, None], outside[second, None]
+            b, w = xbar[second], worst[second]
+            trial = np.where(
+                e,
+                (1 + rho * chi) * b - rho * chi * w,
+                np.where(
+                    o, (1 + psi * rho) * b - psi * rho * w, (1 - psi) * b + psi * w
+                ),
+            )
+            trial = np.clip(trial, lower, upper)
+            ft = np.asarray(evaluate(trial), dtype=float)
+            fev[idx[second]] += 1
+            accept = np.where(
+                expand[second],
+                ft < fr[second],
+                np.where(outside[second], ft <= fr[second], ft < F[second, -1]),
+            )
+            new_x[second[accept]] = trial[accept]
+            new_f[second[accept]] = ft[accept]
+            shrink[second] = ~expand[second] & ~accept
+
+        keep = ~shrink
+        S[keep, -1] = new_x[keep]
+        F[keep, -1] = new_f[keep]
+
+        # Phase 3: shrink towards the best vertex.
+        h = np.flatnonzero(shrink)
+        if h.size:
+            S[h, 1:] = np.clip(S[h, :1] + sigma * (S[h, 1:] - S[h, :1]), lower, upper)
+            values = evaluate(S[h, 1:].reshape(-1, n))
+            F[h, 1:] = np.asarray(values, dtype=float).reshape(h.size, n)
+            fev[idx[h]] += n
+
+        sim[idx], fsim[idx] = S, F
+        nit[idx] += 1
+
+    best = int(np.argmin(fsim[:, 0]))
+    return OptimizeResult(
+        x=sim[best, 0].copy(),
+        fun=float(fsim[best, 0]),
+        nfev=int(fev.sum()),
+        nit=int(nit.max()),
+        success=bool(converged[best]),
+        xs=sim[:, 0].copy(),
+        funs=fsim[:, 0].copy(),
+        nits=nit,
+        converged=converged,
+    )
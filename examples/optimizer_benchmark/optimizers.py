@@ -1,66 +1,205 @@
+import os
+import sys
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import numpy as np
-from scipy.optimize import differential_evolution, minimize
+from .adapters import DE_MODES, get_optimizer, resolve_de_mode
 from .base import BenchmarkRunner
 from .printer import progress
+from .store import ResultStore, run_key
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from benchmarks import registry
+from benchmarks.budget import BudgetedFunction, StopEvaluation
+from benchmarks.instrumentation import EvaluationStats, timed
+
+
+def run_task(func_name, func, bounds, true_val, optimizer_name, seed, settings=None):
+    """
+    Run one registered optimizer once on one function with its options.
+
+    All randomness, including the Nelder-Mead starting point, is drawn from
+    ``seed`` so a task gives the same result in any process and in any order.
+    Time spent inside ``func`` is reported separately from the optimizer's own
+    overhead. ``settings`` may set ``max_evals`` (evaluation budget) and
+    ``stop_on_target`` (abort once ``true_val`` is reached); an aborted run
+    reports the best point evaluated so far. ``de_mode`` selects how
+    differential_evolution evaluates its population (see
+    ``adapters.de_arguments``); ``"auto"`` is resolved here, before ``func``
+    is timed and budgeted, so probing it does not count as an evaluation.
+
+    Returns:
+        dict: Result record of the run.
+    """
+    settings = settings or {}
+    optimizer = get_optimizer(optimizer_name)
+    if settings.get("de_mode") == "auto":
+        constrained = (
+            func_name in registry.names() and registry.get(func_name).constrained
+        )
+        mode = resolve_de_mode(func, bounds, constrained=constrained)
+        settings = dict(settings, de_mode=mode)
+    stats = EvaluationStats()
+    func = BudgetedFunction(
+        timed(func, stats),
+        max_evals=settings.get("max_evals"),
+        target=true_val,
+        stop_on_target=settings.get("stop_on_target", False),
+    )
+    stopped = None
+    start = time.perf_counter()
+    try:
+        result = optimizer.minimize(func, bounds, seed, settings)
+        fun = result.fun
+    except StopEvaluation as stop:
+        fun = func.best_value
+        stopped = type(stop).__name__
+
+    end = time.perf_counter()
+    return {
+        "function": func_name,
+        "optimizer": optimizer_name,
+        "fun": fun,
+        "nfev": func.nfev,
+        "time": end - start,
+        "objective_time": stats.total_time,
+        "overhead_time": end - start - stats.total_time,
+        "success": np.isclose(fun, true_val, atol=1e-6, rtol=1e-6),
+        "evals_to_target": func.evals_to_target,
+        "stopped": stopped,
+    }
 
 
 class SciPyOptimizer(BenchmarkRunner):
-    def __init__(self, functions, bounds, known_results, optimizers, n_runs=5):
+    """
+    Benchmark registered optimizers (see ``adapters.OPTIMIZERS``) over a set
+    of functions.
+
+    With ``workers`` other than 1 the (function, optimizer, run) tasks run on a
+    process pool of that many processes (None uses every CPU); results keep the
+    serial order. With ``store`` (a path or ResultStore) every finished run is
+    appended to disk, and runs already in the store are not executed again.
+    Every result is also fed to ``aggregator`` (a ResultAggregator) as it
+    arrives; ``keep_results=False`` then avoids holding the full list in
+    ``results``. ``max_evals`` gives every optimizer the same evaluation budget
+    and ``stop_on_target`` ends a run as soon as the known optimum is reached.
+    ``de_mode`` (one of DE_MODES) lets differential_evolution evaluate each
+    generation in one batched call instead of one call per point.
+    """
+
+    def __init__(
+        self,
+        functions,
+        bounds,
+        known_results,
+        optimizers,
+        n_runs=5,
+        workers=1,
+        store=None,
+        aggregator=None,
+        keep_results=True,
+        max_evals=None,
+        stop_on_target=False,
+        de_mode="serial",
+    ):
         super().__init__(functions, bounds, known_results, n_runs)
         self.optimizers = optimizers
+        self.workers = workers
+        self.store = ResultStore(store) if isinstance(store, str) else store
+        self.aggregator = aggregator
+        self.keep_results = keep_results
+        if de_mode not in DE_MODES:
+            raise ValueError(f"Modo {de_mode} do differential_evolution não suportado.")
+        self.settings = {
+            "max_evals": max_evals,
+            "stop_on_target": stop_on_target,
+            "de_mode": de_mode,
+        }
+
+    def tasks(self):
+        """(function, optimizer, run) tasks in serial execution order."""
+        return [
+            (
+                func_name,
+                self.functions[func_name],
+                self.bounds[func_name],
+                self.known_results[func_name],
+                optimizer_name,
+                run,
+                self.settings,
+            )
+            for func_name in self.functions
+            for optimizer_name in self.optimizers
+            for run in range(self.n_runs)
+        ]
+
+    @staticmethod
+    def task_key(args):
+        """
+        Store key of a task: hash of function, optimizer, seed and config.
+
+        The options are read from the registered adapter when the key is built,
+        so adapters registered or reconfigured later are keyed correctly.
+        """
+        func_name, _, bounds, _, optimizer_name, seed, settings = args
+        config = {
+            "bounds": bounds,
+            "options": get_optimizer(optimizer_name).options,
+            "settings": settings,
+        }
+        return run_key(func_name, optimizer_name, seed, config)
 
     def run(self):
-        total = len(self.functions) * len(self.optimizers) * self.n_runs
+        tasks = self.tasks()
+        keys = [self.task_key(args) for args in tasks]
+        results = [None] * len(tasks) if self.keep_results else None
+        pending = []
+
+        def finish(index, result, stored=False):
+            if results is not None:
+                results[index] = result
+            if self.store is not None and not stored:
+                self.store.append(keys[index], result)
+            if self.aggregator is not None:
+                self.aggregator.add(result)
+
+        for index, key in enumerate(keys):
+            if self.store is not None and key in self.store:
+                finish(index, self.store[key], stored=True)
+            else:
+                pending.append(index)
+
         with progress:
-            task = progress.add_task("[green]Benchmarking", total=total)
-
-            for func_name in self.functions:
-                func = self.functions[func_name]
-                bounds = self.bounds[func_name]
-                true_val = self.known_results[func_name]
-                lower, upper = zip(*bounds)
-
-                for optimizer_name in self.optimizers:
-                    progress.update(
-                        task,
-                        description=f"[green]Rodando: [yellow]{func_name} + {optimizer_name}",
-                    )
-                    for run in range(self.n_runs):
-                        start = time.time()
-                        if optimizer_name == "differential_evolution":
-                            result = differential_evolution(
-                                func,
-                                bounds=bounds,
-                                strategy="best1bin",
-                                tol=1e-6,
-                                maxiter=1000,
-                                seed=run,
-                            )
-                        elif optimizer_name == "nelder_mead":
-                            x0 = np.random.uniform(low=lower, high=upper)
-                            result = minimize(
-                                func,
-                                x0,
-                                method="Nelder-Mead",
-                                options={"maxiter": 1000, "fatol": 1e-6},
-                            )
-                        else:
-                            raise ValueError(
-                                f"Otimizador {optimizer_name} não suportado."
-                            )
-
-                        end = time.time()
-                        self.results.append(
-                            {
-                                "function": func_name,
-                                "optimizer": optimizer_name,
-                                "fun": result.fun,
-                                "nfev": getattr(result, "nfev", None),
-                                "time": end - start,
-                                "success": np.isclose(
-                                    result.fun, true_val, atol=1e-6, rtol=1e-6
-                                ),
-                            }
-                        )
-                        progress.update(task, advance=1)
+            task = progress.add_task(
+                "[green]Benchmarking",
+                total=len(tasks),
+                completed=len(tasks) - len(pending),
+            )
+            if self.workers == 1:
+                self._run_serial(tasks, pending, finish, task)
+            else:
+                self._run_parallel(tasks, pending, finish, task)
+        if results is not None:
+            self.results.extend(results)
+
+    def _run_serial(self, tasks, pending, finish, task):
+        for index in pending:
+            func_name, optimizer_name = tasks[index][0], tasks[index][4]
+            progress.update(
+                task,
+                description=f"[green]Rodando: [yellow]{func_name} + {optimizer_name}",
+            )
+            finish(index, run_task(*tasks[index]))
+            progress.update(task, advance=1)
+
+    def _run_parallel(self, tasks, pending, finish, task):
+        progress.update(
+            task, description=f"[green]Rodando em [yellow]{self.workers} processos"
+        )
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(run_task, *tasks[index]): index for index in pending
+            }
+            for future in as_completed(futures):
+                finish(futures[future], future.result())
+                progress.update(task, advance=1)
@@ -0,0 +1,341 @@
+import numpy as np
+from scipy.optimize import OptimizeResult
+
+# The population methods work in the unit hypercube and map every generation to
+# the search box with ``_scale`` before its single batched evaluation.
+
+
+def _unit_box(bounds):
+    bounds = np.asarray(bounds, dtype=float)
+    lower, upper = bounds[:, 0], bounds[:, 1]
+    return lower, upper - lower
+
+
+def _scale(U, lower, span, out):
+    np.multiply(U, span, out=out)
+    out += lower
+    return out
+
+
+def _evaluator(func):
+    evaluate = getattr(func, "evaluate_batch", func)
+
+    def batch(X):
+        return np.asarray(evaluate(X), dtype=float).reshape(len(X))
+
+    return batch
+
+
+def _partners(rng, members):
+    # Two distinct partners per member, both different from the member, drawn
+    # in O(size): indices in [0, size - 1) skip the member's own index and
+    # r2 is redrawn where it equals r1.
+    size = len(members)
+    r1 = rng.integers(0, size - 1, size=size)
+    r1 += r1 >= members
+    r2 = rng.integers(0, size - 1, size=size)
+    r2 += r2 >= members
+    collide = np.flatnonzero(r1 == r2)
+    while len(collide):
+        redraw = rng.integers(0, size - 1, size=len(collide))
+        redraw += redraw >= collide
+        r2[collide] = redraw
+        collide = collide[r1[collide] == redraw]
+    return r1, r2
+
+
+def _converged(energies, tol, atol):
+    # Same population test as SciPy's differential_evolution.
+    return np.std(energies) <= atol + tol * np.abs(np.mean(energies))
+
+
+def particle_swarm(
+    func,
+    bounds,
+    seed=None,
+    n_particles: int = 40,
+    maxiter: int = 1000,
+    inertia: float = 0.7298,
+    cognitive: float = 1.49618,
+    social: float = 1.49618,
+    max_velocity: float = 0.2,
+    tol: float = 1e-6,
+    atol: float = 0.0,
+):
+    """
+    Global-best particle swarm optimization.
+
+    Each generation moves every particle and evaluates the whole swarm in one
+    batched call; positions, velocities and random draws live in arrays
+    allocated once.
+
+    Parameters:
+        func (callable): Objective; its ``evaluate_batch`` is used when
+            available, otherwise it is called with (m, n) arrays.
+        bounds (list): (lower, upper) pair of every coordinate.
+        seed (int, optional): Seed of the random generator.
+        n_particles (int): Swarm size.
+        maxiter (int): Maximum number of generations.
+        inertia, cognitive, social (float): Velocity update coefficients
+            (constriction values of Clerc and Kennedy by default).
+        max_velocity (float): Velocity limit, as a fraction of each range.
+        tol, atol (float): Stop when the standard deviation of the personal
+            best values is at most ``atol + tol * |mean|``.
+
+    Returns:
+        OptimizeResult: ``x``, ``fun``, ``nfev``, ``nit`` and ``success``.
+    """
+    rng = np.random.default_rng(seed)
+    evaluate = _evaluator(func)
+    lower, span = _unit_box(bounds)
+    shape = (n_particles, len(lower))
+
+    U = rng.random(shape)
+    V = rng.uniform(-max_velocity, max_velocity, size=shape)
+    X = np.empty(shape)
+    step = np.empty(shape)
+    r1 = np.empty(shape)
+    r2 = np.empty(shape)
+
+    energies = evaluate(_scale(U, lower, span, X))
+    best_U, best_energies = U.copy(), energies.copy()
+    g = int(np.argmin(best_energies))
+    nfev, nit, success = n_particles, 0, False
+
+    while nit < maxiter:
+        if _converged(best_energies, tol, atol):
+            success = True
+            break
+        rng.random(out=r1)
+        rng.random(out=r2)
+        V *= inertia
+        np.subtract(best_U, U, out=step)
+        step *= r1
+        step *= cognitive
+        V += step
+        np.subtract(best_U[g], U, out=step)
+        step *= r2
+        step *= social
+        V += step
+        np.clip(V, -max_velocity, max_velocity, out=V)
+        U += V
+        np.clip(U, 0.0, 1.0, out=U)
+
+        energies = evaluate(_scale(U, lower, span, X))
+        nfev += n_particles
+        nit += 1
+        improved = energies < best_energies
+        best_U[improved] = U[improved]
+        best_energies[improved] = energies[improved]
+        g = int(np.argmin(best_energies))
+
+    return OptimizeResult(
+        x=lower + best_U[g] * span,
+        fun=float(best_energies[g]),
+        nfev=nfev,
+        nit=nit,
+        success=success,
+    )
+
+
+def vectorized_differential_evolution(
+    func,
+    bounds,
+    seed=None,
+    popsize: int = 15,
+    maxiter: int = 1000,
+    mutation=(0.5, 1.0),
+    recombination: float = 0.7,
+    tol: float = 1e-6,
+    atol: float = 0.0,
+):
+    """
+    DE/best/1/bin with deferred updating, one batched call per generation.
+
+    Follows SciPy's defaults (population of ``popsize * n`` members,
+    Latin hypercube initialization, dithered mutation, out-of-range trial
+    coordinates redrawn at random, same convergence test) without polishing.
+    Trial vectors, mutants and crossover masks are preallocated.
+
+    Parameters:
+        func (callable): Objective; its ``evaluate_batch`` is used when
+            available, otherwise it is called with (m, n) arrays.
+        bounds (list): (lower, upper) pair of every coordinate.
+        seed (int, optional): Seed of the random generator.
+        popsize (int): Population size multiplier.
+        maxiter (int): Maximum number of generations.
+        mutation (float or tuple): Differential weight, or a (min, max) range
+            redrawn every generation.
+        recombination (float): Crossover probability.
+        tol, atol (float): Stop when the standard deviation of the population
+            values is at most ``atol + tol * |mean|``.
+
+    Returns:
+        OptimizeResult: ``x``, ``fun``, ``nfev``, ``nit`` and ``success``.
+    """
+    rng = np.random.default_rng(seed)
+    evaluate = _evaluator(func)
+    lower, span = _unit_box(bounds)
+    n = len(lower)
+    size = max(popsize * n, 5)
+    shape = (size, n)
+    members = np.arange(size)
+
+    # Latin hypercube: one sample per stratum of every coordinate.
+    pop = (rng.permuted(np.tile(members, (n, 1)), axis=1).T + rng.random(shape)) / size
+    X = np.empty(shape)
+    trial = np.empty(shape)
+    cross = np.empty(shape, dtype=bool)
+    draws = np.empty(shape)
+
+    energies = evaluate(_scale(pop, lower, span, X))
+    nfev, nit, success = size, 0, False
+
+    while nit < maxiter:
+        if _converged(energies, tol, atol):
+            success = True
+            break
+        if np.ndim(mutation):
+            scale = rng.uniform(*mutation)
+        else:
+            scale = mutation
+        best = int(np.argmin(energies))
+
+        r1, r2 = _partners(rng, members)
+
+        np.subtract(pop[r1], pop[r2], out=trial)
+        trial *= scale
+        trial += pop[best]
+        rng.random(out=draws)
+        np.less(draws, recombination, out=cross)
+        cross[members, rng.integers(n, size=size)] = True
+        np.copyto(trial, pop, where=~cross)
+        outside = (trial < 0.0) | (trial > 1.0)
+        trial[outside] = rng.random(np.count_nonzero(outside))
+
+        trial_energies = evaluate(_scale(trial, lower, span, X))
+        nfev += size
+        nit += 1
+        improved = trial_energies <= energies
+        pop[improved] = trial[improved]
+        energies[improved] = trial_energies[improved]
+
+    best = int(np.argmin(energies))
+    return OptimizeResult(
+        x=lower + pop[best] * span,
+        fun=float(energies[best]),
+        nfev=nfev,
+        nit=nit,
+        success=success,
+    )
+
+
+def cma_es(
+    func,
+    bounds,
+    seed=None,
+    popsize: int = None,
+    sigma0: float = 0.3,
+    maxiter: int = 1000,
+    xtol: float = 1e-11,
+    ftol: float = 1e-11,
+):
+    """
+    (mu/mu_w, lambda)-CMA-ES with rank-one and rank-mu covariance updates.
+
+    Standard strategy parameters of Hansen's tutorial. The search runs in the
+    unit box: samples are clipped to it before the batched evaluation of each
+    generation and ranked with a penalty on the clipped distance, while the
+    update uses the unclipped steps. Sample, step and candidate arrays are
+    preallocated.
+
+    Parameters:
+        func (callable): Objective; its ``evaluate_batch`` is used when
+            available, otherwise it is called with (m, n) arrays.
+        bounds (list): (lower, upper) pair of every coordinate.
+        seed (int, optional): Seed of the random generator.
+        popsize (int, optional): Offspring per generation (default
+            ``4 + 3 ln n``).
+        sigma0 (float): Initial step size, as a fraction of each range.
+        maxiter (int): Maximum number of generations.
+        xtol (float): Stop when every coordinate's step is below it.
+        ftol (float): Stop when the generation's values span less than it.
+
+    Returns:
+        OptimizeResult: ``x``, ``fun``, ``nfev``, ``nit`` and ``success``.
+    """
+    rng = np.random.default_rng(seed)
+    evaluate = _evaluator(func)
+    lower, span = _unit_box(bounds)
+    n = len(lower)
+    lam = popsize or 4 + int(3 * np.log(n))
+    mu = lam // 2
+
+    weights = np.log(mu + 0.5) - np.log(np.arange(1, mu + 1))
+    weights /= weights.sum()
+    mueff = 1 / np.sum(weights**2)
+    cc = (4 + mueff / n) / (n + 4 + 2 * mueff / n)
+    cs = (mueff + 2) / (n + mueff + 5)
+    c1 = 2 / ((n + 1.3) ** 2 + mueff)
+    cmu = min(1 - c1, 2 * (mueff - 2 + 1 / mueff) / ((n + 2) ** 2 + mueff))
+    damps = 1 + 2 * max(0.0, np.sqrt((mueff - 1) / (n + 1)) - 1) + cs
+    chi_n = np.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n**2))
+
+    mean = rng.random(n)
+    sigma = sigma0
+    C, B, D = np.eye(n), np.eye(n), np.ones(n)
+    ps, pc = np.zeros(n), np.zeros(n)
+    Z = np.empty((lam, n))
+    Y = np.empty((lam, n))
+    U = np.empty((lam, n))
+    excess = np.empty((lam, n))
+    X = np.empty((lam, n))
+
+    best_u, best_f = mean.copy(), np.inf
+    nfev, nit, success = 0, 0, False
+    while nit < maxiter:
+        rng.standard_normal(out=Z)
+        np.matmul(Z * D, B.T, out=Y)
+        np.multiply(Y, sigma, out=excess)
+        excess += mean
+        np.clip(excess, 0.0, 1.0, out=U)
+        excess -= U
+        energies = evaluate(_scale(U, lower, span, X))
+        nfev += lam
+        nit += 1
+
+        # Rank clipped samples with a penalty on their distance to the box so
+        # that the mean does not drift outside it.
+        distance = np.einsum("ij,ij->i", excess, excess)
+        order = np.argsort(energies + (1.0 + np.ptp(energies)) * distance)
+        if energies.min() < best_f:
+            best_f, best_u = float(energies.min()), U[np.argmin(energies)].copy()
+        selected = order[:mu]
+        y_w = weights @ Y[selected]
+        mean += sigma * y_w
+
+        ps *= 1 - cs
+        ps += np.sqrt(cs * (2 - cs) * mueff) * (B @ (weights @ Z[selected]))
+        norm_ps = np.linalg.norm(ps)
+        hsig = norm_ps / np.sqrt(1 - (1 - cs) ** (2 * nit)) / chi_n < 1.4 + 2 / (n + 1)
+        pc *= 1 - cc
+        pc += hsig * np.sqrt(cc * (2 - cc) * mueff) * y_w
+
+        C *= 1 - c1 - cmu + (1 - hsig) * c1 * cc * (2 - cc)
+        C += c1 * np.outer(pc, pc)
+        C += cmu * (Y[selected].T * weights) @ Y[selected]
+        sigma *= np.exp((cs / damps) * (norm_ps / chi_n - 1))
+
+        eigenvalues, B = np.linalg.eigh((C + C.T) / 2)
+        D = np.sqrt(np.maximum(eigenvalues, 1e-20))
+        if sigma * D.max() < xtol or np.ptp(energies) < ftol:
+            success = True
+            break
+
+    return OptimizeResult(
+        x=lower + best_u * span,
+        fun=best_f,
+        nfev=nfev,
+        nit=nit,
+        success=success,
+    )
@@ -31,7 +31,16 @@ def print_step(func_name: str, optimizer_name: str):
 
 
 def print_results(results):
-    headers = ["Function", "Optimizer", "Best value", "Runs", "Time (s)", "Result"]
+    headers = [
+        "Function",
+        "Optimizer",
+        "Best value",
+        "Runs",
+        "Time (s)",
+        "Objective (s)",
+        "Overhead (s)",
+        "Result",
+    ]
     table = []
 
     seen = {}
@@ -48,9 +57,58 @@ def print_results(results):
                 f"{r['fun']:.6f}",
                 r["nfev"],
                 f"{r['time']:.4f}",
+                f"{r['objective_time']:.4f}",
+                f"{r['overhead_time']:.4f}",
                 "✔️" if r["success"] else "❌",
             ]
         )
 
     print("\n🔍 Resultados do Benchmark\n")
     print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+
+
+def print_summary(aggregator):
+    table = [
+        [f"{cell:.6f}" if isinstance(cell, float) else cell for cell in row[:7]]
+        + [
+            f"{row[7]:.0f}",
+            "-" if row[8] is None else f"{row[8]:.0f}",
+            f"{row[9]:.4f}",
+            "-" if row[10] is None else f"{row[10]:.4f}",
+            "-" if row[11] is None else f"{row[11]:.0f}",
+        ]
+        for row in aggregator.rows()
+    ]
+
+    print("\n📊 Estatísticas do Benchmark\n")
+    print(tabulate(table, headers=aggregator.HEADERS, tablefmt="fancy_grid"))
+
+
+def print_mode_comparison(rows):
+    headers = [
+        "Mode",
+        "Runs",
+        "Time (s)",
+        "Objective (s)",
+        "Overhead (s)",
+        "Mean nfev",
+        "Success (%)",
+        "Speedup",
+    ]
+    baseline = rows[0][2]
+    table = [
+        [
+            mode,
+            runs,
+            f"{total:.2f}",
+            f"{objective:.2f}",
+            f"{total - objective:.2f}",
+            f"{nfev:.0f}",
+            f"{success:.0f}",
+            f"{baseline / total:.2f}x",
+        ]
+        for mode, runs, total, objective, nfev, success in rows
+    ]
+
+    print("\n⚡ Modos do Differential Evolution\n")
+    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import os
+import numpy as np
+
+
+def _to_json(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def run_key(func_name: str, optimizer_name: str, seed: int, config: dict) -> str:
+    """
+    Stable identifier of one benchmark run.
+
+    Parameters:
+        func_name (str): Function name.
+        optimizer_name (str): Optimizer name.
+        seed (int): Seed of the run.
+        config (dict): Everything else that changes the result (bounds,
+            optimizer options, ...); must be JSON serializable.
+
+    Returns:
+        str: Hex SHA-256 digest of the canonical JSON of the four values.
+    """
+    payload = json.dumps(
+        [func_name, optimizer_name, seed, config],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=_to_json,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResultStore:
+    """
+    Append-only JSON Lines file of benchmark results keyed by ``run_key``.
+
+    Each finished run is written as one ``{"key": ..., "result": ...}`` line and
+    flushed immediately, so a crashed sweep loses at most the run in progress.
+    A truncated last line left by a crash is ignored when the file is reopened.
+
+    Parameters:
+        path (str): File to read and append to; created if missing.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._records = {}
+        if not os.path.exists(path):
+            return
+
+        with open(path, "rb+") as file:
+            content = file.read()
+            complete = content.rfind(b"\n") + 1
+            if complete < len(content):
+                # Drop the partial line of an interrupted write.
+                file.truncate(complete)
+        for line in content[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            self._records[entry["key"]] = entry["result"]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+
+    def __getitem__(self, key: str) -> dict:
+        return self._records[key]
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def append(self, key: str, result: dict):
+        """Persist the result of a finished run."""
+        line = json.dumps(
+            {"key": key, "result": result}, separators=(",", ":"), default=_to_json
+        )
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        self._records[key] = json.loads(line)["result"]
@@ -5,6 +5,7 @@ import matplotlib.pyplot as plt
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.grid_cache import GridCache
 
 f = BenchmarkFunction("rosenbrock")
 
@@ -19,11 +20,11 @@ params = {
     "pop_size": 10,
 }
 
-# Create meshgrid over the search space
-x_vals = np.linspace(params["bounds"][0, 0], params["bounds"][0, 1], 500)
-y_vals = np.linspace(params["bounds"][1, 0], params["bounds"][1, 1], 500)
-X, Y = np.meshgrid(x_vals, y_vals)
-Z = np.array([[params["function"](np.array([x, y])) for x in x_vals] for y in y_vals])
+# Evaluate the function over a meshgrid of the search space; the grid is cached
+# on disk and reused until the function's code changes.
+X, Y, Z = GridCache().evaluate_grid(
+    params["function"], params["bounds"], resolution=500
+)
 
 # 3D Plot
 fig = plt.figure(figsize=(12, 6))
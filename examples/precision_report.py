@@ -0,0 +1,58 @@
+import argparse
+import os
+import sys
+import numpy as np
+from tabulate import tabulate
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from benchmarks.precision import DEFAULT_RTOL, validate
+
+
+def print_reports(reports: list, rtol: float):
+    table = [
+        [
+            r.name,
+            r.dtype,
+            f"{r.max_rel_error:.2e}",
+            np.array2string(r.worst_x, precision=4, separator=", "),
+            r.non_finite,
+            "✅" if r.safe else "❌",
+        ]
+        for r in reports
+    ]
+    headers = ["Function", "Dtype", "Max rel. error", "Worst x", "Non-finite", "Safe"]
+    print(f"\n🔬 Erro em precisão reduzida contra float64 (limite {rtol:.0e})\n")
+    print(tabulate(table, headers=headers, tablefmt="fancy_grid"))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Valida a avaliação em float32 contra float64."
+    )
+    parser.add_argument(
+        "--functions", nargs="+", help="Funções a validar (padrão: todas)."
+    )
+    parser.add_argument("--dtype", choices=["float32"], default="float32")
+    parser.add_argument("--samples", type=int, default=100_000)
+    parser.add_argument("--rtol", type=float, default=DEFAULT_RTOL)
+    parser.add_argument("--dim", type=int, help="Dimensão das funções escaláveis.")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    reports = validate(
+        args.functions,
+        dtype=args.dtype,
+        n_samples=args.samples,
+        rtol=args.rtol,
+        dim=args.dim,
+        seed=args.seed,
+    )
+    print_reports(reports, args.rtol)
+    unsafe = [r.name for r in reports if not r.safe]
+    if unsafe:
+        print(f"\n⚠️  {args.dtype} não é seguro para: {', '.join(unsafe)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from scipy.interpolate import LinearNDInterpolator
+from benchmarks import functions_registry as reg
+from benchmarks.adaptive import adaptive_sample
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.grid import evaluate_grid
+
+
+@pytest.mark.parametrize("func_name", list(reg.FUNCTIONS))
+def test_samples_are_consistent(func_name):
+    f = BenchmarkFunction(func_name)
+    with np.errstate(over="ignore"):
+        s = adaptive_sample(f, initial=8, max_depth=4, max_points=1500)
+
+    lower, upper = f.bounds[:, 0], f.bounds[:, 1]
+    assert len(s.points) <= 1500
+    assert np.all((s.points >= lower) & (s.points <= upper))
+    assert len(np.unique(s.points, axis=0)) == len(s.points)
+    np.testing.assert_array_equal(s.values, f.evaluate_batch(s.points))
+
+    # The leaves tile the domain.
+    areas = (s.cells[:, 2] - s.cells[:, 0]) * (s.cells[:, 3] - s.cells[:, 1])
+    assert areas.sum() == pytest.approx(np.prod(upper - lower))
+    assert s.depth.max() <= 4
+
+
+def test_flat_function_is_not_refined():
+    s = adaptive_sample(lambda X: np.ones(len(X)), [[0, 1], [0, 1]], initial=4)
+    assert len(s.points) == 5**2 + 4**2
+    assert len(s.cells) == 16 and not s.depth.any()
+
+
+def test_spike_resolved_better_than_uniform_grid():
+    f = BenchmarkFunction("easom")
+    s = adaptive_sample(f, max_points=2000)
+    resolution = int(np.sqrt(len(s.points)))
+    _, _, Z = evaluate_grid(f, f.bounds, resolution=resolution)
+
+    assert s.values.min() < Z.min()
+    assert s.values.min() == pytest.approx(f.optimum, abs=1e-3)
+
+
+def test_ridge_map_more_accurate_than_uniform_grid():
+    f = BenchmarkFunction("bukin")
+    s = adaptive_sample(f, max_points=4000)
+    X, Y, Z = evaluate_grid(f, f.bounds, resolution=int(np.sqrt(len(s.points))))
+    RX, RY, reference = evaluate_grid(f, f.bounds, resolution=400)
+    targets = np.column_stack([RX.ravel(), RY.ravel()])
+
+    def error(points, values):
+        return np.mean(
+            np.abs(LinearNDInterpolator(points, values)(targets) - reference.ravel())
+        )
+
+    uniform = error(np.column_stack([X.ravel(), Y.ravel()]), Z.ravel())
+    assert error(s.points, s.values) < 0.75 * uniform
+
+
+def test_refinement_concentrates_on_features():
+    f = BenchmarkFunction("easom")
+    s = adaptive_sample(f, max_points=3000)
+    deepest = s.cells[s.depth == s.depth.max()]
+    centres = (deepest[:, :2] + deepest[:, 2:]) / 2
+    assert np.mean(np.linalg.norm(centres - np.pi, axis=1) < 2) > 0.5
+
+    # A uniform grid of the same size puts about 3% of its points there.
+    near = np.mean(np.linalg.norm(s.points - np.pi, axis=1) < 2)
+    side = int(np.sqrt(len(s.points)))
+    X, Y = np.meshgrid(*(np.linspace(-10, 10, side),) * 2)
+    uniform = np.column_stack([X.ravel(), Y.ravel()])
+    assert near > 10 * np.mean(np.linalg.norm(uniform - np.pi, axis=1) < 2)
+
+
+def test_invalid_arguments():
+    f = BenchmarkFunction("sphere", dim=3)
+    with pytest.raises(ValueError):
+        adaptive_sample(f)
+    with pytest.raises(ValueError):
+        adaptive_sample(BenchmarkFunction("sphere"), initial=0)
+    for low_fraction in (-0.1, 1.5):
+        with pytest.raises(ValueError):
+            adaptive_sample(BenchmarkFunction("sphere"), low_fraction=low_fraction)
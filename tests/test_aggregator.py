@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+from examples.optimizer_benchmark.aggregator import (
+    P2Quantile,
+    ResultAggregator,
+    RunningStats,
+)
+
+
+def test_running_stats_match_numpy():
+    values = np.random.default_rng(0).normal(3.0, 2.0, size=1000)
+    stats = RunningStats()
+
+    for value in values:
+        stats.add(value)
+
+    assert stats.count == 1000
+    assert stats.mean == pytest.approx(values.mean())
+    assert stats.std == pytest.approx(values.std(ddof=1))
+    assert (stats.min, stats.max) == (values.min(), values.max())
+
+
+@pytest.mark.parametrize("p", [0.1, 0.5, 0.9])
+def test_p2_quantile_tracks_large_streams(p):
+    values = np.random.default_rng(1).exponential(size=20000)
+    quantile = P2Quantile(p)
+
+    for value in values:
+        quantile.add(value)
+
+    assert quantile.value == pytest.approx(np.quantile(values, p), rel=0.02)
+
+
+def test_p2_quantile_is_exact_for_few_values():
+    quantile = P2Quantile(0.5)
+
+    for value in [5.0, 1.0, 3.0, 2.0]:
+        quantile.add(value)
+
+    assert quantile.value == np.median([5.0, 1.0, 3.0, 2.0])
+
+
+def test_aggregator_summarizes_each_pair():
+    aggregator = ResultAggregator()
+    for fun, success in [(1.0, False), (0.0, True), (2.0, False)]:
+        aggregator.add(
+            {
+                "function": "sphere",
+                "optimizer": "nelder_mead",
+                "fun": fun,
+                "nfev": 10,
+                "time": 0.5,
+                "objective_time": 0.1,
+                "success": success,
+            }
+        )
+
+    (row,) = aggregator.rows()
+
+    assert len(row) == len(ResultAggregator.HEADERS)
+    assert row[:7] == ["sphere", "nelder_mead", 3, 0.0, 1.0, 1.0, 1.0]
+    assert row[7] == pytest.approx(100 / 3)
+    assert row[8:] == [10.0, 0.5, 0.1, None]
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from benchmarks import functions_registry as reg
+from benchmarks.functions_registry import BenchmarkFunction
+
+
+@pytest.mark.parametrize("func_name", list(reg.FUNCTIONS.keys()))
+def test_evaluate_batch_matches_pointwise(func_name):
+    f = BenchmarkFunction(func_name)
+    lower, upper = f.bounds[:, 0], f.bounds[:, 1]
+    rng = np.random.default_rng(0)
+    X = rng.uniform(low=lower, high=upper, size=(200, len(lower)))
+
+    values = f.evaluate_batch(X)
+    expected = np.array([float(f(x)) for x in X])
+
+    assert values.shape == (200,)
+    np.testing.assert_allclose(values, expected, rtol=1e-12, atol=0)
+
+
+def test_evaluate_batch_rejects_single_point():
+    f = BenchmarkFunction("sphere")
+    with pytest.raises(ValueError):
+        f.evaluate_batch(np.zeros(2))
+
+
+@pytest.mark.parametrize("dim", [1, 3, 1000])
+def test_scalable_kernels_match_reference_sums(dim):
+    rng = np.random.default_rng(dim)
+    X = rng.uniform(-2, 2, size=(5, dim))
+
+    for x, value in zip(X, reg.FUNCTIONS["sphere"](X)):
+        assert value == pytest.approx(sum(xi**2 for xi in x))
+    for x, value in zip(X, reg.FUNCTIONS["rastrigin"](X)):
+        expected = sum(10 + xi**2 - 10 * np.cos(2 * np.pi * xi) for xi in x)
+        assert value == pytest.approx(expected)
+    for x, value in zip(X, reg.FUNCTIONS["ackley"](X)):
+        t1 = sum(xi**2 for xi in x)
+        t2 = sum(np.cos(2 * np.pi * xi) for xi in x)
+        expected = 20 + np.e - 20 * np.exp((t1 / dim) * -0.2) - np.exp(t2 / dim)
+        assert value == pytest.approx(expected)
+    for x, value in zip(X, reg.FUNCTIONS["rosenbrock"](X)):
+        expected = sum(
+            100 * (x[i + 1] - x[i] ** 2) ** 2 + (1 - x[i]) ** 2 for i in range(dim - 1)
+        )
+        assert value == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "func_name",
+    [
+        "mishra_bird_constrained",
+        "rosenbrock_constrained",
+        "rosenbrock_constrained_disk",
+        "simionescu",
+        "townsend_modified",
+    ],
+)
+def test_nonlinear_functions_accept_scalars_points_and_batches(func_name):
+    func = reg.FUNCTIONS[func_name]
+    rng = np.random.default_rng(1)
+    X = rng.uniform(-2.5, 2.5, size=(4, 5, 2))
+    X[0, :3] = [[0.0, 0.0], [1.0, -1.0], [-2.0, 2.0]]
+
+    values = func(X)
+
+    assert values.shape == (4, 5)
+    for point, value in zip(X.reshape(-1, 2), values.ravel()):
+        single = func([float(point[0]), float(point[1])])
+        assert np.ndim(single) == 0
+        assert single == value
+    np.testing.assert_array_equal(func(X.reshape(-1, 2)), values.ravel())
@@ -1,5 +1,17 @@
+import numpy as np
+import pytest
 from examples.optimizer_benchmark import optimizers as op
+from examples.optimizer_benchmark.adapters import (
+    OPTIMIZERS,
+    NelderMead,
+    de_arguments,
+    resolve_de_mode,
+    supports_batch,
+)
+from examples.optimizer_benchmark.aggregator import ResultAggregator
 from benchmarks import functions_registry as reg
+from benchmarks.budget import BudgetedFunction
+from benchmarks.instrumentation import EvaluationStats, timed
 
 
 def test_benchmark_execution_runs():
@@ -22,3 +34,194 @@ def test_benchmark_execution_runs():
         assert "nfev" in r
         assert "time" in r
         assert "success" in r
+        assert 0 <= r["objective_time"] <= r["time"]
+        assert r["overhead_time"] == pytest.approx(r["time"] - r["objective_time"])
+
+
+def test_parallel_run_matches_serial_order_and_values():
+    names = ["sphere", "eggholder", "rosenbrock_constrained_disk"]
+    kwargs = dict(
+        functions={name: reg.FUNCTIONS[name] for name in names},
+        bounds=reg.BOUNDS,
+        known_results=reg.RESULTS,
+        optimizers=["differential_evolution", "nelder_mead"],
+        n_runs=2,
+    )
+    serial = op.SciPyOptimizer(**kwargs)
+    parallel = op.SciPyOptimizer(workers=2, **kwargs)
+
+    serial.run()
+    parallel.run()
+
+    keys = ["function", "optimizer", "fun", "nfev", "success"]
+    assert [[r[k] for k in keys] for r in parallel.results] == [
+        [r[k] for k in keys] for r in serial.results
+    ]
+
+
+def test_store_resumes_interrupted_sweep(tmp_path, monkeypatch):
+    path = str(tmp_path / "results.jsonl")
+    kwargs = dict(
+        functions={name: reg.FUNCTIONS[name] for name in ["sphere", "booth"]},
+        bounds=reg.BOUNDS,
+        known_results=reg.RESULTS,
+        optimizers=["differential_evolution", "nelder_mead"],
+        n_runs=2,
+    )
+    complete = op.SciPyOptimizer(store=path, **kwargs)
+    complete.run()
+
+    # Simulate a crash after three runs, in the middle of writing the fourth.
+    with open(path) as file:
+        lines = file.readlines()
+    with open(path, "w") as file:
+        file.writelines(lines[:3] + [lines[3][:20]])
+
+    executed = []
+    original = op.run_task
+
+    def counting_run_task(*args):
+        executed.append((args[0], args[4], args[5]))
+        return original(*args)
+
+    monkeypatch.setattr(op, "run_task", counting_run_task)
+    resumed = op.SciPyOptimizer(store=path, **kwargs)
+    resumed.run()
+
+    assert len(executed) == 5
+    assert [(r["function"], r["optimizer"]) for r in resumed.results] == [
+        (r["function"], r["optimizer"]) for r in complete.results
+    ]
+    assert [r["fun"] for r in resumed.results] == pytest.approx(
+        [r["fun"] for r in complete.results]
+    )
+    with open(path) as file:
+        assert len(file.readlines()) == 8
+
+
+def test_task_key_follows_current_adapter_options(monkeypatch):
+    def key(optimizer_name):
+        return op.SciPyOptimizer.task_key(
+            ("sphere", None, reg.BOUNDS["sphere"], 0.0, optimizer_name, 0, {})
+        )
+
+    before = key("nelder_mead")
+    monkeypatch.setattr(NelderMead, "options", {"maxiter": 10, "fatol": 1e-6})
+    assert key("nelder_mead") != before
+
+    class ShortNelderMead(NelderMead):
+        name = "short_nelder_mead"
+        options = {"maxiter": 10, "fatol": 1e-6}
+
+    monkeypatch.setitem(OPTIMIZERS, ShortNelderMead.name, ShortNelderMead())
+    short = key("short_nelder_mead")
+    ShortNelderMead.options = {"maxiter": 20, "fatol": 1e-6}
+    assert key("short_nelder_mead") != short
+
+
+def test_aggregator_receives_results_without_keeping_them():
+    aggregator = ResultAggregator()
+    runner = op.SciPyOptimizer(
+        functions={"sphere": reg.FUNCTIONS["sphere"]},
+        bounds=reg.BOUNDS,
+        known_results=reg.RESULTS,
+        optimizers=["differential_evolution", "nelder_mead"],
+        n_runs=3,
+        aggregator=aggregator,
+        keep_results=False,
+    )
+
+    runner.run()
+
+    assert runner.results == []
+    assert [row[:3] for row in aggregator.rows()] == [
+        ["sphere", "differential_evolution", 3],
+        ["sphere", "nelder_mead", 3],
+    ]
+
+
+def test_budget_and_stop_on_target_bound_nfev():
+    names = ["sphere", "eggholder"]
+    runner = op.SciPyOptimizer(
+        functions={name: reg.FUNCTIONS[name] for name in names},
+        bounds=reg.BOUNDS,
+        known_results=reg.RESULTS,
+        optimizers=["differential_evolution", "nelder_mead"],
+        n_runs=1,
+        max_evals=200,
+    )
+    runner.run()
+
+    for r in runner.results:
+        assert r["nfev"] <= 200
+        assert np.isfinite(r["fun"])
+        if r["stopped"] == "BudgetExhausted":
+            assert r["nfev"] == 200
+
+    sphere = op.run_task(
+        "sphere",
+        reg.FUNCTIONS["sphere"],
+        reg.BOUNDS["sphere"],
+        reg.RESULTS["sphere"],
+        "nelder_mead",
+        0,
+        {"max_evals": None, "stop_on_target": True},
+    )
+    assert sphere["stopped"] == "TargetReached"
+    assert sphere["success"]
+    assert sphere["nfev"] == sphere["evals_to_target"]
+
+
+def test_batched_de_modes_evaluate_whole_generations():
+    args = (
+        "rastrigin",
+        reg.FUNCTIONS["rastrigin"],
+        reg.BOUNDS["rastrigin"],
+        reg.RESULTS["rastrigin"],
+        "differential_evolution",
+        0,
+    )
+    vectorized = op.run_task(*args, {"de_mode": "vectorized"})
+    workers = op.run_task(*args, {"de_mode": "workers"})
+    auto = op.run_task(*args, {"de_mode": "auto"})
+
+    assert vectorized["fun"] == workers["fun"] == auto["fun"]
+    assert vectorized["nfev"] == workers["nfev"]
+    assert vectorized["success"]
+
+    budgeted = op.run_task(*args, {"de_mode": "vectorized", "max_evals": 100})
+    assert budgeted["nfev"] == 100 and budgeted["stopped"] == "BudgetExhausted"
+
+
+def test_auto_de_mode_probe_not_recorded():
+    stats = EvaluationStats()
+    func = BudgetedFunction(timed(reg.FUNCTIONS["sphere"], stats))
+
+    _, options = de_arguments(func, reg.BOUNDS["sphere"], "auto")
+
+    assert options["vectorized"]
+    assert stats.points == stats.calls == func.nfev == 0
+
+
+def test_auto_de_mode_keeps_constrained_functions_serial():
+    name = "rosenbrock_constrained"
+    assert resolve_de_mode(reg.FUNCTIONS["sphere"], reg.BOUNDS["sphere"]) == (
+        "vectorized"
+    )
+    assert resolve_de_mode(reg.FUNCTIONS[name], reg.BOUNDS[name], constrained=True) == (
+        "serial"
+    )
+
+    args = (name, reg.FUNCTIONS[name], reg.BOUNDS[name], reg.RESULTS[name])
+    auto = op.run_task(*args, "differential_evolution", 0, {"de_mode": "auto"})
+    serial = op.run_task(*args, "differential_evolution", 0, {"de_mode": "serial"})
+    assert auto["fun"] == serial["fun"] and auto["nfev"] == serial["nfev"]
+    assert auto["success"]
+
+
+def test_supports_batch_and_invalid_de_mode():
+    assert supports_batch(reg.FUNCTIONS["eggholder"], reg.BOUNDS["eggholder"])
+    assert not supports_batch(lambda x: float(x[0]), reg.BOUNDS["sphere"])
+
+    with pytest.raises(ValueError):
+        op.SciPyOptimizer(reg.FUNCTIONS, reg.BOUNDS, reg.RESULTS, [], de_mode="gpu")
@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from benchmarks.budget import BudgetedFunction, BudgetExhausted, TargetReached
+from benchmarks.functions_registry import BenchmarkFunction
+
+
+def test_budget_counts_points_and_stops_when_spent():
+    f = BudgetedFunction(BenchmarkFunction("sphere", dim=3), max_evals=3)
+    for x in ([3.0, 0.0, 0.0], [1.0, 0.0, 0.0], [2.0, 0.0, 0.0]):
+        f(np.array(x))
+
+    with pytest.raises(BudgetExhausted):
+        f(np.zeros(3))
+    assert f.nfev == 3 and f.remaining == 0
+    assert f.best_value == 1.0
+    np.testing.assert_array_equal(f.best_x, [1.0, 0.0, 0.0])
+
+
+def test_batch_is_cut_at_remaining_budget():
+    f = BudgetedFunction(BenchmarkFunction("sphere", dim=2), max_evals=5)
+    X = np.arange(16.0).reshape(8, 2)[::-1]
+
+    with pytest.raises(BudgetExhausted):
+        f.evaluate_batch(X)
+    assert f.nfev == 5
+    assert f.best_value == BenchmarkFunction("sphere", dim=2)(X[4])
+
+
+def test_records_evals_to_target_and_stops_on_target():
+    points = np.array([[1.0, 1.0], [0.5, 0.0], [1e-4, 0.0], [2.0, 2.0]])
+    passive = BudgetedFunction(BenchmarkFunction("sphere", dim=2), target=0.0, tol=1e-6)
+    passive.evaluate_batch(points)
+    assert passive.evals_to_target == 3 and passive.nfev == 4
+
+    stopping = BudgetedFunction(
+        BenchmarkFunction("sphere", dim=2), target=0.0, stop_on_target=True
+    )
+    stopping(points[0])
+    with pytest.raises(TargetReached):
+        stopping.evaluate_batch(points[1:])
+    assert stopping.evals_to_target == 3
+
+
+def test_target_never_reached_leaves_evals_to_target_unset():
+    f = BudgetedFunction(BenchmarkFunction("sphere", dim=2), target=0.0)
+    f.evaluate_batch(np.ones((4, 2)))
+    assert f.evals_to_target is None
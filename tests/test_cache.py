@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from benchmarks.cache import EvaluationCache
+from benchmarks.functions_registry import BenchmarkFunction
+
+
+def test_cache_returns_memoized_values_and_counts_hits():
+    f = BenchmarkFunction("eggholder", cache_size=8)
+    x = np.array([1.5, -2.0])
+
+    first = f(x)
+    second = f(x.copy())
+
+    assert first == second == BenchmarkFunction("eggholder")(x)
+    info = f.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    assert info.nbytes == x.nbytes + 8
+
+
+def test_point_and_one_row_batch_cached_apart():
+    f = BenchmarkFunction("sphere", dim=2, cache_size=8)
+    x = np.array([1.0, 2.0])
+
+    for _ in range(2):
+        assert f(x) == 5.0 and np.ndim(f(x)) == 0
+        batch = f(x[None])
+        assert np.shape(batch) == (1,) and batch[0] == 5.0
+    assert f.cache_info().currsize == 2
+
+
+def test_cache_evicts_least_recently_used_point():
+    cache = EvaluationCache(maxsize=2)
+    a, b, c = (cache.key([value, 0.0]) for value in (1.0, 2.0, 3.0))
+
+    cache.put(a, 1.0)
+    cache.put(b, 2.0)
+    cache.get(a)
+    cache.put(c, 3.0)
+
+    assert cache.get(b) is None
+    assert cache.get(a) == 1.0 and cache.get(c) == 3.0
+    assert cache.info().currsize == 2
+    assert cache.info().nbytes == 2 * (16 + 8)
+
+
+def test_quantized_keys_merge_near_identical_points():
+    cache = EvaluationCache(decimals=6)
+
+    assert cache.key([0.1 + 0.2, -0.0]) == cache.key([0.3, 1e-9])
+    assert cache.key([0.3, 0.0]) != cache.key([0.3, 1e-3])
+
+
+def test_cache_is_disabled_by_default():
+    f = BenchmarkFunction("sphere")
+
+    assert f.cache is None and f.cache_info() is None
+    with pytest.raises(ValueError):
+        EvaluationCache(maxsize=0)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from benchmarks import functions_registry as reg
+from benchmarks import registry
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.nonlinear import PENALTY
+
+
+def _samples(f, n=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(f.bounds[:, 0], f.bounds[:, 1], size=(n, f.dim))
+
+
+@pytest.mark.parametrize(
+    "func_name", ["rosenbrock_constrained", "rosenbrock_constrained_disk"]
+)
+def test_feasibility_matches_penalized_objective(func_name):
+    f = BenchmarkFunction(func_name)
+    X = _samples(f)
+
+    feasible = f.is_feasible(X)
+    violation = f.constraint_violation(X)
+    penalized = f.func(X)
+
+    assert f.constrained
+    assert 0 < feasible.sum() < len(X)
+    assert np.all(violation >= 0)
+    np.testing.assert_array_equal(feasible, ~np.any(violation > 0, axis=1))
+    np.testing.assert_array_equal(feasible, penalized != PENALTY)
+    np.testing.assert_array_equal(f.evaluate_batch(X), penalized)
+
+
+def test_objective_skips_infeasible_rows(monkeypatch):
+    X = np.array([[0.0, 0.0], [2.0, 2.0], [1.0, 1.0]])
+    seen = []
+
+    def objective(batch):
+        seen.append(batch.copy())
+        return reg.FUNCTIONS["rosenbrock"](batch)
+
+    record = registry.get("rosenbrock_constrained_disk")
+    monkeypatch.setitem(
+        registry._RECORDS, record.name, record._replace(objective=objective)
+    )
+    f = BenchmarkFunction("rosenbrock_constrained_disk")
+
+    np.testing.assert_array_equal(f.evaluate_batch(X), [1.0, PENALTY, 0.0])
+    np.testing.assert_array_equal(seen[0], X[[0, 2]])
+
+
+def test_unconstrained_functions_are_always_feasible():
+    f = BenchmarkFunction("eggholder")
+    X = _samples(f, n=10)
+
+    assert not f.constrained
+    assert f.constraint_violation(X).shape == (10, 0)
+    assert f.is_feasible(X).all()
@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+from examples import export_plots
+from benchmarks import functions_registry as reg
+from benchmarks import registry
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.grid import evaluate_grid
+
+
+def test_downsample_keeps_grid_edges():
+    X, Y = np.meshgrid(np.linspace(0, 1, 500), np.linspace(-1, 1, 300))
+    SX, SY, SZ = export_plots.downsample(X, Y, X + Y, 40)
+
+    assert SZ.shape == (40, 40)
+    assert (SX.min(), SX.max(), SY.min(), SY.max()) == (0, 1, -1, 1)
+    np.testing.assert_array_equal(SZ, SX + SY)
+    assert export_plots.downsample(X, Y, X, 1000)[2].shape == (300, 500)
+
+
+def test_export_writes_one_image_per_function(tmp_path):
+    names = ["booth", "rosenbrock_constrained_disk", "cross_in_tray"]
+    paths = export_plots.export(
+        names, str(tmp_path), workers=2, resolution=40, surface_resolution=20
+    )
+
+    assert list(paths) == names
+    for path in paths.values():
+        with open(path, "rb") as file:
+            assert file.read(8) == b"\x89PNG\r\n\x1a\n"
+
+
+def test_main_serial_svg_with_cache(tmp_path, capsys):
+    status = export_plots.main(
+        [
+            "--functions",
+            "levi",
+            "--output",
+            str(tmp_path / "figures"),
+            "--format",
+            "svg",
+            "--resolution",
+            "30",
+            "--workers",
+            "1",
+            "--cache",
+            str(tmp_path / "grids"),
+        ]
+    )
+
+    assert status == 0
+    assert (tmp_path / "figures" / "levi.svg").read_text().lstrip().startswith("<?xml")
+    assert len(list((tmp_path / "grids").glob("*.npy"))) == 1
+    assert "1 figuras" in capsys.readouterr().out
+
+
+def test_unknown_functions_rejected(tmp_path):
+    with pytest.raises(ValueError, match="not found"):
+        export_plots.export(["sphere", "unknown"], str(tmp_path))
+
+
+def test_functions_that_are_not_two_dimensional_skipped(tmp_path, monkeypatch):
+    record = registry.get("sphere")._replace(
+        name="sphere_3d", bounds=np.tile([-5.0, 5.0], (3, 1))
+    )
+    monkeypatch.setitem(registry._RECORDS, "sphere_3d", record)
+    assert "sphere_3d" in reg.FUNCTIONS
+    assert "sphere_3d" not in export_plots.plottable()
+    assert export_plots.plottable(["booth", "sphere_3d"]) == ["booth"]
+    with pytest.raises(ValueError, match="2-D"):
+        export_plots.export(["booth", "sphere_3d"], str(tmp_path), workers=1)
+    assert not (tmp_path / "booth.png").exists()
+
+
+def test_only_constrained_functions_are_masked():
+    f = BenchmarkFunction("goldstein_price")
+    X, Y, Z = evaluate_grid(f, f.bounds, resolution=100)
+    assert Z.max() > registry.PENALTY
+    values = export_plots.plot_values(f, X, Y, Z)
+    assert not np.isnan(values).any()
+    np.testing.assert_array_equal(values, Z)
+
+    g = BenchmarkFunction("rosenbrock_constrained_disk")
+    X, Y, Z = evaluate_grid(g, g.bounds, resolution=100)
+    feasible = g.is_feasible(np.column_stack([X.ravel(), Y.ravel()])).reshape(Z.shape)
+    values = export_plots.plot_values(g, X, Y, Z)
+    np.testing.assert_array_equal(np.isnan(values), ~feasible)
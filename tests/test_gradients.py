@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+from scipy.optimize import minimize
+from benchmarks import functions_registry as reg
+from benchmarks.functions_registry import BenchmarkFunction
+
+
+def _central_difference(func, x, h=1e-6):
+    return np.array(
+        [(func(x + h * e) - func(x - h * e)) / (2 * h) for e in np.eye(len(x))]
+    )
+
+
+@pytest.mark.parametrize("func_name", list(reg.FUNCTIONS.keys()))
+def test_gradient_and_hvp_match_finite_differences(func_name):
+    f = BenchmarkFunction(func_name)
+    rng = np.random.default_rng(0)
+    X = rng.uniform(f.bounds[:, 0], f.bounds[:, 1], size=(30, f.dim))
+    V = rng.normal(size=X.shape)
+
+    grads, products = f.grad(X), f.hvp(X, V)
+
+    assert grads.shape == products.shape == X.shape
+    for x, v, grad, product in zip(X, V, grads, products):
+        expected_grad = _central_difference(f, x)
+        expected_product = _central_difference(lambda y: f.grad(y) @ v, x)
+        scale = max(1.0, np.abs(expected_grad).max())
+        np.testing.assert_allclose(grad, expected_grad, rtol=1e-4, atol=1e-5 * scale)
+        np.testing.assert_allclose(f.grad(x), grad, rtol=1e-12)
+        scale = max(1.0, np.abs(expected_product).max())
+        np.testing.assert_allclose(
+            product, expected_product, rtol=1e-4, atol=1e-5 * scale
+        )
+
+
+@pytest.mark.parametrize("func_name", ["rosenbrock", "rastrigin", "ackley"])
+def test_high_dimensional_hvp_matches_gradient_differences(func_name):
+    f = BenchmarkFunction(func_name, dim=1000)
+    rng = np.random.default_rng(1)
+    x = rng.uniform(-1, 1, size=1000)
+    v = rng.normal(size=1000)
+    h = 1e-6
+
+    expected = (f.grad(x + h * v) - f.grad(x - h * v)) / (2 * h)
+
+    np.testing.assert_allclose(f.hvp(x, v), expected, rtol=1e-5, atol=1e-5)
+
+
+def test_gradients_plug_into_scipy_minimize():
+    f = BenchmarkFunction("rosenbrock", dim=50)
+    x0 = np.zeros(50)
+
+    result = minimize(f, x0, jac=f.grad, hessp=f.hvp, method="trust-ncg")
+
+    assert result.success
+    np.testing.assert_allclose(result.x, f.x_opt, atol=1e-5)
+    # One function evaluation per iteration: no finite-difference gradients.
+    assert result.nfev <= result.nit + 1
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+from benchmarks import functions_registry as reg
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.grid import evaluate_grid
+
+
+@pytest.mark.parametrize("func_name", list(reg.FUNCTIONS.keys()))
+def test_grid_matches_pointwise_evaluation(func_name):
+    f = BenchmarkFunction(func_name)
+
+    X, Y, Z = evaluate_grid(f, f.bounds, resolution=(30, 20))
+
+    assert X.shape == Y.shape == Z.shape == (20, 30)
+    expected = np.array(
+        [[float(f(np.array([x, y]))) for x, y in zip(xs, ys)] for xs, ys in zip(X, Y)]
+    )
+    np.testing.assert_allclose(Z, expected, rtol=1e-12, atol=0)
+
+
+def test_grid_chunking_does_not_change_values():
+    f = BenchmarkFunction("eggholder")
+
+    _, _, Z_single = evaluate_grid(f, f.bounds, resolution=64)
+    _, _, Z_rows = evaluate_grid(f, f.bounds, resolution=64, max_chunk_bytes=1)
+
+    np.testing.assert_array_equal(Z_single, Z_rows)
+
+
+def test_grid_accepts_plain_registry_functions():
+    _, _, Z = evaluate_grid(reg.FUNCTIONS["sphere"], reg.BOUNDS["sphere"], 11)
+
+    assert Z[5, 5] == 0.0
@@ -0,0 +1,132 @@
+import importlib.util
+import inspect
+import os
+import sys
+import types
+import numpy as np
+import pytest
+from benchmarks import grid_cache, registry
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.grid import evaluate_grid
+from benchmarks.grid_cache import GridCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return GridCache(str(tmp_path / "grids"))
+
+
+def test_second_call_loads_stored_grid(cache):
+    f = BenchmarkFunction("eggholder")
+    X, Y, Z = cache.evaluate_grid(f, f.bounds, resolution=(60, 40))
+    X2, Y2, Z2 = cache.evaluate_grid(f, f.bounds, resolution=(60, 40))
+    expected = evaluate_grid(f, f.bounds, resolution=(60, 40))
+
+    assert isinstance(Z2, np.memmap) and not Z2.flags.writeable
+    for got, want in zip((X, Y, Z, X2, Y2, Z2), expected * 2):
+        np.testing.assert_array_equal(got, want)
+    info = cache.info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+    assert info.nbytes == os.path.getsize(cache.path(cache.key(f, f.bounds, (60, 40))))
+
+
+def test_key_covers_name_bounds_resolution_and_dtype(cache):
+    f = BenchmarkFunction("rastrigin")
+    key = cache.key(f, f.bounds, 100)
+    assert key == cache.key(BenchmarkFunction("rastrigin"), f.bounds.copy(), (100, 100))
+    assert (
+        len(
+            {
+                key,
+                cache.key(BenchmarkFunction("ackley"), f.bounds, 100),
+                cache.key(f, f.bounds / 2, 100),
+                cache.key(f, f.bounds, (100, 101)),
+                cache.key(
+                    BenchmarkFunction("rastrigin", dtype=np.float32), f.bounds, 100
+                ),
+            }
+        )
+        == 5
+    )
+
+
+def test_changed_implementation_invalidates_entries(cache, tmp_path, monkeypatch):
+    source = tmp_path / "custom_kernels.py"
+    source.write_text("def bowl(x):\n    return x[..., 0] ** 2 + x[..., 1] ** 2\n")
+    spec = importlib.util.spec_from_file_location("custom_kernels", source)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setitem(sys.modules, "custom_kernels", module)
+    record = registry.get("sphere")._replace(
+        name="bowl", func=module.bowl, inplace=None
+    )
+    monkeypatch.setitem(registry._RECORDS, "bowl", record)
+    grid_cache.code_version.cache_clear()
+
+    f = BenchmarkFunction("bowl")
+    old_key = cache.key(f, f.bounds, 20)
+    cache.evaluate_grid(f, f.bounds, resolution=20)
+
+    source.write_text("def bowl(x):\n    return x[..., 0] ** 2 + 2 * x[..., 1] ** 2\n")
+    grid_cache.code_version.cache_clear()
+    assert cache.key(f, f.bounds, 20) != old_key
+    cache.evaluate_grid(f, f.bounds, resolution=20)
+    assert cache.info().misses == 2
+    grid_cache.code_version.cache_clear()
+
+
+@pytest.mark.parametrize("module", grid_cache._COMMON_MODULES)
+def test_changed_common_module_invalidates_entries(
+    module, cache, tmp_path, monkeypatch
+):
+    # Stand-in for the module whose source file can be edited.
+    source = tmp_path / "copy.py"
+    source.write_bytes(open(inspect.getsourcefile(sys.modules[module]), "rb").read())
+    stand_in = types.ModuleType(module)
+    stand_in.__file__ = str(source)
+    monkeypatch.setitem(sys.modules, module, stand_in)
+    grid_cache.code_version.cache_clear()
+
+    f = BenchmarkFunction("booth")
+    old_key = cache.key(f, f.bounds, 20)
+    cache.evaluate_grid(f, f.bounds, resolution=20)
+
+    source.write_text(source.read_text() + "\n# changed\n")
+    grid_cache.code_version.cache_clear()
+    assert cache.key(f, f.bounds, 20) != old_key
+    cache.evaluate_grid(f, f.bounds, resolution=20)
+    assert cache.info().misses == 2
+    grid_cache.code_version.cache_clear()
+
+
+def test_least_recently_used_grids_evicted_by_size(tmp_path):
+    f = BenchmarkFunction("levi")
+    entry = 50 * 50 * 8 + 128
+    cache = GridCache(str(tmp_path / "grids"), max_bytes=2 * entry)
+    first, second, third = (f.bounds * s for s in (1.0, 0.5, 0.25))
+
+    cache.evaluate_grid(f, first, resolution=50)
+    cache.evaluate_grid(f, second, resolution=50)
+    os.utime(cache.path(cache.key(f, second, 50)), ns=(1, 1))  # make it the oldest
+    cache.evaluate_grid(f, third, resolution=50)
+
+    assert os.path.exists(cache.path(cache.key(f, first, 50)))
+    assert not os.path.exists(cache.path(cache.key(f, second, 50)))
+    assert cache.info().entries == 2 and cache.info().nbytes <= cache.max_bytes
+
+
+def test_grid_larger_than_cache_is_still_returned(tmp_path):
+    f = BenchmarkFunction("booth")
+    cache = GridCache(str(tmp_path / "grids"), max_bytes=100)
+    _, _, Z = cache.evaluate_grid(f, f.bounds, resolution=30)
+    np.testing.assert_array_equal(Z, evaluate_grid(f, f.bounds, resolution=30)[2])
+    assert cache.info().entries == 0
+
+
+def test_clear(cache):
+    f = BenchmarkFunction("matyas")
+    cache.evaluate_grid(f, f.bounds, resolution=10)
+    cache.clear()
+    assert cache.info().entries == 0
+    with pytest.raises(ValueError):
+        GridCache(cache.directory, max_bytes=-1)
@@ -0,0 +1,43 @@
+import numpy as np
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.instrumentation import EvaluationStats, timed
+
+
+def test_stats_count_calls_and_batch_points():
+    f = BenchmarkFunction("rastrigin", record_stats=True)
+
+    f(np.zeros(2))
+    f(np.ones(2))
+    f.evaluate_batch(np.zeros((100, 2)))
+
+    assert f.stats.calls == 3
+    assert f.stats.points == 102
+    assert f.stats.total_ns > 0
+    assert f.stats.points_per_second > 0
+    edges, counts = f.stats.histogram()
+    assert counts.sum() == 3
+    assert len(edges) == len(counts) + 1 and np.all(np.diff(edges) > 0)
+
+
+def test_histogram_bins_are_powers_of_two_nanoseconds():
+    stats = EvaluationStats(n_bins=8)
+
+    for elapsed in (0, 1, 3, 4, 1000):
+        stats.record(1, elapsed)
+
+    edges, counts = stats.histogram()
+    assert counts.tolist() == [1, 1, 1, 1, 0, 0, 0, 1]
+    for elapsed, k in ((1, 1), (3, 2), (4, 3)):
+        assert edges[k] * 1e9 <= elapsed < edges[k + 1] * 1e9
+
+
+def test_timed_wrapper_records_every_call():
+    stats = EvaluationStats()
+    func = timed(lambda x: x[0] + x[1], stats)
+
+    assert func([1.0, 2.0]) == 3.0
+    assert stats.summary()["calls"] == stats.summary()["points"] == 1
+
+
+def test_stats_are_disabled_by_default():
+    assert BenchmarkFunction("sphere").stats is None
@@ -0,0 +1,46 @@
+import copy
+import json
+from examples import microbenchmark as mb
+
+TIMING = {"min_time": 1e-4, "repeat": 2}
+
+
+def test_measure_covers_registered_and_scaled_dimensions():
+    results = mb.measure(
+        ["sphere", "eggholder"], dims=(None, 10), sizes=(1, 50), **TIMING
+    )
+
+    assert set(results) == {"sphere/d2", "sphere/d10", "eggholder/d2"}
+    for entry in results.values():
+        assert entry["latency_s"] > 0
+        assert set(entry["throughput"]) == {"1", "50"}
+        assert all(value > 0 for value in entry["throughput"].values())
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold():
+    baseline = mb.measure(["booth"], dims=(None,), sizes=(10,), **TIMING)
+    current = copy.deepcopy(baseline)
+    current["booth/d2"]["latency_s"] *= 1.2
+    current["booth/d2"]["throughput"]["10"] /= 2
+
+    regressions = mb.compare(baseline, current, threshold=0.25)
+
+    assert [(key, metric) for key, metric, *_ in regressions] == [
+        ("booth/d2", "throughput[10]")
+    ]
+    assert regressions[0][-1] == 1.0
+
+
+def test_main_writes_baseline_and_fails_on_regression(tmp_path):
+    output = tmp_path / "baseline.json"
+    args = ["--functions", "matyas", "--dims", "--sizes", "1", "--min-time", "1e-4"]
+
+    assert mb.main(args + ["--output", str(output)]) == 0
+    stored = json.loads(output.read_text())
+    assert set(stored) == {"environment", "results"}
+
+    entry = stored["results"]["matyas/d2"]
+    entry["latency_s"] /= 100
+    entry["throughput"]["1"] *= 100
+    output.write_text(json.dumps(stored))
+    assert mb.main(args + ["--baseline", str(output)]) == 1
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from scipy.optimize import minimize
+from examples.optimizer_benchmark.nelder_mead import multistart_nelder_mead
+from examples.optimizer_benchmark import optimizers as op
+from benchmarks import functions_registry as reg
+
+
+def _starts(name, k, seed=1):
+    bounds = np.array(reg.BOUNDS[name])
+    rng = np.random.default_rng(seed)
+    return rng.uniform(bounds[:, 0], bounds[:, 1], size=(k, len(bounds)))
+
+
+@pytest.mark.parametrize("name", reg.FUNCTIONS)
+def test_each_simplex_follows_scipy_nelder_mead(name):
+    func = reg.FUNCTIONS[name]
+    x0 = _starts(name, 4)
+    bounds = reg.BOUNDS[name]
+    result = multistart_nelder_mead(func, x0, bounds, fatol=1e-6, maxiter=500)
+
+    for k in range(len(x0)):
+        reference = minimize(
+            func,
+            x0[k],
+            method="Nelder-Mead",
+            bounds=bounds,
+            options={"maxiter": 500, "fatol": 1e-6},
+        )
+        if reference.nit >= 500:
+            continue
+        np.testing.assert_array_equal(result.xs[k], reference.x)
+        assert result.funs[k] == reference.fun
+        assert result.converged[k]
+
+
+def test_trial_points_are_evaluated_in_batched_calls():
+    calls = []
+
+    def func(X):
+        calls.append(len(X))
+        return reg.FUNCTIONS["eggholder"](X)
+
+    x0 = _starts("eggholder", 500, seed=0)
+    result = multistart_nelder_mead(func, x0, reg.BOUNDS["eggholder"], fatol=1e-6)
+
+    assert sum(calls) == result.nfev
+    assert len(calls) <= 3 * result.nit + 1
+    assert result.fun <= reg.RESULTS["eggholder"]
+    assert result.converged.all()
+
+
+def test_converged_simplexes_stop_evaluating():
+    x0 = np.array([[0.0, 0.0], [4.0, -3.0]])
+    result = multistart_nelder_mead(reg.FUNCTIONS["sphere"], x0, xatol=1.0, fatol=1.0)
+
+    assert result.nits[0] < result.nits[1]
+    assert result.converged.all()
+
+
+def test_runner_uses_multistart_nelder_mead():
+    record = op.run_task(
+        "holder_table",
+        reg.FUNCTIONS["holder_table"],
+        reg.BOUNDS["holder_table"],
+        reg.RESULTS["holder_table"],
+        "multistart_nelder_mead",
+        0,
+    )
+    assert record["success"]
+    assert record["nfev"] > 100
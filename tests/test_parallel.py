@@ -0,0 +1,83 @@
+import os
+import numpy as np
+import pytest
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.grid import evaluate_grid
+from benchmarks.parallel import ParallelEvaluator
+
+
+def _batch(f, m, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(f.bounds[:, 0], f.bounds[:, 1], size=(m, f.dim))
+
+
+@pytest.mark.parametrize("backend", ["serial", "thread", "process"])
+@pytest.mark.parametrize(
+    "name, dim",
+    [("eggholder", None), ("rastrigin", 7), ("rosenbrock_constrained", None)],
+)
+def test_backends_match_serial_evaluation(backend, name, dim):
+    f = BenchmarkFunction(name, dim=dim)
+    X = _batch(f, 10_007)
+    with ParallelEvaluator(
+        name, dim=dim, workers=3, backend=backend, chunk_size=999
+    ) as p:
+        np.testing.assert_array_equal(p(X), f.evaluate_batch(X))
+        # A smaller batch reuses the pools and shared blocks.
+        np.testing.assert_array_equal(p(X[:50]), f.evaluate_batch(X[:50]))
+
+
+def test_process_backend_writes_into_out_and_grows_blocks():
+    f = BenchmarkFunction("ackley", dim=3, dtype=np.float32)
+    with ParallelEvaluator(f, workers=2, backend="process") as p:
+        small = _batch(f, 100)
+        p(small)
+        X = _batch(f, 5_000, seed=1)
+        out = np.empty(len(X), dtype=np.float32)
+        assert p.evaluate(X, out=out) is out
+        np.testing.assert_array_equal(out, f.evaluate_batch(X))
+
+
+def test_shared_memory_released_on_close():
+    p = ParallelEvaluator("sphere", workers=2, backend="process")
+    p(np.ones((10, 2)))
+    names = [block.name for block in p._blocks.values()]
+    p.close()
+    assert names and not p._blocks
+    if os.path.isdir("/dev/shm"):
+        assert not any(os.path.exists(f"/dev/shm/{name}") for name in names)
+
+
+def test_auto_backend_depends_on_batch_size():
+    p = ParallelEvaluator(
+        "sphere", workers=4, thread_threshold=100, process_threshold=1000
+    )
+    assert p.choose_backend(99) == "serial"
+    assert p.choose_backend(100) == "thread"
+    assert p.choose_backend(1000) == "process"
+    assert ParallelEvaluator("sphere", workers=1).choose_backend(10**9) == "serial"
+
+
+def test_chunks_cover_batch_once():
+    p = ParallelEvaluator("sphere", workers=3, chunk_size=4)
+    chunks = p._chunks(10)
+    assert chunks[0] == (0, 4) and chunks[-1][1] == 10
+    assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+    assert len(ParallelEvaluator("sphere", workers=3)._chunks(10)) == 3
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        ParallelEvaluator("sphere", backend="gpu")
+    with pytest.raises(ValueError):
+        ParallelEvaluator("sphere", chunk_size=0)
+    with pytest.raises(ValueError):
+        ParallelEvaluator("sphere")(np.zeros((3, 2)), out=np.empty(2))
+
+
+def test_grid_through_parallel_evaluator():
+    f = BenchmarkFunction("holder_table")
+    with ParallelEvaluator(f, workers=2, backend="thread", chunk_size=100) as p:
+        _, _, Z = evaluate_grid(p, f.bounds, resolution=50)
+    _, _, expected = evaluate_grid(f, f.bounds, resolution=50)
+    np.testing.assert_array_equal(Z, expected)
@@ -1,6 +1,7 @@
 import numpy as np
 import pytest
 from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.grid import evaluate_grid
 
 
 @pytest.mark.parametrize(
@@ -37,11 +38,7 @@ def test_function_meshgrid_evaluates_correctly(func_name):
 
     assert bounds.shape == (2, 2), f"{func_name} must be 2D for meshgrid test."
 
-    x_vals = np.linspace(bounds[0, 0], bounds[0, 1], 250)
-    y_vals = np.linspace(bounds[1, 0], bounds[1, 1], 250)
-    X, Y = np.meshgrid(x_vals, y_vals)
-
-    Z = np.array([[f(np.array([x, y])) for x in x_vals] for y in y_vals])
+    X, Y, Z = evaluate_grid(f, bounds, resolution=250)
 
     assert Z.shape == X.shape == Y.shape, f"{func_name}: mesh shapes mismatch."
 
@@ -0,0 +1,107 @@
+import tracemalloc
+import numpy as np
+import pytest
+from scipy.optimize import OptimizeResult
+from examples.optimizer_benchmark import adapters
+from examples.optimizer_benchmark import optimizers as op
+from examples.optimizer_benchmark.population import (
+    _partners,
+    cma_es,
+    particle_swarm,
+    vectorized_differential_evolution,
+)
+from benchmarks import functions_registry as reg
+from benchmarks.functions_registry import BenchmarkFunction
+
+POPULATION_METHODS = [particle_swarm, vectorized_differential_evolution, cma_es]
+
+
+@pytest.mark.parametrize("method", POPULATION_METHODS)
+def test_population_method_finds_scalable_optimum(method):
+    f = BenchmarkFunction("rosenbrock", dim=5)
+    result = method(f, f.bounds, seed=0, maxiter=3000)
+
+    assert result.fun == pytest.approx(f.optimum, abs=1e-3)
+    np.testing.assert_allclose(result.x, f.x_opt, atol=0.05)
+
+
+@pytest.mark.parametrize("method", POPULATION_METHODS)
+def test_population_method_evaluates_one_batch_per_generation(method):
+    calls = []
+
+    def func(X):
+        calls.append(X.shape)
+        return reg.FUNCTIONS["holder_table"](X)
+
+    result = method(func, reg.BOUNDS["holder_table"], seed=1, maxiter=50)
+
+    assert len(calls) == result.nit + 1 or len(calls) == result.nit
+    assert sum(shape[0] for shape in calls) == result.nfev
+    assert all(len(shape) == 2 for shape in calls)
+    lower, upper = np.array(reg.BOUNDS["holder_table"]).T
+    assert np.all((lower <= result.x) & (result.x <= upper))
+
+
+@pytest.mark.parametrize("method", POPULATION_METHODS)
+def test_population_method_is_reproducible(method):
+    first = method(reg.FUNCTIONS["eggholder"], reg.BOUNDS["eggholder"], seed=3)
+    second = method(reg.FUNCTIONS["eggholder"], reg.BOUNDS["eggholder"], seed=3)
+    assert first.fun == second.fun and first.nfev == second.nfev
+
+
+def test_de_partners_distinct_from_member_and_each_other():
+    rng = np.random.default_rng(0)
+    members = np.arange(6)
+    counts = np.zeros((6, 6))
+    for _ in range(2000):
+        r1, r2 = _partners(rng, members)
+        assert np.all((r1 != members) & (r2 != members) & (r1 != r2))
+        counts[members, r1] += 1
+    # Every other member is picked about equally often.
+    off_diagonal = counts[~np.eye(6, dtype=bool)]
+    assert np.diag(counts).sum() == 0
+    assert off_diagonal.min() > 0.8 * off_diagonal.mean()
+
+
+def test_de_memory_linear_in_population():
+    f = BenchmarkFunction("sphere", dim=50)
+    size = 15 * 50
+    tracemalloc.start()
+    vectorized_differential_evolution(f, f.bounds, seed=0, maxiter=2)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # A size x size matrix alone would take 15 population arrays.
+    assert peak < 10 * size * 50 * 8
+
+
+def test_registry_drives_the_runner():
+    class RandomSearch(adapters.OptimizerAdapter):
+        name = "random_search"
+        options = {"n_points": 64}
+
+        def minimize(self, func, bounds, seed, settings):
+            lower, upper = np.array(bounds).T
+            rng = np.random.default_rng(seed)
+            X = rng.uniform(lower, upper, size=(self.options["n_points"], len(lower)))
+            values = func.evaluate_batch(X)
+            return OptimizeResult(fun=values.min(), x=X[values.argmin()])
+
+    adapters.register_optimizer(RandomSearch)
+    try:
+        runner = op.SciPyOptimizer(
+            functions={"sphere": reg.FUNCTIONS["sphere"]},
+            bounds=reg.BOUNDS,
+            known_results=reg.RESULTS,
+            optimizers=["random_search", "particle_swarm", "cma_es", "vectorized_de"],
+            n_runs=1,
+        )
+        runner.run()
+    finally:
+        del adapters.OPTIMIZERS["random_search"]
+
+    assert [r["optimizer"] for r in runner.results][0] == "random_search"
+    assert runner.results[0]["nfev"] == 64
+    assert all(r["success"] for r in runner.results[1:])
+
+    with pytest.raises(ValueError):
+        adapters.get_optimizer("random_search")
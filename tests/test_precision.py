@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from benchmarks import precision
+from benchmarks import functions_registry as reg
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.grid import evaluate_grid
+
+
+@pytest.mark.parametrize("func_name", list(reg.FUNCTIONS))
+def test_float32_batch_returns_float32(func_name):
+    f = BenchmarkFunction(func_name, dtype=np.float32)
+    X = precision.sample_points(f, 100, seed=0)
+
+    with np.errstate(over="ignore"):
+        values = f.evaluate_batch(X)
+        out = f.evaluate_batch(X, out=np.empty(len(X), dtype=np.float32))
+
+    assert values.dtype == np.float32
+    np.testing.assert_array_equal(out, values)
+
+
+def test_float32_out_must_match_dtype():
+    f = BenchmarkFunction("rastrigin", dtype=np.float32)
+    with pytest.raises(ValueError):
+        f.evaluate_batch(np.zeros((3, 2)), out=np.empty(3))
+
+
+def test_unsupported_dtype_rejected():
+    with pytest.raises(ValueError):
+        BenchmarkFunction("sphere", dtype=np.int64)
+
+
+def test_validation_flags_unsafe_functions():
+    reports = {r.name: r for r in precision.validate(n_samples=20_000)}
+
+    assert set(reports) == set(reg.FUNCTIONS)
+    assert not reports["cross_in_tray"].safe
+    assert reports["cross_in_tray"].max_rel_error == np.inf
+    assert reports["cross_in_tray"].non_finite > 0
+    assert not reports["goldstein_price"].safe
+    for name in ("sphere", "rosenbrock", "rastrigin", "holder_table"):
+        assert reports[name].safe
+        assert reports[name].max_rel_error < 1e-5
+
+
+def test_validation_of_float64_is_exact():
+    reports = precision.validate(["ackley", "levi"], dtype=np.float64, n_samples=500)
+    assert all(r.safe and r.max_rel_error == 0.0 for r in reports)
+
+
+def test_worst_point_reproduces_reported_error():
+    (report,) = precision.validate(["goldstein_price"], n_samples=5_000, seed=3)
+    x = report.worst_x.astype(np.float32)
+    low = BenchmarkFunction("goldstein_price", dtype=np.float32).evaluate_batch(x[None])
+    high = BenchmarkFunction("goldstein_price").evaluate_batch(x[None])
+
+    error = abs(float(low[0]) - high[0]) / max(abs(high[0]), 1.0)
+    assert error == pytest.approx(report.max_rel_error)
+
+
+def test_sample_points_stay_in_bounds():
+    f = BenchmarkFunction("ackley", dim=5)
+    X = precision.sample_points(f, 1000, seed=1)
+    assert X.shape == (1000, 5)
+    assert np.all((X >= f.bounds[:, 0]) & (X <= f.bounds[:, 1]))
+
+
+def test_float32_grid():
+    f = BenchmarkFunction("rastrigin", dtype=np.float32)
+    _, _, Z = evaluate_grid(f, f.bounds, resolution=64)
+    _, _, Z64 = evaluate_grid(BenchmarkFunction("rastrigin"), f.bounds, resolution=64)
+
+    assert Z.dtype == np.float32
+    np.testing.assert_allclose(Z, Z64, rtol=1e-5, atol=1e-5)
@@ -0,0 +1,124 @@
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+from benchmarks import functions_registry as reg
+from benchmarks import registry
+from benchmarks.functions_registry import BenchmarkFunction
+
+SCALABLE = ["sphere", "rosenbrock", "ackley", "rastrigin", "styblinski_tang"]
+
+
+@pytest.mark.parametrize("func_name", SCALABLE)
+@pytest.mark.parametrize("dim", [3, 10, 500])
+def test_scalable_function_builds_entry_for_dimension(func_name, dim):
+    f = BenchmarkFunction(func_name, dim=dim)
+
+    assert f.dim == dim
+    assert f.bounds.shape == (dim, 2)
+    assert f.x_opt.shape == (dim,)
+    assert np.all(f.bounds[:, 0] <= f.x_opt) and np.all(f.x_opt <= f.bounds[:, 1])
+    assert f(f.x_opt) == pytest.approx(f.optimum, abs=1e-6)
+
+
+@pytest.mark.parametrize("func_name", list(reg.FUNCTIONS.keys()))
+def test_default_dimension_keeps_registered_entry(func_name):
+    f = BenchmarkFunction(func_name)
+
+    assert f.dim == 2
+    assert f.bounds is reg.BOUNDS[func_name]
+    assert f.optimum == reg.RESULTS[func_name]
+    assert BenchmarkFunction(func_name, dim=2).bounds is reg.BOUNDS[func_name]
+
+
+@pytest.mark.parametrize("func_name", list(reg.FUNCTIONS.keys()))
+def test_optimum_location_lies_inside_bounds(func_name):
+    f = BenchmarkFunction(func_name)
+
+    if f.x_opt is not None:
+        assert np.all(f.bounds[:, 0] <= f.x_opt) and np.all(f.x_opt <= f.bounds[:, 1])
+    if func_name == "rosenbrock":
+        assert f.x_opt is None
+        assert BenchmarkFunction(func_name, dim=3).x_opt.tolist() == [1.0] * 3
+
+
+@pytest.mark.parametrize("func_name", ["beale", "eggholder", "simionescu"])
+def test_fixed_dimension_function_refuses_other_dimensions(func_name):
+    with pytest.raises(ValueError):
+        BenchmarkFunction(func_name, dim=3)
+
+
+@pytest.mark.parametrize("dim", [0, 1, 2.5, True])
+def test_invalid_dimensions_are_refused(dim):
+    with pytest.raises(ValueError):
+        BenchmarkFunction("rosenbrock", dim=dim)
+
+
+def test_evaluation_refuses_points_of_wrong_dimension():
+    f = BenchmarkFunction("rastrigin", dim=5)
+
+    with pytest.raises(ValueError):
+        f(np.zeros(4))
+    with pytest.raises(ValueError):
+        f.evaluate_batch(np.zeros((10, 6)))
+    assert f.evaluate_batch(np.zeros((10, 5))).shape == (10,)
+
+
+def test_registry_imports_kernel_modules_on_first_lookup():
+    code = (
+        "import sys\n"
+        "from benchmarks.functions_registry import BenchmarkFunction\n"
+        "loaded = lambda: sorted(m for m in sys.modules if m.startswith('benchmarks.'))\n"
+        "print(loaded())\n"
+        "BenchmarkFunction('sphere')\n"
+        "print(loaded())\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    ).stdout.splitlines()
+
+    assert "benchmarks.classical" not in output[0]
+    assert "benchmarks.gradients" not in output[0]
+    assert "benchmarks.classical" in output[1]
+    assert "benchmarks.geometric" not in output[1]
+
+
+def test_views_read_one_record_per_function():
+    assert list(reg.FUNCTIONS) == list(reg.BOUNDS) == list(reg.RESULTS)
+    assert len(reg.FUNCTIONS) == 23
+    for name in reg.FUNCTIONS:
+        record = registry.get(name)
+        assert reg.FUNCTIONS[name] is record.func
+        assert reg.BOUNDS[name] is record.bounds
+        assert not record.bounds.flags.writeable
+        assert record.dim == 2
+
+
+def test_query_intersects_indexed_fields():
+    assert registry.query(modality="multimodal", scalable=True) == [
+        "ackley",
+        "rastrigin",
+        "styblinski_tang",
+    ]
+    assert registry.query(constrained=True) == [
+        "rosenbrock_constrained",
+        "rosenbrock_constrained_disk",
+    ]
+    assert registry.query() == list(reg.FUNCTIONS)
+    assert registry.query(dim=3) == []
+    with pytest.raises(ValueError):
+        registry.query(separable=True)
+
+
+def test_unknown_function_and_invalid_record_are_refused():
+    with pytest.raises(KeyError):
+        registry.get("does_not_exist")
+    with pytest.raises(ValueError):
+        BenchmarkFunction("does_not_exist")
+    with pytest.raises(ValueError):
+        registry.register(bounds=[[0, 1]], optimum=0.0, modality="smooth")
@@ -0,0 +1,169 @@
+import tracemalloc
+import numpy as np
+import pytest
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.parallel import ParallelEvaluator
+from benchmarks.streaming import evaluate_file, progress_path, read_progress
+
+
+@pytest.fixture
+def samples(tmp_path):
+    X = np.random.default_rng(0).uniform(-10, 10, size=(10_001, 2))
+    path = str(tmp_path / "samples.npy")
+    np.save(path, X)
+    return path, X
+
+
+@pytest.mark.parametrize("name", ["holder_table", "levi", "mishra_bird_constrained"])
+def test_streamed_values_match_batch(samples, tmp_path, name):
+    path, X = samples
+    output = str(tmp_path / "values.npy")
+
+    values = evaluate_file(name, path, output, block_size=1000)
+
+    np.testing.assert_array_equal(
+        np.load(output), BenchmarkFunction(name).evaluate_batch(X)
+    )
+    np.testing.assert_array_equal(values, np.load(output))
+    assert read_progress(output) == {
+        "function": name,
+        "dim": 2,
+        "dtype": "float64",
+        "source": path,
+        "shape": [10_001, 2],
+        "rows": 10_001,
+        "block_size": 1000,
+        "next_block": 11,
+    }
+
+
+def test_interrupted_run_resumes_after_last_saved_block(samples, tmp_path):
+    path, X = samples
+    output = str(tmp_path / "values.npy")
+    f = BenchmarkFunction("eggholder")
+    calls = []
+    fail_at = [4]
+
+    def evaluate(X, out):
+        if len(calls) == fail_at[0]:
+            raise KeyboardInterrupt
+        calls.append(len(X))
+        return f.evaluate_batch(X, out=out)
+
+    with pytest.raises(KeyboardInterrupt):
+        evaluate_file(evaluate, path, output, block_size=1000)
+    assert read_progress(output)["next_block"] == 4
+
+    fail_at[0] = None
+    evaluate_file(evaluate, path, output, block_size=1000)
+    assert sum(calls) == len(X)
+    np.testing.assert_array_equal(np.load(output), f.evaluate_batch(X))
+
+
+def test_explicit_start_block_and_completed_run(samples, tmp_path, monkeypatch):
+    path, X = samples
+    output = str(tmp_path / "values.npy")
+    evaluate_file("booth", path, output, block_size=4096)
+    values = np.load(output, mmap_mode="r+")
+    values[4096:] = 0.0
+    values.flush()
+    del values
+
+    evaluate_file("booth", path, output, block_size=4096, start_block=1)
+    np.testing.assert_array_equal(
+        np.load(output), BenchmarkFunction("booth").evaluate_batch(X)
+    )
+    # Nothing is left to do once every block is saved.
+    monkeypatch.setattr(
+        BenchmarkFunction, "evaluate_batch", lambda *args, **kw: pytest.fail()
+    )
+    evaluate_file("booth", path, output, block_size=4096)
+
+
+def test_resume_with_different_layout_rejected(samples, tmp_path):
+    path, _ = samples
+    output = str(tmp_path / "values.npy")
+    evaluate_file("booth", path, output, block_size=1000, start_block=0)
+    with pytest.raises(ValueError):
+        evaluate_file("booth", path, output, block_size=500)
+    with pytest.raises(ValueError):
+        evaluate_file(
+            "booth", path, output, block_size=1000, start_block=3, dtype=np.float32
+        )
+
+
+def test_fresh_start_overwrites_previous_output(samples, tmp_path):
+    path, X = samples
+    output = str(tmp_path / "values.npy")
+    evaluate_file("booth", path, output, block_size=1000)
+    evaluate_file("sphere", path, output, block_size=2000, start_block=0)
+    np.testing.assert_array_equal(
+        np.load(output), BenchmarkFunction("sphere").evaluate_batch(X)
+    )
+    assert read_progress(output)["block_size"] == 2000
+
+
+def test_memmap_input_and_parallel_evaluator(tmp_path):
+    raw = np.memmap(tmp_path / "raw.bin", dtype=np.float32, mode="w+", shape=(5000, 4))
+    raw[:] = np.random.default_rng(1).uniform(-5, 5, size=raw.shape)
+    output = str(tmp_path / "values.npy")
+    f = BenchmarkFunction("rastrigin", dim=4, dtype=np.float32)
+
+    with ParallelEvaluator(f, workers=2, backend="thread") as evaluator:
+        values = evaluate_file(evaluator, raw, output, block_size=700)
+
+    assert values.dtype == np.float32
+    np.testing.assert_array_equal(values, f.evaluate_batch(raw))
+
+
+def test_peak_memory_bounded_by_block_size(tmp_path):
+    X = np.random.default_rng(2).uniform(-5, 5, size=(400_000, 2))
+    path = str(tmp_path / "samples.npy")
+    np.save(path, X)
+    del X
+
+    tracemalloc.start()
+    evaluate_file(
+        "goldstein_price", path, str(tmp_path / "values.npy"), block_size=5000
+    )
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert peak < 2 * 2**20  # input is 6.4 MB, output 3.2 MB
+
+
+def test_invalid_input(tmp_path):
+    with pytest.raises(ValueError):
+        evaluate_file("sphere", np.zeros(5), str(tmp_path / "v.npy"))
+    with pytest.raises(ValueError):
+        evaluate_file("sphere", np.zeros((5, 2)), str(tmp_path / "v.npy"), block_size=0)
+    assert not (tmp_path / "v.npy.progress").exists()
+    evaluate_file("sphere", np.zeros((0, 2)), str(tmp_path / "v.npy"))
+    assert read_progress(str(tmp_path / "v.npy"))["next_block"] == 0
+    assert progress_path("v.npy") == "v.npy.progress"
+
+
+def test_progress_of_another_run_rejected_unless_restarted(samples, tmp_path):
+    path, X = samples
+    output = str(tmp_path / "values.npy")
+    evaluate_file("booth", path, output, block_size=1000)
+    other = str(tmp_path / "other.npy")
+    np.save(other, X + 1)
+
+    for args, options in [
+        (("matyas", path), {}),
+        (("booth", path), {"dtype": np.float32}),
+        (("booth", other), {}),
+        (("sphere", np.zeros((10_001, 3))), {}),
+        (("booth", X), {}),
+    ]:
+        with pytest.raises(ValueError):
+            evaluate_file(*args, output, block_size=1000, **options)
+    np.testing.assert_array_equal(
+        np.load(output), BenchmarkFunction("booth").evaluate_batch(X)
+    )
+
+    evaluate_file("matyas", path, output, block_size=1000, start_block=0)
+    np.testing.assert_array_equal(
+        np.load(output), BenchmarkFunction("matyas").evaluate_batch(X)
+    )
+    assert read_progress(output)["function"] == "matyas"
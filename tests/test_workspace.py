@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+from benchmarks import registry
+from benchmarks import functions_registry as reg
+from benchmarks.functions_registry import BenchmarkFunction
+from benchmarks.workspace import Workspace
+
+INPLACE = [name for name in reg.FUNCTIONS if registry.get(name).inplace is not None]
+
+
+def _batch(f, m=300, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.uniform(f.bounds[:, 0], f.bounds[:, 1], size=(m, f.dim))
+
+
+def test_inplace_subset():
+    assert set(INPLACE) == {
+        "goldstein_price",
+        "levi",
+        "sphere",
+        "rosenbrock",
+        "ackley",
+        "rastrigin",
+        "styblinski_tang",
+    }
+
+
+@pytest.mark.parametrize("func_name", INPLACE)
+@pytest.mark.parametrize("dim", [None, 3, 17])
+def test_inplace_kernels_match_reference(func_name, dim):
+    try:
+        f = BenchmarkFunction(func_name, dim=dim)
+    except ValueError:
+        pytest.skip("fixed-dimension function")
+    X = _batch(f)
+    out = np.empty(len(X))
+
+    assert f.evaluate_batch(X, out=out) is out
+    np.testing.assert_array_equal(out, f.func(X))
+
+
+@pytest.mark.parametrize("func_name", list(reg.FUNCTIONS))
+def test_out_matches_allocating_call(func_name):
+    f = BenchmarkFunction(func_name)
+    X = _batch(f)
+    out = np.full(len(X), np.nan)
+
+    assert f.evaluate_batch(X, out=out) is out
+    np.testing.assert_array_equal(out, f.evaluate_batch(X))
+
+
+@pytest.mark.parametrize(
+    "out",
+    [np.empty(299), np.empty((300, 1)), np.empty(300, dtype=np.float32), [0.0] * 300],
+)
+def test_invalid_out_rejected(out):
+    f = BenchmarkFunction("sphere")
+    with pytest.raises(ValueError):
+        f.evaluate_batch(_batch(f), out=out)
+
+
+def test_workspace_reused_across_generations():
+    f = BenchmarkFunction("rastrigin", dim=10)
+    X = _batch(f)
+    out = np.empty(len(X))
+    f.evaluate_batch(X, out=out)
+    arrays = {key: id(array) for key, array in f.workspace._arrays.items()}
+    nbytes = f.workspace.nbytes
+
+    for seed in range(1, 5):
+        f.evaluate_batch(_batch(f, seed=seed), out=out)
+
+    assert {key: id(array) for key, array in f.workspace._arrays.items()} == arrays
+    assert f.workspace.nbytes == nbytes > 0
+
+
+def test_workspace_reallocates_on_new_shape():
+    work = Workspace()
+    a = work.array("t", (4, 2))
+    assert work.array("t", (4, 2)) is a
+    assert work.array("t", (5, 2)) is not a
+    assert work.array("t", (5, 2), dtype=np.float32).dtype == np.float32
+    work.clear()
+    assert work.nbytes == 0